@@ -0,0 +1,56 @@
+"""
+Micro-benchmark for the JSON codecs in rice_sdk.codec.
+
+Encodes and decodes node metadata of increasing size the way the SDK does on
+its hot paths (metadata bytes on insert, per-result decode on search).
+
+    python benchmarks/codec_bench.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rice_sdk.codec import get_codec
+
+
+def make_metadata(n_fields: int) -> dict:
+    return {
+        "stored_text": "The user prefers metric units for temperature. " * 4,
+        "source": "conversation",
+        "tags": ["preference", "units", "weather"],
+        "scores": [0.125 * i for i in range(16)],
+        "fields": {
+            f"field_{i}": {"value": i, "label": f"label {i}"} for i in range(n_fields)
+        },
+    }
+
+
+def main():
+    sizes = {"small": 2, "medium": 32, "large": 512}
+    codecs = []
+    for name in ("json", "orjson", "msgspec"):
+        try:
+            codecs.append(get_codec(name))
+        except ImportError:
+            print(f"{name}: not installed, skipped")
+
+    print(
+        f"{'payload':<8} {'bytes':>7} {'codec':<8} {'encode us':>10} {'decode us':>10}"
+    )
+    for label, n_fields in sizes.items():
+        metadata = make_metadata(n_fields)
+        encoded = get_codec("json").dumpb(metadata)
+        number = max(200, 200_000 // len(encoded))
+        for codec in codecs:
+            encode = timeit.timeit(lambda: codec.dumpb(metadata), number=number)
+            decode = timeit.timeit(lambda: codec.loads(encoded), number=number)
+            print(
+                f"{label:<8} {len(encoded):>7} {codec.name:<8} "
+                f"{encode / number * 1e6:>10.2f} {decode / number * 1e6:>10.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
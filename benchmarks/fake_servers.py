@@ -0,0 +1,196 @@
+"""
+In-process stand-ins for RiceDB and Cortex used by the benchmarks.
+
+The gRPC servicers implement the generated `RiceDBServicer`/`CortexServicer`
+interfaces and keep nodes in memory, so every SDK call goes through the real
+stubs, serialization and a loopback socket but no storage engine. The HTTP
+handler answers the same REST endpoints HttpClient uses.
+"""
+import json
+import threading
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+import grpc
+
+from rice_sdk.state.proto import state_pb2, state_pb2_grpc
+from rice_sdk.storage.proto import ricedb_pb2, ricedb_pb2_grpc
+
+
+class NodeStore:
+    """Thread-safe in-memory node table shared by the gRPC and HTTP fakes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._nodes: Dict[int, bytes] = {}
+        self._order: List[int] = []
+
+    def put(self, node_id: int, metadata: bytes) -> int:
+        with self._lock:
+            if node_id not in self._nodes:
+                self._order.append(node_id)
+            self._nodes[node_id] = metadata
+        return node_id
+
+    def top(self, k: int) -> List[Tuple[int, bytes]]:
+        # The first k nodes, cycled when fewer are stored, so results have
+        # the metadata size the caller inserted.
+        with self._lock:
+            if not self._order:
+                return []
+            ids = [self._order[i % len(self._order)] for i in range(k)]
+            return [(node_id, self._nodes[node_id]) for node_id in ids]
+
+    def clear(self):
+        with self._lock:
+            self._nodes.clear()
+            self._order.clear()
+
+
+class FakeRiceDB(ricedb_pb2_grpc.RiceDBServicer):
+    def __init__(self, store: NodeStore):
+        self.store = store
+
+    def Health(self, request, context):
+        return ricedb_pb2.HealthResponse(status="ok", version="fake")
+
+    def Insert(self, request, context):
+        node_id = self.store.put(request.id, request.metadata)
+        return ricedb_pb2.InsertResponse(success=True, nodeId=node_id)
+
+    def BatchInsert(self, request_iterator, context):
+        ids = [self.store.put(r.id, r.metadata) for r in request_iterator]
+        return ricedb_pb2.BatchInsertResponse(count=len(ids), nodeIds=ids)
+
+    def Search(self, request, context):
+        return ricedb_pb2.SearchResponse(
+            results=[
+                ricedb_pb2.SearchResult(
+                    id=node_id, similarity=1.0 / (rank + 1), metadata=metadata
+                )
+                for rank, (node_id, metadata) in enumerate(self.store.top(request.k))
+            ]
+        )
+
+
+class FakeCortex(state_pb2_grpc.CortexServicer):
+    """Answers Reminisce with `limit` traces of `trace_bytes` text each and
+    RunCycle by selecting the highest-scoring candidate."""
+
+    def __init__(self, trace_bytes: int = 256):
+        self.trace_text = "x" * trace_bytes
+
+    def Commit(self, request, context):
+        return state_pb2.Ack(success=True)
+
+    def Reminisce(self, request, context):
+        return state_pb2.RecallResponse(
+            traces=[
+                state_pb2.Trace(
+                    input=request.query_text,
+                    reasoning=self.trace_text,
+                    action="respond",
+                    outcome="ok",
+                    run_id=request.run_id,
+                )
+                for _ in range(request.limit)
+            ]
+        )
+
+    def RunCycle(self, request, context):
+        best = max(request.candidates, key=lambda c: c.score, default=None)
+        response = state_pb2.CycleResponse(cycle_number=1, timestamp="0")
+        if best is not None:
+            response.selected_action.CopyFrom(best)
+            response.action_result.success = True
+            response.action_result.result_json = best.action_json
+        return response
+
+
+def start_grpc_server(store: NodeStore, trace_bytes: int = 256):
+    """Starts RiceDB and Cortex on one loopback port; returns (server, port)."""
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    ricedb_pb2_grpc.add_RiceDBServicer_to_server(FakeRiceDB(store), server)
+    state_pb2_grpc.add_CortexServicer_to_server(FakeCortex(trace_bytes), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, port
+
+
+class _RestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY the body
+    # waits on the client's delayed ACK and every request costs ~40ms.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return body
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+    def _reply(self, data):
+        reply = json.dumps(data).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def do_GET(self):
+        self._reply({"status": "ok", "version": "fake"})
+
+    def do_POST(self):
+        store: NodeStore = self.server.store
+        body = self._read_body()
+        if self.path == "/v1/nodes":
+            node = json.loads(body)
+            metadata = json.dumps(node["metadata"]).encode("utf-8")
+            self._reply({"success": True, "node_id": store.put(node["id"], metadata)})
+        elif self.path == "/v1/nodes/batch":
+            if self.headers.get("Content-Type") == "application/x-ndjson":
+                nodes = [json.loads(line) for line in body.splitlines() if line]
+            else:
+                nodes = json.loads(body)
+            ids = [
+                store.put(n["id"], json.dumps(n["metadata"]).encode("utf-8"))
+                for n in nodes
+            ]
+            self._reply({"count": len(ids), "node_ids": ids})
+        elif self.path == "/v1/search":
+            query = json.loads(body)
+            self._reply(
+                {
+                    "results": [
+                        {
+                            "id": node_id,
+                            "similarity": 1.0 / (rank + 1),
+                            "metadata": json.loads(metadata),
+                        }
+                        for rank, (node_id, metadata) in enumerate(
+                            store.top(query["k"])
+                        )
+                    ]
+                }
+            )
+        else:
+            self.send_error(404)
+
+
+def start_http_server(store: NodeStore):
+    """Starts the REST stand-in on a loopback port; returns (server, port)."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _RestHandler)
+    server.store = store
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, server.server_port
@@ -0,0 +1,102 @@
+"""
+Cold import time of rice_sdk, measured in fresh interpreters.
+
+Each scenario runs `--runs` times in a new `python -c` process and reports
+the fastest and median time (the fastest run is the least disturbed by the
+machine). Scenarios with a budget fail the run when their fastest time
+exceeds it, so an eager import of grpc, requests or numpy is caught.
+
+    python benchmarks/import_bench.py [--runs 20] [--output results.json]
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (name, statement, budget in ms or None). Budgets leave headroom over the
+# stdlib-only cost; loading grpc, requests or numpy alone takes 80-130ms.
+SCENARIOS = [
+    ("import rice_sdk", "import rice_sdk", 15.0),
+    ("Client()", "from rice_sdk import Client; Client()", 75.0),
+    ("RiceDBClient()", "from rice_sdk import RiceDBClient; RiceDBClient()", 75.0),
+    (
+        "grpc transport",
+        "import rice_sdk.storage.client_grpc, rice_sdk.state.client",
+        None,
+    ),
+    ("http transport", "import rice_sdk.storage.client_http", None),
+]
+
+_TIMER = (
+    "import time; started = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - started)"
+)
+
+
+def time_once(statement: str) -> float:
+    out = subprocess.run(
+        [sys.executable, "-c", _TIMER.format(statement=statement)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=ROOT,
+    ).stdout
+    return float(out.strip().splitlines()[-1]) * 1e3
+
+
+def run(name: str, statement: str, budget: Optional[float], runs: int):
+    times = [time_once(statement) for _ in range(runs)]
+    return {
+        "name": name,
+        "statement": statement,
+        "runs": runs,
+        "min_ms": min(times),
+        "median_ms": statistics.median(times),
+        "budget_ms": budget,
+        "within_budget": budget is None or min(times) <= budget,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+
+    results: List[Dict[str, Any]] = []
+    for name, statement, budget in SCENARIOS:
+        result = run(name, statement, budget, args.runs)
+        results.append(result)
+        limit = f"budget {budget:.0f}ms" if budget is not None else ""
+        status = "" if result["within_budget"] else "  OVER BUDGET"
+        print(
+            f"{name:<18} min {result['min_ms']:>7.1f}ms "
+            f"median {result['median_ms']:>7.1f}ms  {limit}{status}",
+            file=sys.stderr,
+        )
+
+    report = {
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    if not all(r["within_budget"] for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
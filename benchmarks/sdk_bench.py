@@ -0,0 +1,329 @@
+"""
+End-to-end SDK benchmark against in-process fake RiceDB and Cortex servers.
+
+Measures throughput and p50/p99 latency of insert, batch_insert, search,
+reminisce and run_cycle across payload sizes, k values, transports (gRPC and
+HTTP) and sync vs async clients. Nothing leaves the machine, so numbers track
+SDK overhead (serialization, codec, stubs, retries) rather than the server.
+Results are written as JSON for trend tracking.
+
+    python benchmarks/sdk_bench.py [--quick] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import grpc
+from google import protobuf
+
+from codec_bench import make_metadata
+from fake_servers import NodeStore, start_grpc_server, start_http_server
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.client_async import AsyncStateClient
+from rice_sdk.storage.client import RiceDBClient
+from rice_sdk.storage.client_async import AsyncRiceDBClient
+
+SCHEMA_VERSION = 1
+PAYLOADS = {"small": 2, "medium": 32, "large": 512}
+K_VALUES = (1, 10, 100)
+RECALL_LIMITS = (1, 10, 100)
+CANDIDATE_COUNTS = (1, 10)
+SEARCH_NODES = 100
+BATCH_ITEMS = 200
+BATCH_CHUNK = 100
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    index = min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def summarize(
+    name: str, params: Dict[str, Any], latencies: List[float], items: int = 1
+) -> Dict[str, Any]:
+    ordered = sorted(latencies)
+    elapsed = sum(latencies)
+    return {
+        "name": name,
+        "params": params,
+        "ops": len(latencies),
+        "seconds": elapsed,
+        "ops_per_sec": len(latencies) / elapsed,
+        "items_per_sec": len(latencies) * items / elapsed,
+        "mean_ms": elapsed / len(latencies) * 1e3,
+        "p50_ms": percentile(ordered, 0.50) * 1e3,
+        "p99_ms": percentile(ordered, 0.99) * 1e3,
+    }
+
+
+def measure(fn: Callable[[int], Any], iterations: int, warmup: int) -> List[float]:
+    for i in range(warmup):
+        fn(-1 - i)
+    latencies = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        fn(i)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+async def measure_async(
+    fn: Callable[[int], Awaitable], iterations: int, warmup: int
+) -> List[float]:
+    for i in range(warmup):
+        await fn(-1 - i)
+    latencies = []
+    for i in range(iterations):
+        started = time.perf_counter()
+        await fn(i)
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+class Suite:
+    def __init__(self, iterations: int, warmup: int):
+        self.iterations = iterations
+        self.warmup = warmup
+        self.batch_iterations = max(3, iterations // 10)
+        self.results: List[Dict[str, Any]] = []
+
+    def add(self, name: str, params: Dict[str, Any], latencies, items: int = 1):
+        result = summarize(name, params, latencies, items)
+        self.results.append(result)
+        print(
+            f"{name:<44} {result['ops_per_sec']:>10.0f}/s "
+            f"p50 {result['p50_ms']:>8.3f}ms p99 {result['p99_ms']:>8.3f}ms",
+            file=sys.stderr,
+        )
+
+
+def batch_items(metadata: Dict[str, Any], base: int) -> List[Dict[str, Any]]:
+    return [
+        {"nodeId": base + i, "text": "batch", "metadata": metadata}
+        for i in range(BATCH_ITEMS)
+    ]
+
+
+def storage_sync(suite: Suite, store: NodeStore, transport: str, ports: Tuple):
+    client = RiceDBClient(
+        "127.0.0.1", transport=transport, grpc_port=ports[0], http_port=ports[1]
+    )
+    client.connect()
+    for label, n_fields in PAYLOADS.items():
+        metadata = make_metadata(n_fields)
+        params = {"transport": transport, "mode": "sync", "payload": label}
+        store.clear()
+        suite.add(
+            f"storage.insert.{transport}.sync.{label}",
+            params,
+            measure(
+                lambda i: client.insert(i, "text", metadata),
+                suite.iterations,
+                suite.warmup,
+            ),
+        )
+        suite.add(
+            f"storage.batch_insert.{transport}.sync.{label}",
+            {**params, "items": BATCH_ITEMS, "chunk_size": BATCH_CHUNK},
+            measure(
+                lambda i: client.batch_insert(
+                    batch_items(metadata, i * BATCH_ITEMS), chunk_size=BATCH_CHUNK
+                ),
+                suite.batch_iterations,
+                1,
+            ),
+            BATCH_ITEMS,
+        )
+        store.clear()
+        for i in range(SEARCH_NODES):
+            client.insert(i, "text", metadata)
+        for k in K_VALUES:
+            suite.add(
+                f"storage.search.{transport}.sync.{label}.k{k}",
+                {**params, "k": k},
+                measure(
+                    lambda i: client.search("query", k=k),
+                    suite.iterations,
+                    suite.warmup,
+                ),
+            )
+    client.disconnect()
+
+
+async def storage_async(suite: Suite, store: NodeStore, port: int):
+    client = AsyncRiceDBClient("127.0.0.1", grpc_port=port)
+    await client.connect()
+    for label, n_fields in PAYLOADS.items():
+        metadata = make_metadata(n_fields)
+        params = {"transport": "grpc", "mode": "async", "payload": label}
+        store.clear()
+        suite.add(
+            f"storage.insert.grpc.async.{label}",
+            params,
+            await measure_async(
+                lambda i: client.insert(i, "text", metadata),
+                suite.iterations,
+                suite.warmup,
+            ),
+        )
+        suite.add(
+            f"storage.batch_insert.grpc.async.{label}",
+            {**params, "items": BATCH_ITEMS, "chunk_size": BATCH_CHUNK},
+            await measure_async(
+                lambda i: client.batch_insert(
+                    batch_items(metadata, i * BATCH_ITEMS), chunk_size=BATCH_CHUNK
+                ),
+                suite.batch_iterations,
+                1,
+            ),
+            BATCH_ITEMS,
+        )
+        store.clear()
+        for i in range(SEARCH_NODES):
+            await client.insert(i, "text", metadata)
+        for k in K_VALUES:
+            suite.add(
+                f"storage.search.grpc.async.{label}.k{k}",
+                {**params, "k": k},
+                await measure_async(
+                    lambda i: client.search("query", k=k),
+                    suite.iterations,
+                    suite.warmup,
+                ),
+            )
+    await client.disconnect()
+
+
+def candidates(n: int) -> List[Dict[str, Any]]:
+    return [
+        {"actionType": "tool", "action": {"name": f"tool_{i}"}, "score": i / n}
+        for i in range(n)
+    ]
+
+
+def state_sync(suite: Suite, port: int):
+    client = StateClient(f"127.0.0.1:{port}", run_id="bench")
+    params = {"transport": "grpc", "mode": "sync"}
+    for limit in RECALL_LIMITS:
+        suite.add(
+            f"state.reminisce.grpc.sync.limit{limit}",
+            {**params, "limit": limit},
+            measure(
+                lambda i: client.reminisce("query", limit=limit),
+                suite.iterations,
+                suite.warmup,
+            ),
+        )
+    for n in CANDIDATE_COUNTS:
+        options = candidates(n)
+        suite.add(
+            f"state.run_cycle.grpc.sync.candidates{n}",
+            {**params, "candidates": n},
+            measure(
+                lambda i: client.run_cycle("agent", options),
+                suite.iterations,
+                suite.warmup,
+            ),
+        )
+    client.close()
+
+
+async def state_async(suite: Suite, port: int):
+    client = AsyncStateClient(f"127.0.0.1:{port}", run_id="bench")
+    params = {"transport": "grpc", "mode": "async"}
+    for limit in RECALL_LIMITS:
+        suite.add(
+            f"state.reminisce.grpc.async.limit{limit}",
+            {**params, "limit": limit},
+            await measure_async(
+                lambda i: client.reminisce("query", limit=limit),
+                suite.iterations,
+                suite.warmup,
+            ),
+        )
+    for n in CANDIDATE_COUNTS:
+        options = candidates(n)
+        suite.add(
+            f"state.run_cycle.grpc.async.candidates{n}",
+            {**params, "candidates": n},
+            await measure_async(
+                lambda i: client.run_cycle("agent", options),
+                suite.iterations,
+                suite.warmup,
+            ),
+        )
+    await client.close()
+
+
+def environment(args) -> Dict[str, Any]:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except OSError:
+        commit = ""
+    return {
+        "schema": SCHEMA_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "commit": commit or None,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "grpc": grpc.__version__,
+        "protobuf": protobuf.__version__,
+        "iterations": args.iterations,
+        "warmup": args.warmup,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--quick", action="store_true", help="50 iterations, 5 warmup (smoke run)"
+    )
+    parser.add_argument("--output", help="write JSON here instead of stdout")
+    args = parser.parse_args()
+    if args.quick:
+        args.iterations, args.warmup = 50, 5
+
+    store = NodeStore()
+    grpc_server, grpc_port = start_grpc_server(store)
+    http_server, http_port = start_http_server(store)
+    suite = Suite(args.iterations, args.warmup)
+    try:
+        for transport in ("grpc", "http"):
+            storage_sync(suite, store, transport, (grpc_port, http_port))
+        asyncio.run(storage_async(suite, store, grpc_port))
+        state_sync(suite, grpc_port)
+        asyncio.run(state_async(suite, grpc_port))
+    finally:
+        grpc_server.stop(None)
+        http_server.shutdown()
+        http_server.server_close()
+
+    report = {"environment": environment(args), "results": suite.results}
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -34,7 +34,7 @@ async def main():
         # Search
         print("Searching...")
         search_results = client.storage.search("Hello", user_id=1)
-        print("Search Results:", search_results)
+        print("Search Results:", search_results.to_dicts())
 
         # Attempt state access (should fail if not enabled, but here config likely enables it)
         # The node example expects failure if state disabled.
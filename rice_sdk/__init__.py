@@ -1,4 +1,36 @@
-from .client import Client
-from .config import RiceConfig
-from .storage.client import RiceDBClient
-from .state.client import StateClient
+from typing import TYPE_CHECKING
+from .lazy import lazy_exports
+
+# Everything is imported on first access so `import rice_sdk` stays cheap;
+# grpc, requests and the generated protobuf modules load only when a client
+# that needs them is used.
+_EXPORTS = {
+    "Client": ".client",
+    "RiceConfig": ".config",
+    "RiceDBClient": ".storage.client",
+    "AsyncRiceDBClient": ".storage.client_async",
+    "StateClient": ".state.client",
+    "AsyncStateClient": ".state.client_async",
+    "RetryPolicy": ".retry",
+    "NO_RETRY": ".retry",
+    "Deadlines": ".deadline",
+    "budget": ".deadline",
+    "Metrics": ".metrics",
+    "CallFuture": ".futures",
+    "gather": ".futures",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .config import RiceConfig
+    from .storage.client import RiceDBClient
+    from .storage.client_async import AsyncRiceDBClient
+    from .state.client import StateClient
+    from .state.client_async import AsyncStateClient
+    from .retry import RetryPolicy, NO_RETRY
+    from .deadline import Deadlines, budget
+    from .metrics import Metrics
+    from .futures import CallFuture, gather
@@ -0,0 +1,57 @@
+import threading
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    import grpc
+
+
+class SharedChannel:
+    """
+    Reference-counted gRPC channel shared by several clients.
+    The channel is created on the first `acquire` and closed when the last
+    holder calls `release`; acquiring again afterwards opens a new one.
+    """
+
+    def __init__(self, target: str, options: Optional[List[Tuple[str, int]]] = None):
+        self.target = target
+        self.options = options or []
+        self._lock = threading.Lock()
+        self._channel: Optional["grpc.Channel"] = None
+        self._refs = 0
+
+    @property
+    def refs(self) -> int:
+        return self._refs
+
+    def acquire(self) -> "grpc.Channel":
+        import grpc
+
+        with self._lock:
+            if self._channel is None:
+                self._channel = grpc.insecure_channel(self.target, options=self.options)
+            self._refs += 1
+            return self._channel
+
+    def release(self):
+        with self._lock:
+            if self._refs == 0:
+                return
+            self._refs -= 1
+            if self._refs == 0:
+                self._channel.close()
+                self._channel = None
+
+
+def same_target(a: str, b: str) -> bool:
+    """True when two host:port targets name the same endpoint."""
+    return _normalize(a) == _normalize(b)
+
+
+def _normalize(target: str) -> str:
+    host, _, port = target.strip().rpartition(":")
+    if not host:
+        host, port = port, ""
+    host = host.lower()
+    if host in ("127.0.0.1", "::1", "[::1]"):
+        host = "localhost"
+    return f"{host}:{port}"
@@ -1,40 +1,93 @@
 import os
 import sys
-from typing import Optional, Dict, Any, Union
-from dotenv import load_dotenv
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
+from .channel import SharedChannel, same_target
 from .config import load_config, RiceConfig
+from .deadline import Deadlines, budget
+from .lazy import lazy_exports
+from .metrics import Metrics
+from .retry import RetryPolicy
 from .storage.client import RiceDBClient
-from .state.client import StateClient
+from .state.cache import VariableCache
+from .state.write_behind import WriteBehind
+
+if TYPE_CHECKING:
+    import grpc
+
+    from .state.client import StateClient
+
+# StateClient pulls in grpc and the generated protobuf modules, so it is only
+# imported when state is first connected. It is looked up on the module so
+# it can still be patched as `rice_sdk.client.StateClient`.
+__getattr__, __dir__ = lazy_exports(__name__, {"StateClient": ".state.client"})
+_module = sys.modules[__name__]
 
 
 class Client:
     """
     Unified Client to access both Storage and State services.
+    When storage and state point at the same gRPC target they share one channel.
     """
 
-    def __init__(self, config_path: Optional[str] = None, run_id: Optional[str] = None):
+    def __init__(
+        self,
+        config_path: Optional[str] = None,
+        run_id: Optional[str] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        metrics: Optional[Metrics] = None,
+        write_behind: Optional[WriteBehind] = None,
+        variable_cache: Optional[VariableCache] = None,
+    ):
         self.config_path = config_path
         self._options_run_id = run_id
+        # Shared by both services, so `retry_policy.stats` and `metrics` cover
+        # every call.
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.metrics = metrics
+        self.write_behind = write_behind
+        self.variable_cache = variable_cache
         self._config: Optional[RiceConfig] = None
         self._storage: Optional[RiceDBClient] = None
-        self._state: Optional[StateClient] = None
+        self._state: Optional["StateClient"] = None
+        self._channel: Optional[SharedChannel] = None
+        self._storage_settings: Optional[Dict[str, Any]] = None
+        self._state_settings: Optional[Dict[str, Any]] = None
+        self._storage_lock = threading.Lock()
+        self._state_lock = threading.Lock()
+
+    def connect(self, lazy: bool = False):
+        """
+        Connects the enabled services. Storage and state are connected
+        concurrently; with `lazy=True` nothing is contacted here and each service
+        connects the first time `storage` or `state` is used. Connecting again
+        closes what the previous connect opened.
+        """
+        from dotenv import load_dotenv
+
+        self.close()
 
-    def connect(self):
         # Load environment variables
         load_dotenv(os.path.join(os.getcwd(), ".env"))
 
         # Load config
         self._config = load_config(self.config_path)
 
+        storage_url = (
+            os.environ.get("STORAGE_INSTANCE_URL")
+            or os.environ.get("RICEDB_HOST")
+            or "localhost:50051"
+        )
+        state_address = os.environ.get("STATE_INSTANCE_URL") or "localhost:50051"
+        self._storage_settings = None
+        self._state_settings = None
+
         # Initialize Storage
         if self._config.storage.enabled:
-            storage_url = (
-                os.environ.get("STORAGE_INSTANCE_URL")
-                or os.environ.get("RICEDB_HOST")
-                or "localhost:50051"
-            )
-
             host = "localhost"
             port = 50051
 
@@ -48,16 +101,76 @@ class Client:
             else:
                 host = storage_url
 
-            token = os.environ.get("STORAGE_AUTH_TOKEN")
-            user = os.environ.get("STORAGE_USER") or "admin"
-
             http_port_str = os.environ.get("STORAGE_HTTP_PORT")
-            http_port = int(http_port_str) if http_port_str else 3000
+
+            if self._config.state.enabled and same_target(
+                f"{host}:{port}", state_address
+            ):
+                from .storage.client_grpc import CHANNEL_OPTIONS
+
+                self._channel = SharedChannel(f"{host}:{port}", CHANNEL_OPTIONS)
+
+            self._storage_settings = {
+                "host": host,
+                "port": port,
+                "http_port": int(http_port_str) if http_port_str else 3000,
+                "token": os.environ.get("STORAGE_AUTH_TOKEN"),
+                "user": os.environ.get("STORAGE_USER") or "admin",
+            }
+
+        # Initialize State
+        if self._config.state.enabled:
+            self._state_settings = {
+                "address": state_address,
+                "token": os.environ.get("STATE_AUTH_TOKEN"),
+                "run_id": self._options_run_id
+                or os.environ.get("STATE_RUN_ID")
+                or "default",
+            }
+
+        if lazy:
+            return
+
+        if self._storage_settings and self._state_settings:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                storage = pool.submit(self._connect_storage)
+                state = pool.submit(self._connect_state, True)
+            try:
+                storage.result()
+                state.result()
+            except Exception:
+                # Do not leave the service that did connect holding the channel.
+                self.close()
+                raise
+        elif self._storage_settings:
+            self._connect_storage()
+        elif self._state_settings:
+            self._connect_state(True)
+
+    def _connect_storage(self) -> RiceDBClient:
+        with self._storage_lock:
+            if self._storage:
+                return self._storage
+            settings = self._storage_settings
+            token = settings["token"]
+            user = settings["user"]
 
             # Pass token to constructor initially
-            self._storage = RiceDBClient(host, "auto", port, http_port, token)
+            storage = RiceDBClient(
+                settings["host"],
+                "auto",
+                settings["port"],
+                settings["http_port"],
+                token,
+                shared_channel=self._channel,
+                retry_policy=self.retry_policy,
+                deadlines=self.deadlines,
+                metrics=self.metrics,
+            )
             try:
-                self._storage.connect()
+                storage.connect()
             except Exception as e:
                 # Log warning but continue? Node SDK does await connect() and fails if error?
                 # Node SDK code: `await this._storage.connect();` so it throws if fails.
@@ -68,23 +181,125 @@ class Client:
                 try:
                     # Attempt auto-login using the token as password
                     # In Node SDK: `const newToken = await this._storage.login(user, token);`
-                    self._storage.login(user, token)
+                    storage.login(user, token)
                 except Exception as e:
                     # Warn but don't crash
                     print(f"Auto-login failed for user {user}: {e}")
 
-        # Initialize State
-        if self._config.state.enabled:
-            address = os.environ.get("STATE_INSTANCE_URL") or "localhost:50051"
-            token = os.environ.get("STATE_AUTH_TOKEN")
-            run_id = self._options_run_id or os.environ.get("STATE_RUN_ID") or "default"
+            self._storage = storage
+            return storage
+
+    def _connect_state(self, start_connecting: bool = False) -> "StateClient":
+        with self._state_lock:
+            if self._state:
+                return self._state
+            settings = self._state_settings
+            state = _module.StateClient(
+                settings["address"],
+                settings["token"],
+                settings["run_id"],
+                shared_channel=self._channel,
+                retry_policy=self.retry_policy,
+                deadlines=self.deadlines,
+                metrics=self.metrics,
+                write_behind=self.write_behind,
+                variable_cache=self.variable_cache,
+            )
+            # gRPC channels connect on first call; eager mode starts it now so it
+            # overlaps with the storage health check.
+            if start_connecting:
+                state.start_connecting()
+            self._state = state
+            return state
+
+    def wait_ready(self, timeout: Optional[float] = None):
+        """
+        Blocks until every enabled service is ready. Lazy services are only
+        connected once their channel answers, and within what is left of
+        `timeout`, so a missing server raises TimeoutError after `timeout`
+        seconds in total.
+        """
+        import grpc
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        def remaining() -> Optional[float]:
+            if deadline is None:
+                return None
+            return max(0.0, deadline - time.monotonic())
+
+        connecting_storage = bool(self._storage_settings) and not self._storage
+        connecting_state = bool(self._state_settings) and not self._state
+        # Probe channels stay open until the services are connected, so a
+        # shared channel is not closed and reopened in between.
+        releases = []
+        try:
+            for target in self._pending_targets():
+                channel, release = self._probe_channel(target)
+                releases.append(release)
+                ready = grpc.channel_ready_future(channel)
+                try:
+                    ready.result(timeout=remaining())
+                except grpc.FutureTimeoutError:
+                    ready.cancel()
+                    raise TimeoutError(f"{target} not ready after {timeout}s")
+            with budget(remaining()):
+                if connecting_storage:
+                    self._connect_storage()
+                if connecting_state:
+                    self._connect_state()
+        finally:
+            for release in releases:
+                release()
+
+        # Every channel is waited on once: a second channel_ready_future keeps
+        # grpc's connectivity poller going, and it fails with "Channel closed!"
+        # if the channel is closed right after. Storage connected above passed
+        # its health check, and a shared channel was just probed.
+        if self._state_settings and not (
+            connecting_state and self._state.shared_channel
+        ):
+            self._state.wait_ready(remaining())
+        if self._storage_settings and not connecting_storage:
+            if not (self._storage.shared_channel and self._state_settings):
+                self._storage.wait_ready(remaining())
+
+    def _pending_targets(self) -> List[str]:
+        """gRPC targets of enabled services that are not connected yet, once each."""
+        targets: List[str] = []
+        if self._storage_settings and not self._storage:
+            settings = self._storage_settings
+            targets.append(f"{settings['host']}:{settings['port']}")
+        if self._state_settings and not self._state:
+            address = self._state_settings["address"]
+            if not any(same_target(address, target) for target in targets):
+                targets.append(address)
+        return targets
+
+    def _probe_channel(self, target: str) -> Tuple["grpc.Channel", Callable[[], None]]:
+        if self._channel is not None and same_target(target, self._channel.target):
+            return self._channel.acquire(), self._channel.release
+
+        import grpc
+        from .storage.client_grpc import CHANNEL_OPTIONS
+
+        channel = grpc.insecure_channel(target, options=CHANNEL_OPTIONS)
+        return channel, channel.close
 
-            self._state = StateClient(address, token, run_id)
-            # State client connects on first call typically in gRPC,
-            # but we created the stub in __init__ which is fine.
+    def close(self):
+        """Disconnects both services; a shared channel is closed once, by its last user."""
+        if self._storage:
+            self._storage.disconnect()
+            self._storage = None
+        if self._state:
+            self._state.close()
+            self._state = None
+        self._channel = None
 
     @property
     def storage(self) -> RiceDBClient:
+        if not self._storage and self._storage_settings:
+            self._connect_storage()
         if not self._storage:
             raise RuntimeError(
                 "Config mismatch: storage is not enabled or not connected"
@@ -92,7 +307,9 @@ class Client:
         return self._storage
 
     @property
-    def state(self) -> StateClient:
+    def state(self) -> "StateClient":
+        if not self._state and self._state_settings:
+            self._connect_state()
         if not self._state:
             raise RuntimeError("Config mismatch: state is not enabled or not connected")
         return self._state
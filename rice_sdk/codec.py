@@ -0,0 +1,95 @@
+import json
+from typing import Any, Optional, Union
+
+
+class JsonCodec:
+    """
+    JSON encoder/decoder used for metadata, filters and state payloads.
+    `loads` accepts str or bytes and raises ValueError on malformed input.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj)
+
+    def dumpb(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        import orjson
+
+        self._orjson = orjson
+        # Match stdlib behaviour for int keys; serialize NumPy arrays natively.
+        self._option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(self, obj: Any) -> str:
+        return self._orjson.dumps(obj, option=self._option).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._option)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        import msgspec
+
+        self._error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode("utf-8")
+
+    def dumpb(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._error as e:
+            raise ValueError(str(e)) from e
+
+
+_CODECS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "json": JsonCodec,
+}
+_AUTO_ORDER = ("orjson", "msgspec", "json")
+_default: Optional[JsonCodec] = None
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = None) -> JsonCodec:
+    """
+    Resolves a codec argument: an instance is returned as is, a name selects that
+    implementation, and None or "auto" picks the fastest installed library
+    (orjson, then msgspec, then the stdlib json module).
+    """
+    global _default
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "auto":
+        if _default is None:
+            for name in _AUTO_ORDER:
+                try:
+                    _default = _CODECS[name]()
+                    break
+                except ImportError:
+                    continue
+        return _default
+    if codec not in _CODECS:
+        raise ValueError(f"Unknown codec: {codec}")
+    return _CODECS[codec]()
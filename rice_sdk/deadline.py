@@ -0,0 +1,98 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+READ_METHODS = frozenset(
+    {
+        "Health",
+        "Search",
+        "GetNode",
+        "Drift",
+        "Reminisce",
+        "GetVariable",
+        "ListVariables",
+        "ListConcepts",
+        "ListGoals",
+        "GetActionLog",
+        "GetCycleHistory",
+    }
+)
+ADMIN_METHODS = frozenset({"Login", "DefineConcept", "DeleteRun"})
+
+# Absolute time.monotonic() value by which the current block must finish.
+_deadline: ContextVar[Optional[float]] = ContextVar("rice_sdk_deadline", default=None)
+
+
+class Deadlines:
+    """
+    Default per-call timeouts in seconds for read, write and admin methods.
+    `overrides` maps individual method names (e.g. "Search") to their own
+    timeout. A value of None means the call has no deadline.
+    """
+
+    def __init__(
+        self,
+        read: Optional[float] = 10.0,
+        write: Optional[float] = 30.0,
+        admin: Optional[float] = 60.0,
+        overrides: Optional[Dict[str, Optional[float]]] = None,
+    ):
+        self.read = read
+        self.write = write
+        self.admin = admin
+        self.overrides = dict(overrides or {})
+
+    def for_method(self, method: str) -> Optional[float]:
+        if method in self.overrides:
+            return self.overrides[method]
+        if method in READ_METHODS:
+            return self.read
+        if method in ADMIN_METHODS:
+            return self.admin
+        return self.write
+
+    def resolve(self, method: str, timeout: Optional[float] = None) -> Optional[float]:
+        """The per-call `timeout` if given, else the default for `method`."""
+        return timeout if timeout is not None else self.for_method(method)
+
+
+@contextmanager
+def budget(seconds: Optional[float]) -> Iterator[None]:
+    """
+    Gives every call made inside the block one shared deadline `seconds` from
+    now, so a sequence of calls in one agent turn cannot exceed it. Nested
+    budgets never extend an outer one; `None` leaves the current budget as is.
+
+        with budget(2.0):
+            hits = client.storage.search("weather")
+            client.state.focus(hits[0]["metadata"]["stored_text"])
+    """
+    if seconds is None:
+        yield
+        return
+    deadline = time.monotonic() + seconds
+    outer = _deadline.get()
+    if outer is not None and outer < deadline:
+        deadline = outer
+    token = _deadline.set(deadline)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_budget() -> Optional[float]:
+    """Seconds left in the current budget, or None outside any budget."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def call_timeout() -> Optional[float]:
+    """Timeout for the next call; raises TimeoutError once the budget is spent."""
+    left = remaining_budget()
+    if left is not None and left <= 0:
+        raise TimeoutError("Deadline exceeded before the call was sent")
+    return left
@@ -0,0 +1,203 @@
+import contextvars
+import functools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, FrozenSet, Iterable, List, Optional
+from .metrics import Metrics
+
+_submitting: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "rice_submitting", default=False
+)
+
+
+def submitting() -> bool:
+    """True while a client method runs on behalf of its `submit` view."""
+    return _submitting.get()
+
+
+def _identity(response: Any) -> Any:
+    return response
+
+
+class CallFuture:
+    """
+    A call started without waiting for its response, as returned by a
+    client's `submit` view. `result()` waits for the response and maps it the
+    way the blocking method would; errors of the call, including running out
+    of its deadline, are raised from `result()`. Submitted calls are not
+    retried or hedged.
+    """
+
+    _PENDING = object()
+
+    def __init__(self, future: Any, mapper: Callable[[Any], Any] = _identity):
+        # `future` is a grpc.Future or a concurrent.futures.Future.
+        self._future = future
+        self._mapper = mapper
+        self._done = threading.Event()
+        self._lock = threading.Lock()
+        self._value: Any = self._PENDING
+        self._error: Optional[BaseException] = None
+        future.add_done_callback(lambda _: self._done.set())
+
+    @classmethod
+    def resolved(cls, value: Any) -> "CallFuture":
+        """A future that is already done with `value`, for calls served locally."""
+        future: Future = Future()
+        future.set_result(value)
+        return cls(future)
+
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def cancel(self) -> bool:
+        return self._future.cancel()
+
+    def cancelled(self) -> bool:
+        return self._future.cancelled()
+
+    def add_done_callback(self, fn: Callable[["CallFuture"], Any]):
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """The mapped response; raises TimeoutError if it is not done after `timeout` seconds."""
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Call not done after {timeout}s")
+        with self._lock:
+            if self._value is self._PENDING and self._error is None:
+                try:
+                    self._value = self._mapper(self._future.result())
+                except BaseException as e:
+                    self._error = e
+        if self._error is not None:
+            raise self._error
+        return self._value
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        if not self._done.wait(timeout):
+            raise TimeoutError(f"Call not done after {timeout}s")
+        try:
+            self.result()
+        except BaseException as e:
+            return e
+        return None
+
+
+def gather(
+    *futures: CallFuture,
+    timeout: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """
+    Waits for every future and returns their results in order. `timeout`
+    bounds the whole wait. A failed call raises its error, or takes its place
+    in the list with `return_exceptions=True`; calls still running when
+    `timeout` expires raise TimeoutError either way.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    results = []
+    for future in futures:
+        remaining = None
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+        if not return_exceptions:
+            results.append(future.result(remaining))
+            continue
+        error = future.exception(remaining)
+        results.append(error if error is not None else future.result())
+    return results
+
+
+def start_call(
+    start: Callable[[], Any],
+    method: str,
+    request: Any,
+    metrics: Optional[Metrics] = None,
+) -> Any:
+    """
+    Calls `start()`, which returns the stub's `.future()` for `request`, and
+    records the call in `metrics` once it completes. An error raised while
+    starting is returned as a failed future.
+    """
+    started = time.perf_counter()
+    try:
+        future = start()
+    except Exception as e:
+        future = Future()
+        future.set_exception(e)
+    if metrics is not None:
+
+        def record(done: Any):
+            error = _outcome_error(done)
+            metrics.record_call(
+                method,
+                time.perf_counter() - started,
+                error,
+                request.ByteSize(),
+                done.result().ByteSize() if error is None else 0,
+            )
+
+        future.add_done_callback(record)
+    return future
+
+
+def settle(futures: List[Any]) -> Future:
+    """A future of the responses, or errors, of `futures` once all are done."""
+    combined: Future = Future()
+    remaining = [len(futures)]
+    lock = threading.Lock()
+
+    def finish(_):
+        with lock:
+            remaining[0] -= 1
+            if remaining[0]:
+                return
+        combined.set_result([_outcome_error(f) or f.result() for f in futures])
+
+    if not futures:
+        combined.set_result([])
+    for future in futures:
+        future.add_done_callback(finish)
+    return combined
+
+
+def _outcome_error(future: Any) -> Optional[BaseException]:
+    try:
+        return future.exception()
+    except BaseException as e:
+        # Cancelled futures raise from exception().
+        return e
+
+
+class Submitter:
+    """
+    `client.submit.<method>(...)` starts the call and returns a CallFuture
+    instead of waiting for the response, so several calls can be in flight
+    from one thread. Use `gather` to wait for a group of them.
+    """
+
+    def __init__(self, client: Any, methods: FrozenSet[str]):
+        self._client = client
+        self._methods = methods
+
+    def __getattr__(self, name: str) -> Callable[..., CallFuture]:
+        if name not in self._methods:
+            raise AttributeError(f"{name!r} cannot be submitted")
+        method = getattr(self._client, name)
+
+        @functools.wraps(method)
+        def submit(*args, **kwargs) -> CallFuture:
+            token = _submitting.set(True)
+            try:
+                result = method(*args, **kwargs)
+            finally:
+                _submitting.reset(token)
+            if isinstance(result, CallFuture):
+                return result
+            return CallFuture.resolved(result)
+
+        return submit
+
+    def __dir__(self) -> Iterable[str]:
+        return sorted(self._methods)
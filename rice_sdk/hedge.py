@@ -0,0 +1,152 @@
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Iterable, List
+from typing import Optional
+from .histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    import asyncio
+
+HEDGED_METHODS = frozenset({"Search", "Reminisce"})
+# Channel option for the backup channel: its own subchannel pool, so the
+# duplicate request travels over a different connection than the original.
+HEDGE_CHANNEL_OPTION = ("grpc.use_local_subchannel_pool", 1)
+
+
+class HedgePolicy:
+    """
+    Tail-latency hedging for read RPCs. If a call has not finished after the
+    hedge delay, the same request is sent again on a second channel; the first
+    successful response wins and the other call is cancelled.
+
+    With `delay=None` the delay tracks the `quantile` of observed latencies,
+    clamped to [`min_delay`, `max_delay`]; `initial_delay` is used until
+    `min_samples` calls have been observed. Errors are not hedged: a call that
+    fails before the delay is raised as is and left to the retry policy.
+    """
+
+    def __init__(
+        self,
+        delay: Optional[float] = None,
+        quantile: float = 0.95,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.001,
+        max_delay: float = 1.0,
+        min_samples: int = 50,
+        methods: Iterable[str] = HEDGED_METHODS,
+    ):
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+        self.delay = delay
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.methods = frozenset(methods)
+        self.histogram = LatencyHistogram()
+        self._lock = threading.Lock()
+        self._calls = 0
+        self._hedged = 0
+        self._backup_wins = 0
+
+    def hedge_delay(self) -> float:
+        """Seconds to wait for the original call before sending the backup."""
+        if self.delay is not None:
+            return self.delay
+        if self.histogram.count < self.min_samples:
+            return self.initial_delay
+        observed = self.histogram.quantile(self.quantile)
+        return min(self.max_delay, max(self.min_delay, observed))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "calls": self._calls,
+                "hedged": self._hedged,
+                "backup_wins": self._backup_wins,
+                "delay": self.hedge_delay(),
+            }
+
+    def _record(self, started: float, hedged: bool, backup_won: bool):
+        self.histogram.observe(time.monotonic() - started)
+        with self._lock:
+            self._calls += 1
+            self._hedged += hedged
+            self._backup_wins += backup_won
+
+    def call(self, start_primary: Callable, start_backup: Callable) -> Any:
+        """
+        Runs a hedged call. `start_primary` and `start_backup` each start the
+        RPC and return a future (e.g. `stub.Search.future(...)`).
+        """
+        started = time.monotonic()
+        done = threading.Event()
+        futures = [start_primary()]
+        futures[0].add_done_callback(lambda _: done.set())
+        try:
+            if not done.wait(self.hedge_delay()):
+                futures.append(start_backup())
+                futures[1].add_done_callback(lambda _: done.set())
+            winner = _first_success(futures, done)
+            result = winner.result()
+        finally:
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+        self._record(started, len(futures) > 1, winner is not futures[0])
+        return result
+
+    async def call_async(
+        self,
+        start_primary: Callable[[], Awaitable],
+        start_backup: Callable[[], Awaitable],
+    ) -> Any:
+        """asyncio counterpart of `call`; the starters return awaitable calls."""
+        import asyncio
+
+        started = time.monotonic()
+        tasks = [asyncio.ensure_future(start_primary())]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done:
+                tasks.append(asyncio.ensure_future(start_backup()))
+            winner = await _first_success_async(tasks)
+            result = winner.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+        self._record(started, len(tasks) > 1, winner is not tasks[0])
+        return result
+
+
+def _succeeded(future) -> bool:
+    return future.done() and not future.cancelled() and future.exception() is None
+
+
+def _first_success(futures: List, done: threading.Event):
+    # The first future to succeed, or the original one if every call failed.
+    while True:
+        done.clear()
+        for future in futures:
+            if _succeeded(future):
+                return future
+        if all(future.done() for future in futures):
+            return futures[0]
+        done.wait()
+
+
+async def _first_success_async(tasks: List["asyncio.Future"]) -> "asyncio.Future":
+    import asyncio
+
+    pending = set(tasks)
+    while pending:
+        for task in tasks:
+            if _succeeded(task):
+                return task
+        _, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+    for task in tasks:
+        if _succeeded(task):
+            return task
+    return tasks[0]
@@ -0,0 +1,111 @@
+import collections
+from typing import Optional
+import grpc
+from .tracing import _inject, _start_span
+
+
+def _end_span(span, code: Optional[grpc.StatusCode], details: Optional[str] = None):
+    from opentelemetry.trace import Status, StatusCode
+
+    if code is not None:
+        span.set_attribute("rpc.grpc.status_code", code.value[0])
+        if code != grpc.StatusCode.OK:
+            span.set_status(Status(StatusCode.ERROR, details or code.name))
+    span.end()
+
+
+class _CallDetails(
+    collections.namedtuple(
+        "_CallDetails",
+        (
+            "method",
+            "timeout",
+            "metadata",
+            "credentials",
+            "wait_for_ready",
+            "compression",
+        ),
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+class TracingInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.StreamUnaryClientInterceptor
+):
+    """
+    Sync client interceptor that wraps each RPC attempt in an OpenTelemetry
+    client span and sends the trace context in the call metadata.
+    """
+
+    def _intercept(self, continuation, details, request, streaming: bool):
+        span = _start_span(details.method, request, streaming)
+        metadata = list(details.metadata or ()) + list(_inject(span).items())
+        details = _CallDetails(
+            details.method,
+            details.timeout,
+            metadata,
+            details.credentials,
+            getattr(details, "wait_for_ready", None),
+            getattr(details, "compression", None),
+        )
+        try:
+            outcome = continuation(details, request)
+        except Exception:
+            _end_span(span, grpc.StatusCode.UNKNOWN)
+            raise
+
+        def done(call):
+            if not streaming and call.code() == grpc.StatusCode.OK:
+                span.set_attribute("rice.response_bytes", call.result().ByteSize())
+            _end_span(span, call.code(), call.details())
+
+        outcome.add_done_callback(done)
+        return outcome
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        return self._intercept(continuation, client_call_details, request, False)
+
+    def intercept_stream_unary(
+        self, continuation, client_call_details, request_iterator
+    ):
+        return self._intercept(
+            continuation, client_call_details, request_iterator, True
+        )
+
+
+async def _intercept_aio(continuation, details, request, streaming: bool):
+    span = _start_span(details.method, request, streaming)
+    metadata = grpc.aio.Metadata(*tuple(details.metadata or ()), *_inject(span).items())
+    code = grpc.StatusCode.CANCELLED
+    try:
+        call = await continuation(details._replace(metadata=metadata), request)
+        try:
+            response = await call
+            if not streaming:
+                span.set_attribute("rice.response_bytes", response.ByteSize())
+        except grpc.RpcError:
+            pass
+        code = await call.code()
+        return call
+    finally:
+        _end_span(span, code)
+
+
+class AioUnaryTracingInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """asyncio counterpart of TracingInterceptor for unary calls."""
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        return await _intercept_aio(continuation, client_call_details, request, False)
+
+
+class AioStreamTracingInterceptor(grpc.aio.StreamUnaryClientInterceptor):
+    """asyncio counterpart of TracingInterceptor for client-streaming calls."""
+
+    async def intercept_stream_unary(
+        self, continuation, client_call_details, request_iterator
+    ):
+        return await _intercept_aio(
+            continuation, client_call_details, request_iterator, True
+        )
@@ -0,0 +1,48 @@
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+def lazy_exports(
+    module_name: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module-level `__getattr__` and `__dir__` for `module_name` that import each
+    name in `exports` (name -> module, relative to the package) on first access
+    and cache it on the module, so later lookups cost nothing.
+    """
+    module = sys.modules[module_name]
+
+    def __getattr__(name: str) -> Any:
+        try:
+            source = exports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {module_name!r} has no attribute {name!r}"
+            ) from None
+        value = getattr(importlib.import_module(source, module.__package__), name)
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(module.__dict__) | set(exports))
+
+    return __getattr__, __dir__
+
+
+def loaded(name: str) -> Optional[ModuleType]:
+    """The module `name` if something has already imported it, else None."""
+    return sys.modules.get(name)
+
+
+def grpc_status(error: BaseException) -> Optional[str]:
+    """Status code name of a grpc.RpcError, or None for any other error."""
+    # An error can only be a grpc.RpcError once grpc has been imported, so
+    # this never imports it.
+    grpc = loaded("grpc")
+    if grpc is None or not isinstance(error, grpc.RpcError):
+        return None
+    if not hasattr(error, "code"):
+        return None
+    return getattr(error.code(), "name", None)
@@ -0,0 +1,306 @@
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Union
+from .codec import JsonCodec
+from .histogram import LatencyHistogram
+
+
+class _MethodStats:
+    __slots__ = ("calls", "errors", "error_codes", "latency", "sent", "received")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.error_codes: Dict[str, int] = {}
+        self.latency = LatencyHistogram()
+        self.sent = 0
+        self.received = 0
+
+
+class Metrics:
+    """
+    In-process metrics for SDK calls: per-method call and error counts, latency
+    histograms, request/response payload bytes, and time spent in the JSON codec.
+    Clients record into it only when one is passed as `metrics`, so there is
+    no cost when metrics are off. `snapshot()` returns a plain dict;
+    `register_prometheus` and `register_opentelemetry` export the same data.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._methods: Dict[str, _MethodStats] = {}
+        self._codec = {op: LatencyHistogram() for op in ("encode", "decode")}
+
+    def _stats(self, method: str) -> _MethodStats:
+        stats = self._methods.get(method)
+        if stats is None:
+            with self._lock:
+                stats = self._methods.setdefault(method, _MethodStats())
+        return stats
+
+    def record_call(
+        self,
+        method: str,
+        seconds: float,
+        error: Optional[BaseException] = None,
+        sent: int = 0,
+        received: int = 0,
+    ):
+        stats = self._stats(method)
+        stats.latency.observe(seconds)
+        with self._lock:
+            stats.calls += 1
+            stats.sent += sent
+            stats.received += received
+            if error is not None:
+                code = _error_code(error)
+                stats.errors += 1
+                stats.error_codes[code] = stats.error_codes.get(code, 0) + 1
+
+    def record_codec(self, op: str, seconds: float):
+        self._codec[op].observe(seconds)
+
+    def observe(self, method: str, fn: Callable, request: Any, *args) -> Any:
+        """Calls `fn(*args)` and records it; `request` and the result are sized
+        with protobuf `ByteSize()`."""
+        started = time.perf_counter()
+        try:
+            response = fn(*args)
+        except BaseException as e:
+            self.record_call(
+                method, time.perf_counter() - started, e, _message_size(request)
+            )
+            raise
+        self.record_call(
+            method,
+            time.perf_counter() - started,
+            None,
+            _message_size(request),
+            _message_size(response),
+        )
+        return response
+
+    async def observe_async(
+        self, method: str, fn: Callable, request: Any, *args
+    ) -> Any:
+        """asyncio counterpart of `observe`; `fn` returns an awaitable."""
+        started = time.perf_counter()
+        try:
+            response = await fn(*args)
+        except BaseException as e:
+            self.record_call(
+                method, time.perf_counter() - started, e, _message_size(request)
+            )
+            raise
+        self.record_call(
+            method,
+            time.perf_counter() - started,
+            None,
+            _message_size(request),
+            _message_size(response),
+        )
+        return response
+
+    def wrap_codec(self, codec: JsonCodec) -> JsonCodec:
+        """Returns `codec` timed into this registry (wrapping only once)."""
+        if isinstance(codec, TimedCodec) and codec.metrics is self:
+            return codec
+        return TimedCodec(codec, self)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            methods = dict(self._methods)
+        result: Dict[str, Any] = {"methods": {}, "codec": {}}
+        for name, stats in sorted(methods.items()):
+            with self._lock:
+                entry = {
+                    "calls": stats.calls,
+                    "errors": stats.errors,
+                    "error_codes": dict(stats.error_codes),
+                    "request_bytes": stats.sent,
+                    "response_bytes": stats.received,
+                }
+            entry["latency"] = _latency(stats.latency)
+            result["methods"][name] = entry
+        for op, histogram in self._codec.items():
+            result["codec"][op] = _latency(histogram)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._methods.clear()
+        for histogram in self._codec.values():
+            histogram.reset()
+
+    def register_prometheus(self, registry=None):
+        """
+        Exposes the metrics through prometheus_client (must be installed), read
+        at scrape time. Uses the default registry unless `registry` is given.
+        """
+        from prometheus_client import REGISTRY
+        from prometheus_client.core import CounterMetricFamily, HistogramMetricFamily
+
+        metrics = self
+
+        class _Collector:
+            def collect(self):
+                calls = CounterMetricFamily(
+                    "rice_sdk_calls", "SDK calls by method", labels=["method"]
+                )
+                errors = CounterMetricFamily(
+                    "rice_sdk_errors",
+                    "Failed SDK calls by method and status",
+                    labels=["method", "code"],
+                )
+                payload = CounterMetricFamily(
+                    "rice_sdk_payload_bytes",
+                    "Request and response payload bytes",
+                    labels=["method", "direction"],
+                )
+                latency = HistogramMetricFamily(
+                    "rice_sdk_latency_seconds",
+                    "SDK call latency",
+                    labels=["method"],
+                )
+                with metrics._lock:
+                    methods = dict(metrics._methods)
+                for name, stats in methods.items():
+                    calls.add_metric([name], stats.calls)
+                    for code, n in stats.error_codes.items():
+                        errors.add_metric([name, code], n)
+                    payload.add_metric([name, "sent"], stats.sent)
+                    payload.add_metric([name, "received"], stats.received)
+                    buckets, total = _cumulative_buckets(stats.latency)
+                    latency.add_metric([name], buckets, total)
+                codec = HistogramMetricFamily(
+                    "rice_sdk_codec_seconds", "JSON codec time", labels=["op"]
+                )
+                for op, histogram in metrics._codec.items():
+                    buckets, total = _cumulative_buckets(histogram)
+                    codec.add_metric([op], buckets, total)
+                return [calls, errors, payload, latency, codec]
+
+        collector = _Collector()
+        (registry or REGISTRY).register(collector)
+        return collector
+
+    def register_opentelemetry(self, meter_provider=None):
+        """
+        Exposes call counts, errors, payload bytes and p50/p95/p99 latency as
+        observable OpenTelemetry instruments (opentelemetry-api must be installed).
+        """
+        from opentelemetry import metrics as otel_metrics
+
+        provider = meter_provider or otel_metrics.get_meter_provider()
+        meter = provider.get_meter("rice_sdk")
+
+        def observations(read):
+            def callback(options):
+                snapshot = self.snapshot()["methods"]
+                return [
+                    otel_metrics.Observation(value, {"method": name, **attrs})
+                    for name, entry in snapshot.items()
+                    for value, attrs in read(entry)
+                ]
+
+            return [callback]
+
+        meter.create_observable_counter(
+            "rice_sdk.calls", observations(lambda e: [(e["calls"], {})])
+        )
+        meter.create_observable_counter(
+            "rice_sdk.errors",
+            observations(
+                lambda e: [(n, {"code": c}) for c, n in e["error_codes"].items()]
+            ),
+        )
+        meter.create_observable_counter(
+            "rice_sdk.payload",
+            observations(
+                lambda e: [
+                    (e["request_bytes"], {"direction": "sent"}),
+                    (e["response_bytes"], {"direction": "received"}),
+                ]
+            ),
+            unit="By",
+        )
+        meter.create_observable_gauge(
+            "rice_sdk.latency",
+            observations(
+                lambda e: [
+                    (e["latency"][q], {"quantile": q}) for q in ("p50", "p95", "p99")
+                ]
+            ),
+            unit="s",
+        )
+        return meter
+
+
+class TimedCodec(JsonCodec):
+    """A codec that records how long `dumps`/`dumpb`/`loads` take into Metrics."""
+
+    def __init__(self, codec: JsonCodec, metrics: Metrics):
+        self.codec = codec
+        self.metrics = metrics
+        self.name = codec.name
+
+    def dumps(self, obj: Any) -> str:
+        started = time.perf_counter()
+        try:
+            return self.codec.dumps(obj)
+        finally:
+            self.metrics.record_codec("encode", time.perf_counter() - started)
+
+    def dumpb(self, obj: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return self.codec.dumpb(obj)
+        finally:
+            self.metrics.record_codec("encode", time.perf_counter() - started)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        started = time.perf_counter()
+        try:
+            return self.codec.loads(data)
+        finally:
+            self.metrics.record_codec("decode", time.perf_counter() - started)
+
+
+def _error_code(error: BaseException) -> str:
+    code = getattr(error, "code", None)
+    if callable(code):
+        try:
+            return code().name
+        except Exception:
+            pass
+    response = getattr(error, "response", None)
+    if response is not None and getattr(response, "status_code", None):
+        return str(response.status_code)
+    return type(error).__name__
+
+
+def _message_size(message: Any) -> int:
+    byte_size = getattr(message, "ByteSize", None)
+    return byte_size() if byte_size is not None else 0
+
+
+def _latency(histogram: LatencyHistogram) -> Dict[str, float]:
+    snapshot = histogram.snapshot()
+    return {
+        "count": snapshot["count"],
+        "sum": snapshot["sum"],
+        "p50": histogram.quantile(0.5),
+        "p95": histogram.quantile(0.95),
+        "p99": histogram.quantile(0.99),
+    }
+
+
+def _cumulative_buckets(histogram: LatencyHistogram):
+    snapshot = histogram.snapshot()
+    buckets, seen = [], 0
+    for bound, n in snapshot["buckets"].items():
+        seen += n
+        buckets.append(("+Inf" if bound == "+Inf" else repr(bound), seen))
+    if not buckets or buckets[-1][0] != "+Inf":
+        buckets.append(("+Inf", seen))
+    return buckets, snapshot["sum"]
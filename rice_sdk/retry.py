@@ -0,0 +1,164 @@
+import copy
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+from .deadline import remaining_budget
+from .lazy import grpc_status, loaded
+
+# Read-only RPCs, safe to send again after a transient failure. Names follow the
+# gRPC method names; the HTTP transport uses the same names for its endpoints.
+IDEMPOTENT_METHODS = frozenset(
+    {
+        "Health",
+        "Search",
+        "GetNode",
+        "Drift",
+        "Reminisce",
+        "GetVariable",
+        "ListVariables",
+        "ListGoals",
+        "GetActionLog",
+        "GetCycleHistory",
+    }
+)
+# Status code names; grpc.StatusCode members are accepted too.
+RETRYABLE_GRPC_CODES = frozenset({"UNAVAILABLE"})
+RETRYABLE_HTTP_STATUSES = frozenset({502, 503, 504})
+
+
+class RetryStats:
+    """Per-method counts of retried attempts and of calls that ran out of attempts."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries: Dict[str, int] = {}
+        self._exhausted: Dict[str, int] = {}
+
+    def record_retry(self, method: str):
+        with self._lock:
+            self._retries[method] = self._retries.get(method, 0) + 1
+
+    def record_exhausted(self, method: str):
+        with self._lock:
+            self._exhausted[method] = self._exhausted.get(method, 0) + 1
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {"retries": dict(self._retries), "exhausted": dict(self._exhausted)}
+
+    def reset(self):
+        with self._lock:
+            self._retries.clear()
+            self._exhausted.clear()
+
+
+class RetryPolicy:
+    """
+    Retries idempotent RPCs that failed with a transient error.
+    The n-th retry waits `initial_backoff * multiplier**n`, capped at `max_backoff`
+    and spread by +/- `jitter` (a fraction) so clients do not retry in lockstep.
+    Methods outside `idempotent_methods` are always attempted exactly once, and
+    no retry is started that would outlive the current deadline budget.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.05,
+        max_backoff: float = 1.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.2,
+        retryable_codes: Iterable[Any] = RETRYABLE_GRPC_CODES,
+        retryable_statuses: Iterable[int] = RETRYABLE_HTTP_STATUSES,
+        idempotent_methods: Iterable[str] = IDEMPOTENT_METHODS,
+    ):
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.retryable_codes = frozenset(
+            getattr(code, "name", code) for code in retryable_codes
+        )
+        self.retryable_statuses = frozenset(retryable_statuses)
+        self.idempotent_methods = frozenset(idempotent_methods)
+        self.stats = RetryStats()
+
+    def with_idempotent(self, *methods: str) -> "RetryPolicy":
+        """A copy that also retries `methods`; it shares this policy's stats."""
+        policy = copy.copy(self)
+        policy.idempotent_methods = self.idempotent_methods | frozenset(methods)
+        return policy
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to wait before retry number `retry` (0-based)."""
+        delay = min(self.max_backoff, self.initial_backoff * self.multiplier**retry)
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def is_retryable(self, error: BaseException) -> bool:
+        code = grpc_status(error)
+        if code is not None:
+            return code in self.retryable_codes
+        requests = loaded("requests")
+        if requests is None:
+            return False
+        if isinstance(error, requests.ConnectionError):
+            return True
+        if isinstance(error, requests.HTTPError) and error.response is not None:
+            return error.response.status_code in self.retryable_statuses
+        return False
+
+    def _retry_delay(
+        self, method: str, error: BaseException, retry: int
+    ) -> Optional[float]:
+        # Seconds to sleep before the next attempt, or None to re-raise `error`.
+        if not self.is_retryable(error):
+            return None
+        delay = self.backoff(retry)
+        left = remaining_budget()
+        if retry + 1 >= self.max_attempts or (left is not None and delay >= left):
+            self.stats.record_exhausted(method)
+            return None
+        self.stats.record_retry(method)
+        return delay
+
+    def call(self, method: str, fn: Callable, *args, **kwargs) -> Any:
+        """Calls `fn(*args, **kwargs)`, retrying if `method` is idempotent."""
+        if method not in self.idempotent_methods:
+            return fn(*args, **kwargs)
+        retry = 0
+        while True:
+            try:
+                return fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(method, e, retry)
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            retry += 1
+
+    async def call_async(self, method: str, fn: Callable, *args, **kwargs) -> Any:
+        """asyncio counterpart of `call`; `fn` returns an awaitable."""
+        import asyncio
+
+        if method not in self.idempotent_methods:
+            return await fn(*args, **kwargs)
+        retry = 0
+        while True:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                delay = self._retry_delay(method, e, retry)
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            retry += 1
+
+
+# Sends every call once; pass as `retry_policy` to switch retries off.
+NO_RETRY = RetryPolicy(max_attempts=1)
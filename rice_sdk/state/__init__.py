@@ -1 +1,24 @@
-from .client import StateClient
+from typing import TYPE_CHECKING
+from ..lazy import lazy_exports
+
+_EXPORTS = {
+    "StateClient": ".client",
+    "StateRun": ".client",
+    "AsyncStateClient": ".client_async",
+    "AsyncStateRun": ".client_async",
+    "WriteBehind": ".write_behind",
+    "CommitQueueFull": ".write_behind",
+    "VariableCache": ".cache",
+    "DriftDelta": ".drift",
+    "DriftTracker": ".drift",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .client import StateClient, StateRun
+    from .client_async import AsyncStateClient, AsyncStateRun
+    from .write_behind import WriteBehind, CommitQueueFull
+    from .cache import VariableCache
+    from .drift import DriftDelta, DriftTracker
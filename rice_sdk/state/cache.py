@@ -0,0 +1,256 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from .proto import state_pb2
+
+
+class _Entry:
+    __slots__ = (
+        "result",
+        "value_json",
+        "last_updated",
+        "access_count",
+        "written",
+        "expires_at",
+    )
+
+    def __init__(
+        self,
+        result: Dict[str, Any],
+        value_json: str,
+        last_updated: str,
+        access_count: int,
+        written: bool,
+        expires_at: float,
+    ):
+        self.result = result
+        self.value_json = value_json
+        self.last_updated = last_updated
+        self.access_count = access_count
+        # Set through this client: `last_updated` is the version it replaced,
+        # so responses still carrying it predate the write.
+        self.written = written
+        self.expires_at = expires_at
+
+
+class VariableCache:
+    """
+    Read-through cache of decoded working-memory variables for StateClient.
+
+    Entries are keyed on (run_id, name) and hold the decoded variable, so a hit
+    costs neither a GetVariable call nor JSON parsing. `get_variable`,
+    `list_variables` and `set_variable` fill it; `delete_variable`,
+    `delete_run` and `set_run_id` invalidate it. A fresh `list_variables`
+    result also serves later listings of that run until `ttl` expires.
+
+    Responses are checked against the cached `last_updated`/`access_count`:
+    an older read of the same version, or a response that predates a
+    `set_variable` through this client, does not replace the newer entry, and
+    an unchanged `value_json` reuses the decoded value. Returned dicts are
+    copies, but the values inside are shared and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        ttl: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[str, str], _Entry]" = OrderedDict()
+        # run_id -> (expiry, names) of the last complete listing of that run.
+        self._listings: Dict[str, Tuple[float, Dict[str, None]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.decodes_saved = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, run_id: str, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._live((run_id, name))
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return dict(entry.result)
+
+    def list(self, run_id: str) -> Optional[List[Dict[str, Any]]]:
+        """The variables of `run_id` if a listing of it is still fresh."""
+        with self._lock:
+            listing = self._listings.get(run_id)
+            if listing is None or listing[0] <= self._clock():
+                self._listings.pop(run_id, None)
+                self.misses += 1
+                return None
+            results = []
+            for name in listing[1]:
+                entry = self._live((run_id, name))
+                if entry is None:
+                    # Evicted since the listing, so it is no longer complete.
+                    del self._listings[run_id]
+                    self.misses += 1
+                    return None
+                results.append(dict(entry.result))
+            self.hits += 1
+            return results
+
+    def store(
+        self,
+        run_id: str,
+        response: "state_pb2.VariableResponse",
+        decode: Callable[["state_pb2.VariableResponse"], Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Caches a GetVariable response; returns the decoded variable."""
+        with self._lock:
+            return dict(self._store(run_id, response, decode, self._clock()).result)
+
+    def store_list(
+        self,
+        run_id: str,
+        responses: List["state_pb2.VariableResponse"],
+        decode: Callable[["state_pb2.VariableResponse"], Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Caches a complete ListVariables response for `run_id`."""
+        with self._lock:
+            now = self._clock()
+            names = {r.name: None for r in responses}
+            for key in [k for k in self._entries if k[0] == run_id]:
+                if key[1] not in names:
+                    # Deleted by another client.
+                    del self._entries[key]
+                    self.invalidations += 1
+            results = [
+                dict(self._store(run_id, r, decode, now).result) for r in responses
+            ]
+            if len(names) <= self.max_entries:
+                self._listings[run_id] = (now + self.ttl, names)
+            return results
+
+    def written(
+        self,
+        run_id: str,
+        name: str,
+        value_json: str,
+        result: Dict[str, Any],
+        replaced: str,
+    ):
+        """
+        Records a value acknowledged by SetVariable; `replaced` is the
+        `last_updated` returned by `invalidate` before the write was sent.
+        """
+        with self._lock:
+            key = (run_id, name)
+            self._entries.pop(key, None)
+            self._entries[key] = _Entry(
+                result,
+                value_json,
+                replaced,
+                0,
+                True,
+                self._clock() + self.ttl,
+            )
+            self._evict()
+
+    def invalidate(self, run_id: str, name: str) -> str:
+        """Drops `name`; returns the `last_updated` of the dropped entry."""
+        with self._lock:
+            self._listings.pop(run_id, None)
+            entry = self._entries.pop((run_id, name), None)
+            if entry is None:
+                return ""
+            self.invalidations += 1
+            return entry.last_updated
+
+    def invalidate_run(self, run_id: str):
+        with self._lock:
+            self._listings.pop(run_id, None)
+            for key in [k for k in self._entries if k[0] == run_id]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._listings.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "decodes_saved": self.decodes_saved,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _live(self, key: Hashable) -> Optional[_Entry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            self.expirations += 1
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _store(
+        self,
+        run_id: str,
+        response: "state_pb2.VariableResponse",
+        decode: Callable[["state_pb2.VariableResponse"], Dict[str, Any]],
+        now: float,
+    ) -> _Entry:
+        key = (run_id, response.name)
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry.written:
+                stale = response.last_updated == entry.last_updated
+            else:
+                stale = (
+                    response.last_updated == entry.last_updated
+                    and response.access_count < entry.access_count
+                )
+            if stale:
+                # A read that started before the cached version was seen.
+                self.decodes_saved += 1
+                return entry
+        if entry is not None and entry.value_json == response.value_json:
+            result = entry.result
+            self.decodes_saved += 1
+        else:
+            result = decode(response)
+        self._entries.pop(key, None)
+        entry = _Entry(
+            result,
+            response.value_json,
+            response.last_updated,
+            response.access_count,
+            False,
+            now + self.ttl,
+        )
+        self._entries[key] = entry
+        self._evict()
+        return entry
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            run_id, name = next(iter(self._entries))
+            del self._entries[(run_id, name)]
+            self.evictions += 1
+            listing = self._listings.get(run_id)
+            if listing is not None and name in listing[1]:
+                del self._listings[run_id]
@@ -1,39 +1,75 @@
 import grpc
-import json
-from typing import List, Optional, Any, Dict
+import inspect
+import threading
+import time
+from typing import Iterable, Iterator, List, Optional, Any, Dict, Union
+from ..channel import SharedChannel
+from ..codec import JsonCodec, get_codec
+from ..deadline import Deadlines, budget, call_timeout
+from ..futures import CallFuture, Submitter, settle, start_call, submitting
+from ..hedge import HEDGE_CHANNEL_OPTION, HedgePolicy
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..tracing import intercept_channel
+from ..vectors import Vector, set_vector
+from .cache import VariableCache
+from .drift import DriftDelta, DriftTracker, poll_drift
 from .proto import state_pb2, state_pb2_grpc
+from .write_behind import WriteBehind
 
+# Calls `set_variables`/`get_variables` keep outstanding at once.
+PIPELINE_WINDOW = 32
+# `get_variables` fetches more uncached names than this with one ListVariables.
+LIST_THRESHOLD = 16
 
-class StateClient:
+
+class _CortexMethods:
     """
-    Client for interacting with State (AI Memory).
-    Provides methods for managing conversational memory, drift, and skills.
+    Request building and response mapping shared by StateClient and AsyncStateClient.
+    Every RPC is handed to `_invoke`, which the concrete client implements either
+    as a blocking call or as a coroutine, and results served without a call go
+    through `_resolved`. `timeout` overrides the default deadline of a call (see
+    `Deadlines`) and is capped by any enclosing `budget`.
     """
 
-    def __init__(
+    run_id: str
+    codec: JsonCodec
+    retry_policy: RetryPolicy
+    deadlines: Deadlines
+    metrics: Optional[Metrics]
+    write_behind: Optional[WriteBehind] = None
+    variable_cache: Optional[VariableCache] = None
+
+    def _invoke(
+        self, method: str, request: Any, mapper, timeout: Optional[float] = None
+    ):
+        raise NotImplementedError
+
+    def _resolved(self, result: Any):
+        return result
+
+    def _pipeline(
         self,
-        address: str = "localhost:50051",
-        token: Optional[str] = None,
-        run_id: str = "default",
+        method: str,
+        requests: List[Any],
+        mapper,
+        timeout: Optional[float] = None,
     ):
-        self.channel = grpc.insecure_channel(address)
-        self.client = state_pb2_grpc.CortexStub(self.channel)
-        self.metadata = []
-        if token:
-            self.metadata.append(("authorization", token))
-        self.run_id = run_id
+        """
+        Sends `requests` concurrently; `mapper` gets the response, or the
+        exception, of each request in order.
+        """
+        raise NotImplementedError
 
-    def focus(self, content: str) -> str:
+    def focus(self, content: str, timeout: Optional[float] = None) -> str:
         """Stores a piece of information in short-term working memory (Flux)."""
         request = state_pb2.FocusRequest(content=content, run_id=self.run_id)
-        response = self.client.Focus(request, metadata=self.metadata)
-        return response.id
+        return self._invoke("Focus", request, _focus_result, timeout)
 
-    def drift(self) -> List[Any]:
+    def drift(self, timeout: Optional[float] = None) -> List[Any]:
         """Reads current items from short-term memory."""
         request = state_pb2.DriftRequest(run_id=self.run_id)
-        response = self.client.Drift(request, metadata=self.metadata)
-        return list(response.items)
+        return self._invoke("Drift", request, _drift_result, timeout)
 
     def commit(
         self,
@@ -41,95 +77,251 @@ class StateClient:
         output: str,
         action: str = "",
         agent_id: str = "",
-        embedding: List[float] = None,
+        embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
-        """Stores information in long-term persistent memory (Echoes)."""
+        """
+        Stores information in long-term persistent memory (Echoes). With
+        write-behind enabled, returns once the trace is buffered (False if the
+        buffer was full and it was dropped).
+        """
         trace = state_pb2.Trace(
             input=input_text,
             outcome=output,
             action=action,
             agent_id=agent_id,
-            embedding=embedding or [],
             run_id=self.run_id,
         )
+        set_vector(trace, "embedding", embedding)
         # Note: Node SDK takes 'options' object for action/agent_id. Python uses named args.
-        response = self.client.Commit(trace, metadata=self.metadata)
-        return response.success
+        if self.write_behind is not None:
+            return self._resolved(self.write_behind.put(trace))
+        return self._invoke("Commit", trace, _ack_result, timeout)
 
-    def reminisce(self, query: str, limit: int = 5, filter_str: str = "") -> List[Any]:
+    def reminisce(
+        self,
+        query: str,
+        limit: int = 5,
+        filter_str: str = "",
+        timeout: Optional[float] = None,
+    ) -> List[Any]:
         """Recalls relevant memories from long-term memory."""
         request = state_pb2.RecallRequest(
             query_text=query, limit=limit, filter=filter_str, run_id=self.run_id
         )
-        response = self.client.Reminisce(request, metadata=self.metadata)
-        return list(response.traces)
+        return self._invoke("Reminisce", request, _recall_result, timeout)
 
-    def set_variable(self, name: str, value: Any, source: str = "explicit") -> bool:
+    def set_variable(
+        self,
+        name: str,
+        value: Any,
+        source: str = "explicit",
+        timeout: Optional[float] = None,
+    ) -> bool:
         """Sets a structured variable in working memory."""
-        value_json = json.dumps(value)
+        value_json = self.codec.dumps(value)
         request = state_pb2.SetVariableRequest(
             run_id=self.run_id, name=name, value_json=value_json, source=source
         )
-        response = self.client.SetVariable(request, metadata=self.metadata)
-        return response.success
+        cache = self.variable_cache
+        if cache is None:
+            return self._invoke("SetVariable", request, _ack_result, timeout)
+        # Dropped until the write is acknowledged, so a failed or timed-out
+        # write never leaves the old value cached.
+        replaced = cache.invalidate(request.run_id, name)
+
+        def mapper(response: state_pb2.Ack) -> bool:
+            if response.success:
+                self._cache_written(request, replaced)
+            return response.success
+
+        return self._invoke("SetVariable", request, mapper, timeout)
+
+    def set_variables(
+        self,
+        variables: Dict[str, Any],
+        source: str = "explicit",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sets several variables at once, with the SetVariable calls in flight
+        concurrently. Returns {"set": [names], "errors": {name: message}};
+        one failed name does not fail the others.
+        """
+        requests = [
+            state_pb2.SetVariableRequest(
+                run_id=self.run_id,
+                name=name,
+                value_json=self.codec.dumps(value),
+                source=source,
+            )
+            for name, value in variables.items()
+        ]
+        cache = self.variable_cache
+        replaced = [
+            cache.invalidate(r.run_id, r.name) if cache is not None else ""
+            for r in requests
+        ]
+
+        def mapper(outcomes: List[Any]) -> Dict[str, Any]:
+            result: Dict[str, Any] = {"set": [], "errors": {}}
+            for request, previous, outcome in zip(requests, replaced, outcomes):
+                if isinstance(outcome, BaseException):
+                    result["errors"][request.name] = str(outcome)
+                elif not outcome.success:
+                    result["errors"][request.name] = "not acknowledged"
+                else:
+                    result["set"].append(request.name)
+                    if cache is not None:
+                        self._cache_written(request, previous)
+            return result
 
-    def get_variable(self, name: str) -> Dict[str, Any]:
+        return self._pipeline("SetVariable", requests, mapper, timeout)
+
+    def get_variable(
+        self, name: str, timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
         """Gets a structured variable from working memory."""
         request = state_pb2.GetVariableRequest(run_id=self.run_id, name=name)
-        response = self.client.GetVariable(request, metadata=self.metadata)
-        return {
-            "name": response.name,
-            "value": json.loads(response.value_json),
-            "source": response.source,
-        }
+        cache = self.variable_cache
+        if cache is None:
+            return self._invoke("GetVariable", request, self._variable_result, timeout)
+        cached = cache.get(request.run_id, name)
+        if cached is not None:
+            return self._resolved(cached)
+        return self._invoke(
+            "GetVariable",
+            request,
+            lambda response: cache.store(
+                request.run_id, response, self._variable_result
+            ),
+            timeout,
+        )
 
-    def list_variables(self) -> List[Dict[str, Any]]:
+    def list_variables(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """Lists all variables in working memory."""
         request = state_pb2.ListVariablesRequest(run_id=self.run_id)
-        response = self.client.ListVariables(request, metadata=self.metadata)
-        return [
-            {"name": v.name, "value": json.loads(v.value_json), "source": v.source}
-            for v in response.variables
+        cache = self.variable_cache
+        if cache is None:
+            return self._invoke(
+                "ListVariables", request, self._list_variables_result, timeout
+            )
+        cached = cache.list(request.run_id)
+        if cached is not None:
+            return self._resolved(cached)
+        return self._invoke(
+            "ListVariables",
+            request,
+            lambda response: cache.store_list(
+                request.run_id, response.variables, self._variable_result
+            ),
+            timeout,
+        )
+
+    def get_variables(
+        self, names: Iterable[str], timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Gets several variables at once. Returns
+        {"variables": {name: variable}, "errors": {name: message}}. Up to
+        LIST_THRESHOLD uncached names are fetched with concurrent GetVariable
+        calls; more than that are taken from a single ListVariables call.
+        """
+        names = list(dict.fromkeys(names))
+        run_id = self.run_id
+        cache = self.variable_cache
+        found: Dict[str, Any] = {}
+        if cache is not None:
+            for name in names:
+                cached = cache.get(run_id, name)
+                if cached is not None:
+                    found[name] = cached
+        missing = [name for name in names if name not in found]
+        if not missing:
+            return self._resolved({"variables": found, "errors": {}})
+
+        def ordered(errors: Dict[str, str]) -> Dict[str, Any]:
+            variables = {name: found[name] for name in names if name in found}
+            return {"variables": variables, "errors": errors}
+
+        if len(missing) > LIST_THRESHOLD:
+            request = state_pb2.ListVariablesRequest(run_id=run_id)
+
+            def from_list(response: state_pb2.ListVariablesResponse):
+                if cache is not None:
+                    listed = cache.store_list(
+                        run_id, response.variables, self._variable_result
+                    )
+                else:
+                    listed = self._list_variables_result(response)
+                by_name = {variable["name"]: variable for variable in listed}
+                errors = {}
+                for name in missing:
+                    if name in by_name:
+                        found[name] = by_name[name]
+                    else:
+                        errors[name] = "not found"
+                return ordered(errors)
+
+            return self._invoke("ListVariables", request, from_list, timeout)
+
+        requests = [
+            state_pb2.GetVariableRequest(run_id=run_id, name=name) for name in missing
         ]
 
-    def delete_variable(self, name: str) -> bool:
+        def from_gets(outcomes: List[Any]) -> Dict[str, Any]:
+            errors = {}
+            for name, outcome in zip(missing, outcomes):
+                if isinstance(outcome, BaseException):
+                    errors[name] = str(outcome)
+                elif cache is not None:
+                    found[name] = cache.store(run_id, outcome, self._variable_result)
+                else:
+                    found[name] = self._variable_result(outcome)
+            return ordered(errors)
+
+        return self._pipeline("GetVariable", requests, from_gets, timeout)
+
+    def delete_variable(self, name: str, timeout: Optional[float] = None) -> bool:
         """Deletes a variable from working memory."""
         request = state_pb2.DeleteVariableRequest(run_id=self.run_id, name=name)
-        response = self.client.DeleteVariable(request, metadata=self.metadata)
-        return response.success
+        if self.variable_cache is not None:
+            self.variable_cache.invalidate(request.run_id, name)
+        return self._invoke("DeleteVariable", request, _ack_result, timeout)
 
     def set_run_id(self, run_id: str):
         """Updates the current run ID."""
+        if self.variable_cache is not None:
+            self.variable_cache.invalidate_run(self.run_id)
         self.run_id = run_id
 
-    def trigger(self, skill_name: str) -> int:
+    def trigger(self, skill_name: str, timeout: Optional[float] = None) -> int:
         """Triggers a registered skill or procedure."""
         request = state_pb2.ReflexRequest(skill_name=skill_name)
-        response = self.client.Trigger(request, metadata=self.metadata)
-        return response.result
+        return self._invoke("Trigger", request, _trigger_result, timeout)
 
-    def define_concept(self, name: str, schema: Dict[str, Any]) -> bool:
+    def define_concept(
+        self, name: str, schema: Dict[str, Any], timeout: Optional[float] = None
+    ) -> bool:
         """Define a concept with JSON schema."""
         request = state_pb2.DefineConceptRequest(
-            run_id=self.run_id, name=name, schema_json=json.dumps(schema)
+            run_id=self.run_id, name=name, schema_json=self.codec.dumps(schema)
         )
-        response = self.client.DefineConcept(request, metadata=self.metadata)
-        return response.success
+        return self._invoke("DefineConcept", request, _ack_result, timeout)
 
-    def list_concepts(self) -> List[Dict[str, Any]]:
+    def list_concepts(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
         """List all defined concepts."""
         request = state_pb2.ListConceptsRequest(run_id=self.run_id)
-        response = self.client.ListConcepts(request, metadata=self.metadata)
-        return [
-            {"name": c.name, "schema": json.loads(c.schema_json)}
-            for c in response.concepts
-        ]
+        return self._invoke(
+            "ListConcepts", request, self._list_concepts_result, timeout
+        )
 
     def add_goal(
         self,
         description: str,
         priority: str = "medium",
         parent_id: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Add a new goal to the agent's goal stack."""
         request = state_pb2.AddGoalRequest(
@@ -138,86 +330,59 @@ class StateClient:
             priority=priority,
             parent_id=parent_id or "",
         )
-        response = self.client.AddGoal(request, metadata=self.metadata)
-        return {
-            "id": response.id,
-            "description": response.description,
-            "priority": response.priority,
-            "status": response.status,
-            "parent_id": response.parent_id,
-            "created_at": response.created_at,
-        }
+        return self._invoke("AddGoal", request, _goal_result, timeout)
 
-    def update_goal(self, goal_id: str, status: str) -> bool:
+    def update_goal(
+        self, goal_id: str, status: str, timeout: Optional[float] = None
+    ) -> bool:
         """Update the status of an existing goal."""
         request = state_pb2.UpdateGoalRequest(
             run_id=self.run_id, goal_id=goal_id, status=status
         )
-        response = self.client.UpdateGoal(request, metadata=self.metadata)
-        return response.success
+        return self._invoke("UpdateGoal", request, _ack_result, timeout)
 
-    def list_goals(self, status_filter: str = "") -> List[Dict[str, Any]]:
+    def list_goals(
+        self, status_filter: str = "", timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
         """List all goals, optionally filtered by status."""
         request = state_pb2.ListGoalsRequest(
             run_id=self.run_id, status_filter=status_filter
         )
-        response = self.client.ListGoals(request, metadata=self.metadata)
-        return [
-            {
-                "id": g.id,
-                "description": g.description,
-                "priority": g.priority,
-                "status": g.status,
-                "parent_id": g.parent_id,
-                "created_at": g.created_at,
-            }
-            for g in response.goals
-        ]
+        return self._invoke("ListGoals", request, _list_goals_result, timeout)
 
     def submit_action(
-        self, agent_id: str, action_type: str, details: Any
+        self,
+        agent_id: str,
+        action_type: str,
+        details: Any,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Submit an action for execution and logging."""
         request = state_pb2.ActionRequest(
             run_id=self.run_id,
             agent_id=agent_id,
             action_type=action_type,
-            action_json=json.dumps(details),
+            action_json=self.codec.dumps(details),
         )
-        response = self.client.SubmitAction(request, metadata=self.metadata)
-        return {
-            "action_id": response.action_id,
-            "success": response.success,
-            "result": json.loads(response.result_json)
-            if response.result_json
-            else None,
-            "error": response.error,
-            "duration_ms": response.duration_ms,
-        }
+        return self._invoke("SubmitAction", request, self._action_result, timeout)
 
     def get_action_log(
-        self, limit: int = 100, action_type_filter: str = ""
+        self,
+        limit: int = 100,
+        action_type_filter: str = "",
+        timeout: Optional[float] = None,
     ) -> List[Dict[str, Any]]:
         """Get the action log for the current run."""
         request = state_pb2.ActionLogRequest(
             run_id=self.run_id, limit=limit, action_type_filter=action_type_filter
         )
-        response = self.client.GetActionLog(request, metadata=self.metadata)
-        return [
-            {
-                "action_id": e.action_id,
-                "action_type": e.action_type,
-                "action": json.loads(e.action_json) if e.action_json else None,
-                "success": e.success,
-                "result": json.loads(e.result_json) if e.result_json else None,
-                "cycle_number": e.cycle_number,
-                "timestamp": e.timestamp,
-            }
-            for e in response.entries
-        ]
+        return self._invoke("GetActionLog", request, self._action_log_result, timeout)
 
     def run_cycle(
-        self, agent_id: str, candidates: Optional[List[Dict[str, Any]]] = None
+        self,
+        agent_id: str,
+        candidates: Optional[List[Dict[str, Any]]] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Run a decision cycle with action candidates."""
         proto_candidates = []
@@ -226,7 +391,7 @@ class StateClient:
                 proto_candidates.append(
                     state_pb2.ActionCandidate(
                         action_type=c.get("actionType", ""),
-                        action_json=json.dumps(c.get("action", {})),
+                        action_json=self.codec.dumps(c.get("action", {})),
                         score=c.get("score", 0.0),
                         rationale=c.get("rationale", ""),
                     )
@@ -235,8 +400,80 @@ class StateClient:
         request = state_pb2.RunCycleRequest(
             run_id=self.run_id, agent_id=agent_id, candidates=proto_candidates
         )
-        response = self.client.RunCycle(request, metadata=self.metadata)
+        return self._invoke("RunCycle", request, self._cycle_result, timeout)
+
+    def get_cycle_history(
+        self, limit: int = 10, timeout: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Get history of decision cycles."""
+        request = state_pb2.CycleHistoryRequest(run_id=self.run_id, limit=limit)
+        return self._invoke("GetCycleHistory", request, _cycle_history_result, timeout)
+
+    def delete_run(self, timeout: Optional[float] = None) -> bool:
+        """Deletes the current run session."""
+        request = state_pb2.RunRequest(run_id=self.run_id)
+        if self.variable_cache is not None:
+            self.variable_cache.invalidate_run(request.run_id)
+        return self._invoke("DeleteRun", request, _ack_result, timeout)
+
+    def _variable_result(self, response: state_pb2.VariableResponse) -> Dict[str, Any]:
+        return {
+            "name": response.name,
+            "value": self.codec.loads(response.value_json),
+            "source": response.source,
+        }
+
+    def _cache_written(self, request: state_pb2.SetVariableRequest, replaced: str):
+        result = self._variable_result(
+            state_pb2.VariableResponse(
+                name=request.name, value_json=request.value_json, source=request.source
+            )
+        )
+        self.variable_cache.written(
+            request.run_id, request.name, request.value_json, result, replaced
+        )
+
+    def _list_variables_result(
+        self, response: state_pb2.ListVariablesResponse
+    ) -> List[Dict[str, Any]]:
+        return [self._variable_result(v) for v in response.variables]
+
+    def _list_concepts_result(
+        self, response: state_pb2.ListConceptsResponse
+    ) -> List[Dict[str, Any]]:
+        return [
+            {"name": c.name, "schema": self.codec.loads(c.schema_json)}
+            for c in response.concepts
+        ]
 
+    def _action_result(self, response: state_pb2.ActionResponse) -> Dict[str, Any]:
+        return {
+            "action_id": response.action_id,
+            "success": response.success,
+            "result": self.codec.loads(response.result_json)
+            if response.result_json
+            else None,
+            "error": response.error,
+            "duration_ms": response.duration_ms,
+        }
+
+    def _action_log_result(
+        self, response: state_pb2.ActionLogResponse
+    ) -> List[Dict[str, Any]]:
+        return [
+            {
+                "action_id": e.action_id,
+                "action_type": e.action_type,
+                "action": self.codec.loads(e.action_json) if e.action_json else None,
+                "success": e.success,
+                "result": self.codec.loads(e.result_json) if e.result_json else None,
+                "cycle_number": e.cycle_number,
+                "timestamp": e.timestamp,
+            }
+            for e in response.entries
+        ]
+
+    def _cycle_result(self, response: state_pb2.CycleResponse) -> Dict[str, Any]:
         selected_action = response.selected_action
         action_result = response.action_result
 
@@ -244,7 +481,7 @@ class StateClient:
             "cycle_number": response.cycle_number,
             "selected_action": {
                 "actionType": selected_action.action_type,
-                "action": json.loads(selected_action.action_json)
+                "action": self.codec.loads(selected_action.action_json)
                 if selected_action.action_json
                 else None,
                 "score": selected_action.score,
@@ -255,7 +492,7 @@ class StateClient:
             "action_result": {
                 "action_id": action_result.action_id,
                 "success": action_result.success,
-                "result": json.loads(action_result.result_json)
+                "result": self.codec.loads(action_result.result_json)
                 if action_result.result_json
                 else None,
                 "error": action_result.error,
@@ -267,16 +504,354 @@ class StateClient:
             "timestamp": response.timestamp,
         }
 
-    def get_cycle_history(self, limit: int = 10) -> List[Dict[str, Any]]:
-        """Get history of decision cycles."""
-        request = state_pb2.CycleHistoryRequest(run_id=self.run_id, limit=limit)
-        response = self.client.GetCycleHistory(request, metadata=self.metadata)
-        # Simplify response mapping for brevity, similar to run_cycle return
-        # In a real replica, we would map all fields.
-        return [{"cycle_number": c.cycle_number} for c in response.cycles]
 
-    def delete_run(self) -> bool:
-        """Deletes the current run session."""
-        request = state_pb2.RunRequest(run_id=self.run_id)
-        response = self.client.DeleteRun(request, metadata=self.metadata)
-        return response.success
+class _RunScope:
+    """
+    Run-scoped view of a client, from `client.run(run_id)`. It sends every
+    call through the client's channel, stub, retry policy, metrics and caches;
+    only the run id differs. Views hold no other state, so any number can be
+    used from concurrent threads or tasks. Close the client, not its views.
+    """
+
+    def __init__(self, client: _CortexMethods, run_id: str):
+        self._client = client
+        self.run_id = run_id
+        self.codec = client.codec
+        self.retry_policy = client.retry_policy
+        self.deadlines = client.deadlines
+        self.metrics = client.metrics
+        self.write_behind = client.write_behind
+        self.variable_cache = client.variable_cache
+
+    def run(self, run_id: str):
+        return self._client.run(run_id)
+
+    def _invoke(
+        self, method: str, request: Any, mapper, timeout: Optional[float] = None
+    ):
+        return self._client._invoke(method, request, mapper, timeout)
+
+    def _resolved(self, result: Any):
+        return self._client._resolved(result)
+
+    def _pipeline(
+        self,
+        method: str,
+        requests: List[Any],
+        mapper,
+        timeout: Optional[float] = None,
+    ):
+        return self._client._pipeline(method, requests, mapper, timeout)
+
+
+# Methods offered by `StateClient.submit`: every call to the service.
+SUBMITTABLE = frozenset(
+    name
+    for name, member in vars(_CortexMethods).items()
+    if inspect.isfunction(member) and not name.startswith("_") and name != "set_run_id"
+)
+
+
+class StateClient(_CortexMethods):
+    """
+    Client for interacting with State (AI Memory).
+    Provides methods for managing conversational memory, drift, and skills.
+    Pass a HedgePolicy as `hedge_policy` to hedge slow reminisce calls, a
+    WriteBehind as `write_behind` to take commits off the caller's path, and a
+    VariableCache as `variable_cache` to serve repeated variable reads from memory.
+    `submit.<method>(...)` starts a call and returns a CallFuture instead of
+    waiting, so one thread can overlap several calls. `run(run_id)` returns a
+    view bound to another run that shares this client's channel.
+    """
+
+    def __init__(
+        self,
+        address: str = "localhost:50051",
+        token: Optional[str] = None,
+        run_id: str = "default",
+        codec: Union[str, JsonCodec, None] = None,
+        shared_channel: Optional[SharedChannel] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
+        write_behind: Optional[WriteBehind] = None,
+        variable_cache: Optional[VariableCache] = None,
+    ):
+        self.shared_channel = shared_channel
+        if shared_channel:
+            self.channel = shared_channel.acquire()
+        else:
+            self.channel = grpc.insecure_channel(address)
+        self.client = state_pb2_grpc.CortexStub(intercept_channel(self.channel))
+        self.metadata = []
+        if token:
+            self.metadata.append(("authorization", token))
+        self.run_id = run_id
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        if metrics:
+            self.codec = metrics.wrap_codec(self.codec)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.hedge_policy = hedge_policy
+        self.hedge_channel = None
+        self.hedge_client = None
+        if hedge_policy:
+            self.hedge_channel = grpc.insecure_channel(
+                address, options=[HEDGE_CHANNEL_OPTION]
+            )
+            self.hedge_client = state_pb2_grpc.CortexStub(
+                intercept_channel(self.hedge_channel)
+            )
+        self._ready: Optional[grpc.Future] = None
+        self.variable_cache = variable_cache
+        self.submit = Submitter(self, SUBMITTABLE)
+        self.write_behind = write_behind
+        if write_behind:
+            try:
+                write_behind.attach(self._start_commit, metrics)
+            except Exception:
+                self.write_behind = None
+                self.close()
+                raise
+
+    def start_connecting(self):
+        """Starts connecting the channel in the background without waiting."""
+        if self._ready is None:
+            self._ready = grpc.channel_ready_future(self.channel)
+
+    def wait_ready(self, timeout: Optional[float] = None):
+        """Blocks until the channel is ready; raises TimeoutError after `timeout` seconds."""
+        if self.channel is None:
+            raise RuntimeError("Not connected")
+        self.start_connecting()
+        try:
+            self._ready.result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            raise TimeoutError(f"State channel not ready after {timeout}s")
+
+    def _invoke(
+        self, method: str, request: Any, mapper, timeout: Optional[float] = None
+    ):
+        if submitting():
+            return CallFuture(self._submit(method, request, timeout), mapper)
+        with budget(self.deadlines.resolve(method, timeout)):
+            if self.metrics is None:
+                response = self.retry_policy.call(method, self._send, method, request)
+            else:
+                response = self.metrics.observe(
+                    method,
+                    self.retry_policy.call,
+                    request,
+                    method,
+                    self._send,
+                    method,
+                    request,
+                )
+        return mapper(response)
+
+    def _resolved(self, result: Any):
+        if submitting():
+            return CallFuture.resolved(result)
+        return result
+
+    def _submit(self, method: str, request: Any, timeout: Optional[float]):
+        with budget(self.deadlines.resolve(method, timeout)):
+            return start_call(
+                lambda: self._start(self.client, method, request),
+                method,
+                request,
+                self.metrics,
+            )
+
+    def _send(self, method: str, request: Any):
+        if self.hedge_client and method in self.hedge_policy.methods:
+            return self.hedge_policy.call(
+                lambda: self._start(self.client, method, request),
+                lambda: self._start(self.hedge_client, method, request),
+            )
+        return getattr(self.client, method)(
+            request, metadata=self.metadata, timeout=call_timeout()
+        )
+
+    def _pipeline(
+        self,
+        method: str,
+        requests: List[Any],
+        mapper,
+        timeout: Optional[float] = None,
+    ):
+        # Unary futures multiplex on the one channel; the batch shares one
+        # deadline, and failures are handed to `mapper` rather than raised.
+        # Each call then goes through `retry_policy` as `_invoke` would.
+        if submitting():
+            calls = [self._submit(method, request, timeout) for request in requests]
+            return CallFuture(settle(calls), mapper)
+        outcomes: List[Any] = []
+        with budget(self.deadlines.resolve(method, timeout)):
+            for i in range(0, len(requests), PIPELINE_WINDOW):
+                window = requests[i : i + PIPELINE_WINDOW]
+                started = time.perf_counter()
+                calls = []
+                for request in window:
+                    try:
+                        calls.append(self._start(self.client, method, request))
+                    except Exception as e:
+                        calls.append(e)
+                for request, call in zip(window, calls):
+                    try:
+                        call = self.retry_policy.call(
+                            method, self._settle, method, request, [call]
+                        )
+                    except Exception as e:
+                        call = e
+                    outcomes.append(call)
+                    if self.metrics is not None:
+                        failed = isinstance(call, BaseException)
+                        self.metrics.record_call(
+                            method,
+                            time.perf_counter() - started,
+                            call if failed else None,
+                            request.ByteSize(),
+                            0 if failed else call.ByteSize(),
+                        )
+        return mapper(outcomes)
+
+    def _settle(self, method: str, request: Any, started: List[Any]):
+        # One attempt of a pipelined call. The first waits for the call its
+        # window started (hedged like `_send`); retries are sent by `_send`.
+        if not started:
+            return self._send(method, request)
+        call = started.pop()
+        if isinstance(call, BaseException):
+            raise call
+        if self.hedge_client and method in self.hedge_policy.methods:
+            return self.hedge_policy.call(
+                lambda: call,
+                lambda: self._start(self.hedge_client, method, request),
+            )
+        return call.result()
+
+    def _start(self, stub: state_pb2_grpc.CortexStub, method: str, request: Any):
+        return getattr(stub, method).future(
+            request, metadata=self.metadata, timeout=call_timeout()
+        )
+
+    def run(self, run_id: str) -> "StateRun":
+        """A view of this client bound to `run_id`; see StateRun."""
+        return StateRun(self, run_id)
+
+    def watch_drift(
+        self,
+        min_interval: float = 0.25,
+        max_interval: float = 5.0,
+        backoff: float = 2.0,
+        relevance_tolerance: float = 0.0,
+        stop: Optional[threading.Event] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[DriftDelta]:
+        """
+        Yields what changed in short-term memory of the current run: items
+        added, removed, or whose relevance or content changed, matched by id.
+        The first delta holds every item present. Polls Drift, backing off
+        from `min_interval` to `max_interval` seconds while nothing changes;
+        stops when `stop` is set or the generator is closed.
+        """
+        request = state_pb2.DriftRequest(run_id=self.run_id)
+        return poll_drift(
+            lambda: self._invoke("Drift", request, _drift_result, timeout),
+            DriftTracker(relevance_tolerance),
+            min_interval,
+            max_interval,
+            backoff,
+            stop,
+        )
+
+    def _start_commit(self, trace: state_pb2.Trace):
+        with budget(self.deadlines.resolve("Commit", None)):
+            return self._start(self.client, "Commit", trace)
+
+    def flush(self, timeout: Optional[float] = None):
+        """Waits until buffered write-behind commits are sent; no-op without write-behind."""
+        if self.write_behind is not None:
+            self.write_behind.flush(timeout)
+
+    def close(self):
+        """
+        Closes the channel, or releases it if it is shared. Buffered
+        write-behind commits are drained first.
+        """
+        if self.channel is None:
+            return
+        if self.write_behind is not None:
+            self.write_behind.close()
+        if self._ready is not None:
+            self._ready.cancel()
+            self._ready = None
+        if self.shared_channel:
+            self.shared_channel.release()
+        else:
+            self.channel.close()
+        self.channel = None
+        if self.hedge_channel:
+            self.hedge_channel.close()
+            self.hedge_channel = None
+            self.hedge_client = None
+
+
+def _ack_result(response: state_pb2.Ack) -> bool:
+    return response.success
+
+
+def _focus_result(response: state_pb2.FocusResponse) -> str:
+    return response.id
+
+
+def _drift_result(response: state_pb2.DriftResponse) -> List[Any]:
+    return list(response.items)
+
+
+def _recall_result(response: state_pb2.RecallResponse) -> List[Any]:
+    return list(response.traces)
+
+
+def _trigger_result(response: state_pb2.ExecutionResult) -> int:
+    return response.result
+
+
+def _goal_result(g: state_pb2.GoalResponse) -> Dict[str, Any]:
+    return {
+        "id": g.id,
+        "description": g.description,
+        "priority": g.priority,
+        "status": g.status,
+        "parent_id": g.parent_id,
+        "created_at": g.created_at,
+    }
+
+
+def _list_goals_result(response: state_pb2.ListGoalsResponse) -> List[Dict[str, Any]]:
+    return [_goal_result(g) for g in response.goals]
+
+
+def _cycle_history_result(
+    response: state_pb2.CycleHistoryResponse,
+) -> List[Dict[str, Any]]:
+    # Simplify response mapping for brevity, similar to run_cycle return
+    # In a real replica, we would map all fields.
+    return [{"cycle_number": c.cycle_number} for c in response.cycles]
+
+
+class StateRun(_RunScope, _CortexMethods):
+    """
+    StateClient methods bound to one run; see `StateClient.run`. Creating one
+    costs a few attribute copies, so a worker can make one per request.
+    """
+
+    def __init__(self, client: StateClient, run_id: str):
+        super().__init__(client, run_id)
+        self.submit = Submitter(self, SUBMITTABLE)
+
+    # Only needs `run_id` and `_invoke`, which the view provides.
+    watch_drift = StateClient.watch_drift
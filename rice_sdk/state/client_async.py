@@ -0,0 +1,131 @@
+import asyncio
+import grpc
+from typing import List, Optional, Any, Union
+from ..codec import JsonCodec, get_codec
+from ..deadline import Deadlines, budget, call_timeout
+from ..hedge import HEDGE_CHANNEL_OPTION, HedgePolicy
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..tracing import aio_interceptors
+from .cache import VariableCache
+from .proto import state_pb2_grpc
+from .client import PIPELINE_WINDOW, _CortexMethods, _RunScope
+
+
+class AsyncStateClient(_CortexMethods):
+    """
+    asyncio client for State (AI Memory) built on a grpc.aio channel.
+    Exposes the same methods as StateClient; every RPC method returns an awaitable.
+    `run(run_id)` returns a view bound to another run that shares this channel.
+    """
+
+    def __init__(
+        self,
+        address: str = "localhost:50051",
+        token: Optional[str] = None,
+        run_id: str = "default",
+        codec: Union[str, JsonCodec, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
+        variable_cache: Optional[VariableCache] = None,
+    ):
+        self.channel = grpc.aio.insecure_channel(
+            address, interceptors=aio_interceptors()
+        )
+        self.client = state_pb2_grpc.CortexStub(self.channel)
+        self.metadata = []
+        if token:
+            self.metadata.append(("authorization", token))
+        self.run_id = run_id
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        if metrics:
+            self.codec = metrics.wrap_codec(self.codec)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.variable_cache = variable_cache
+        self.hedge_policy = hedge_policy
+        self.hedge_channel = None
+        self.hedge_client = None
+        if hedge_policy:
+            self.hedge_channel = grpc.aio.insecure_channel(
+                address,
+                options=[HEDGE_CHANNEL_OPTION],
+                interceptors=aio_interceptors(),
+            )
+            self.hedge_client = state_pb2_grpc.CortexStub(self.hedge_channel)
+
+    async def _invoke(
+        self, method: str, request: Any, mapper, timeout: Optional[float] = None
+    ):
+        with budget(self.deadlines.resolve(method, timeout)):
+            if self.metrics is None:
+                response = await self.retry_policy.call_async(
+                    method, self._send, method, request
+                )
+            else:
+                response = await self.metrics.observe_async(
+                    method,
+                    self.retry_policy.call_async,
+                    request,
+                    method,
+                    self._send,
+                    method,
+                    request,
+                )
+        return mapper(response)
+
+    async def _resolved(self, result: Any):
+        return result
+
+    async def _pipeline(
+        self,
+        method: str,
+        requests: List[Any],
+        mapper,
+        timeout: Optional[float] = None,
+    ):
+        semaphore = asyncio.Semaphore(PIPELINE_WINDOW)
+
+        async def call(request: Any):
+            async with semaphore:
+                return await self._invoke(method, request, _response, timeout)
+
+        outcomes = await asyncio.gather(
+            *(call(request) for request in requests), return_exceptions=True
+        )
+        return mapper(outcomes)
+
+    def _send(self, method: str, request: Any):
+        if self.hedge_client and method in self.hedge_policy.methods:
+            return self.hedge_policy.call_async(
+                lambda: self._send_on(self.client, method, request),
+                lambda: self._send_on(self.hedge_client, method, request),
+            )
+        return self._send_on(self.client, method, request)
+
+    def _send_on(self, stub: state_pb2_grpc.CortexStub, method: str, request: Any):
+        return getattr(stub, method)(
+            request, metadata=self.metadata, timeout=call_timeout()
+        )
+
+    def run(self, run_id: str) -> "AsyncStateRun":
+        """A view of this client bound to `run_id`; see AsyncStateRun."""
+        return AsyncStateRun(self, run_id)
+
+    async def close(self):
+        await self.channel.close()
+        if self.hedge_channel:
+            await self.hedge_channel.close()
+            self.hedge_channel = None
+            self.hedge_client = None
+
+
+class AsyncStateRun(_RunScope, _CortexMethods):
+    """AsyncStateClient methods bound to one run; see `AsyncStateClient.run`."""
+
+
+def _response(response: Any) -> Any:
+    return response
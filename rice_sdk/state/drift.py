@@ -0,0 +1,90 @@
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, NamedTuple, Optional
+
+
+class DriftDelta(NamedTuple):
+    """Changes to short-term memory (Flux) between two observations."""
+
+    added: List[Any]
+    removed: List[Any]
+    # Items whose relevance or content changed, as they are now.
+    changed: List[Any]
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+
+class DriftTracker:
+    """
+    Keeps the last seen FluxItems by id and turns each new snapshot into a
+    DriftDelta. Relevance moves of at most `relevance_tolerance` are ignored.
+    It does not care where snapshots come from, so a streaming Drift RPC can
+    feed it as well as polling.
+    """
+
+    def __init__(self, relevance_tolerance: float = 0.0):
+        self.relevance_tolerance = relevance_tolerance
+        self.items: Dict[str, Any] = {}
+
+    def update(self, items: Iterable[Any]) -> DriftDelta:
+        current = {item.id: item for item in items}
+        added, changed = [], []
+        for item_id, item in current.items():
+            seen = self.items.get(item_id)
+            if seen is None:
+                added.append(item)
+            elif (
+                abs(item.relevance - seen.relevance) > self.relevance_tolerance
+                or item.content != seen.content
+            ):
+                changed.append(item)
+            else:
+                # Keep the reference point so slow relevance creep still
+                # shows up once it exceeds the tolerance.
+                current[item_id] = seen
+        removed = [
+            item for item_id, item in self.items.items() if item_id not in current
+        ]
+        self.items = current
+        return DriftDelta(added, removed, changed)
+
+
+def poll_drift(
+    fetch: Callable[[], Iterable[Any]],
+    tracker: DriftTracker,
+    min_interval: float = 0.25,
+    max_interval: float = 5.0,
+    backoff: float = 2.0,
+    stop: Optional[threading.Event] = None,
+) -> Iterator[DriftDelta]:
+    """
+    Calls `fetch` and yields non-empty deltas. The wait between polls starts
+    at `min_interval`, grows by `backoff` after each poll without changes up
+    to `max_interval`, and drops back to `min_interval` after a change. Ends
+    when `stop` is set.
+    """
+    # Checked here rather than on the first next().
+    if min_interval <= 0 or max_interval < min_interval or backoff < 1:
+        raise ValueError("need 0 < min_interval <= max_interval and backoff >= 1")
+    return _poll(
+        fetch, tracker, min_interval, max_interval, backoff, stop or threading.Event()
+    )
+
+
+def _poll(
+    fetch: Callable[[], Iterable[Any]],
+    tracker: DriftTracker,
+    min_interval: float,
+    max_interval: float,
+    backoff: float,
+    stop: threading.Event,
+) -> Iterator[DriftDelta]:
+    interval = min_interval
+    while not stop.is_set():
+        delta = tracker.update(fetch())
+        if delta:
+            interval = min_interval
+            yield delta
+        else:
+            interval = min(interval * backoff, max_interval)
+        stop.wait(interval)
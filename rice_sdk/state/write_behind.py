@@ -0,0 +1,229 @@
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+from ..metrics import Metrics
+
+OVERFLOW_POLICIES = ("block", "drop", "raise")
+
+
+class CommitQueueFull(RuntimeError):
+    """Raised by `commit` when the write-behind buffer is full (overflow="raise",
+    or "block" after `block_timeout`)."""
+
+
+class WriteBehind:
+    """
+    Write-behind buffering for StateClient.commit. `commit` enqueues the trace
+    and returns at once; a background thread sends the buffer when
+    `batch_size` traces are waiting or the oldest has waited `flush_interval`
+    seconds. A flush starts up to `max_in_flight` Commit calls at a time on the
+    channel (1 keeps commits strictly in order).
+
+    When `max_pending` traces are buffered, `overflow` decides what `commit`
+    does: "block" waits for room (raising CommitQueueFull after
+    `block_timeout`), "drop" discards the trace and returns False, "raise"
+    raises CommitQueueFull. Commits that fail or are not acknowledged are
+    passed to `on_error(trace, error)` on the worker thread. `flush()` waits
+    for everything buffered so far; closing the client drains the buffer for
+    up to `drain_timeout` seconds and detaches it, so the next client (e.g.
+    after `Client.connect()` again) can attach it.
+    """
+
+    def __init__(
+        self,
+        max_pending: int = 1000,
+        batch_size: int = 32,
+        flush_interval: float = 0.05,
+        max_in_flight: int = 8,
+        overflow: str = "block",
+        block_timeout: Optional[float] = None,
+        drain_timeout: Optional[float] = None,
+        on_error: Optional[Callable[[Any, BaseException], None]] = None,
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        if max_pending < 1 or batch_size < 1 or max_in_flight < 1:
+            raise ValueError(
+                "max_pending, batch_size and max_in_flight must be at least 1"
+            )
+        self.max_pending = max_pending
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_in_flight = max_in_flight
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.drain_timeout = drain_timeout
+        self.on_error = on_error
+        self._cond = threading.Condition()
+        self._pending: Deque[Tuple[Any, float]] = deque()
+        self._enqueued = 0
+        self._completed = 0
+        self._sent = 0
+        self._failed = 0
+        self._dropped = 0
+        self._flushing = 0
+        self._closed = False
+        self._attached = False
+        self._start: Optional[Callable[[Any], Any]] = None
+        self._metrics: Optional[Metrics] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def attach(self, start: Callable[[Any], Any], metrics: Optional[Metrics] = None):
+        """
+        Binds the buffer to a client and starts the worker. `start(trace)`
+        sends one Commit and returns a future of its Ack.
+        """
+        with self._cond:
+            if self._attached:
+                raise RuntimeError("WriteBehind is already attached to a client")
+            self._attached = True
+            self._closed = False
+            self._start = start
+            self._metrics = metrics
+            if self._thread is not None:
+                # The worker is still draining the previous client; it carries
+                # on with this one.
+                self._cond.notify_all()
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="rice-commit-writer", daemon=True
+            )
+            self._thread.start()
+
+    def put(self, trace: Any) -> bool:
+        """Buffers `trace`; False if it was dropped because the buffer is full."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Write-behind buffer is closed")
+            if len(self._pending) >= self.max_pending:
+                if self.overflow == "drop":
+                    self._dropped += 1
+                    return False
+                if self.overflow == "raise" or not self._cond.wait_for(
+                    lambda: len(self._pending) < self.max_pending or self._closed,
+                    self.block_timeout,
+                ):
+                    raise CommitQueueFull(
+                        f"{len(self._pending)} commits already pending"
+                    )
+                if self._closed:
+                    raise RuntimeError("Write-behind buffer is closed")
+            self._pending.append((trace, time.monotonic()))
+            self._enqueued += 1
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+        return True
+
+    def flush(self, timeout: Optional[float] = None):
+        """Sends everything buffered so far and waits until it is acknowledged
+        or failed; raises TimeoutError after `timeout` seconds."""
+        with self._cond:
+            target = self._enqueued
+            self._flushing += 1
+            self._cond.notify_all()
+            try:
+                if not self._cond.wait_for(lambda: self._completed >= target, timeout):
+                    raise TimeoutError(
+                        f"{target - self._completed} commits still pending "
+                        f"after {timeout}s"
+                    )
+            finally:
+                self._flushing -= 1
+
+    def close(self, timeout: Optional[float] = None):
+        """Stops accepting commits, drains the buffer and detaches it from its
+        client; waits up to `timeout` seconds (default `drain_timeout`) for the
+        worker to finish."""
+        with self._cond:
+            self._closed = True
+            self._attached = False
+            thread = self._thread
+            self._cond.notify_all()
+        if thread is not None:
+            thread.join(self.drain_timeout if timeout is None else timeout)
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return {
+                "pending": len(self._pending),
+                "sent": self._sent,
+                "failed": self._failed,
+                "dropped": self._dropped,
+            }
+
+    def _next_batch(self) -> Optional[List[Any]]:
+        # Waits until a batch is due; None once closed and drained.
+        with self._cond:
+            while True:
+                if self._pending:
+                    due = self._pending[0][1] + self.flush_interval
+                    wait = due - time.monotonic()
+                    if (
+                        len(self._pending) >= self.batch_size
+                        or self._flushing
+                        or self._closed
+                        or wait <= 0
+                    ):
+                        break
+                    self._cond.wait(wait)
+                elif self._closed:
+                    self._thread = None
+                    return None
+                else:
+                    self._cond.wait()
+            count = min(self.batch_size, len(self._pending))
+            batch = [self._pending.popleft()[0] for _ in range(count)]
+            self._cond.notify_all()
+            return batch
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            for i in range(0, len(batch), self.max_in_flight):
+                self._send(batch[i : i + self.max_in_flight])
+            with self._cond:
+                self._completed += len(batch)
+                self._cond.notify_all()
+
+    def _send(self, traces: List[Any]):
+        started = time.perf_counter()
+        calls = []
+        for trace in traces:
+            try:
+                calls.append((trace, self._start(trace), None))
+            except Exception as e:
+                calls.append((trace, None, e))
+        for trace, future, error in calls:
+            response = None
+            if future is not None:
+                try:
+                    response = future.result()
+                    if not response.success:
+                        error = RuntimeError("Commit was not acknowledged")
+                except Exception as e:
+                    error = e
+            if self._metrics is not None:
+                self._metrics.record_call(
+                    "Commit",
+                    time.perf_counter() - started,
+                    error,
+                    trace.ByteSize(),
+                    response.ByteSize() if response is not None else 0,
+                )
+            self._finish(trace, error)
+
+    def _finish(self, trace: Any, error: Optional[BaseException]):
+        with self._cond:
+            if error is None:
+                self._sent += 1
+            else:
+                self._failed += 1
+        if error is not None and self.on_error is not None:
+            try:
+                self.on_error(trace, error)
+            except Exception:
+                # A failing callback must not stop the worker.
+                pass
@@ -1,3 +1,27 @@
-from .client import RiceDBClient
-from .client_grpc import GrpcClient
-from .client_http import HttpClient
+from typing import TYPE_CHECKING
+from ..lazy import lazy_exports
+
+_EXPORTS = {
+    "RiceDBClient": ".client",
+    "AsyncRiceDBClient": ".client_async",
+    "GrpcClient": ".client_grpc",
+    "AsyncGrpcClient": ".client_grpc_async",
+    "HttpClient": ".client_http",
+    "BatchNotSupportedError": ".batch",
+    "SearchResult": ".results",
+    "SearchResults": ".results",
+    "SearchCache": ".cache",
+}
+
+__all__ = list(_EXPORTS)
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:
+    from .client import RiceDBClient
+    from .client_async import AsyncRiceDBClient
+    from .client_grpc import GrpcClient
+    from .client_grpc_async import AsyncGrpcClient
+    from .client_http import HttpClient
+    from .batch import BatchNotSupportedError
+    from .results import SearchResult, SearchResults
+    from .cache import SearchCache
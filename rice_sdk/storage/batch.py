@@ -0,0 +1,149 @@
+import contextvars
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Union
+from ..lazy import grpc_status, loaded
+from .utils import BatchSummary
+
+UNSUPPORTED_HTTP_STATUSES = {404, 405, 501}
+
+if TYPE_CHECKING:
+    from ..retry import RetryPolicy
+
+
+class BatchNotSupportedError(RuntimeError):
+    """
+    Raised by a transport when the server has no batch insert endpoint.
+    `chunk` holds the items of the rejected first chunk so the caller can
+    resend them through unary inserts.
+    """
+
+    def __init__(self, message: str, chunk: List[Dict[str, Any]]):
+        super().__init__(message)
+        self.chunk = chunk
+
+
+def batch_unsupported(error: BaseException) -> bool:
+    """True when the server rejected a batch call because it does not implement it."""
+    code = grpc_status(error)
+    if code is not None:
+        return code == "UNIMPLEMENTED"
+    requests = loaded("requests")
+    if requests is None:
+        return False
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code in UNSUPPORTED_HTTP_STATUSES
+    return False
+
+
+def _insert_args(item: Dict[str, Any], user_id: Union[int, str]) -> tuple:
+    return (
+        item["nodeId"],
+        item["text"],
+        item.get("metadata", {}),
+        user_id,
+        item.get("sessionId"),
+        item.get("embedding"),
+    )
+
+
+def _keyed_inserts(policy: Optional["RetryPolicy"]) -> Optional["RetryPolicy"]:
+    # An insert with an explicit node id overwrites that node, so sending it
+    # again is safe. None when `insert` already retries Insert by itself.
+    if policy is None or "Insert" in policy.idempotent_methods:
+        return None
+    return policy.with_idempotent("Insert")
+
+
+def _insert(
+    insert: Callable, item: Dict[str, Any], user_id, policy: Optional["RetryPolicy"]
+) -> Dict[str, Any]:
+    if policy is None:
+        return insert(*_insert_args(item, user_id))
+    return policy.call("Insert", insert, *_insert_args(item, user_id))
+
+
+async def _insert_async(
+    insert: Callable, item: Dict[str, Any], user_id, policy: Optional["RetryPolicy"]
+) -> Dict[str, Any]:
+    if policy is None:
+        return await insert(*_insert_args(item, user_id))
+    return await policy.call_async("Insert", insert, *_insert_args(item, user_id))
+
+
+def _summarize(outcomes: List[tuple]) -> Dict[str, Any]:
+    summary = BatchSummary()
+    for item, outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            summary.add_item_error(item.get("nodeId"), outcome)
+        else:
+            summary.add_chunk(1, [outcome["nodeId"]], [])
+    return summary.result()
+
+
+def fan_out_insert(
+    insert: Callable,
+    items: Iterable[Dict[str, Any]],
+    user_id: Union[int, str] = 1,
+    max_in_flight: int = 8,
+    retry_policy: Optional["RetryPolicy"] = None,
+) -> Dict[str, Any]:
+    """
+    Runs unary `insert` calls on a thread pool with at most `max_in_flight`
+    outstanding. Every item carries its node id, so an insert sent twice just
+    overwrites the same node: failed inserts are retried under `retry_policy`
+    (the client's) as if Insert were idempotent, sharing its backoff, budget
+    and stats. Without a policy each insert is attempted once. `nodeIds` and `errors` in the summary follow the input order. Each insert
+    runs in a copy of the caller's context, so an enclosing `budget` applies.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    policy = _keyed_inserts(retry_policy)
+    submitted = []
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        pending = set()
+        for item in items:
+            if len(pending) >= max_in_flight:
+                _, pending = wait(pending, return_when=FIRST_COMPLETED)
+            future = pool.submit(
+                contextvars.copy_context().run,
+                _insert,
+                insert,
+                item,
+                user_id,
+                policy,
+            )
+            pending.add(future)
+            submitted.append((item, future))
+
+    return _summarize([(item, f.exception() or f.result()) for item, f in submitted])
+
+
+async def fan_out_insert_async(
+    insert: Callable,
+    items: Iterable[Dict[str, Any]],
+    user_id: Union[int, str] = 1,
+    max_in_flight: int = 8,
+    retry_policy: Optional["RetryPolicy"] = None,
+) -> Dict[str, Any]:
+    """
+    asyncio counterpart of fan_out_insert: tasks are created only while fewer
+    than `max_in_flight` are running.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+    import asyncio
+
+    policy = _keyed_inserts(retry_policy)
+    semaphore = asyncio.Semaphore(max_in_flight)
+    submitted = []
+    for item in items:
+        await semaphore.acquire()
+        task = asyncio.ensure_future(_insert_async(insert, item, user_id, policy))
+        task.add_done_callback(lambda _: semaphore.release())
+        submitted.append((item, task))
+
+    outcomes = await asyncio.gather(
+        *(task for _, task in submitted), return_exceptions=True
+    )
+    return _summarize([(item, o) for (item, _), o in zip(submitted, outcomes)])
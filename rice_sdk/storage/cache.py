@@ -0,0 +1,165 @@
+import hashlib
+import json
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Set, Tuple
+from ..vectors import Vector, _float32_bytes
+from .results import SearchResults
+from .utils import to_long
+
+
+class _Entry:
+    __slots__ = ("results", "expires_at", "user_id", "node_ids")
+
+    def __init__(self, results: SearchResults, expires_at: float, user_id: int):
+        self.results = results
+        self.expires_at = expires_at
+        self.user_id = user_id
+        self.node_ids = {r.id for r in results}
+
+
+class SearchCache:
+    """
+    In-process LRU cache with a TTL for RiceDBClient.search results.
+
+    Entries are keyed on the normalized query, user, k, session, filter and a
+    hash of the query embedding. Results are copied in and out, so callers can
+    modify what they get without touching the cache. Writes through the owning client invalidate
+    what they can affect: inserts drop every entry of that user, and deletes
+    drop every entry whose results contain the deleted node. Counters are
+    available from `stats()`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._by_user: Dict[int, Set[Hashable]] = {}
+        self._by_node: Dict[Any, Set[Hashable]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(
+        query: str,
+        user_id: Any,
+        k: int,
+        session_id: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[Vector] = None,
+    ) -> Tuple:
+        filter_key = (
+            json.dumps(filter_dict, sort_keys=True, default=str) if filter_dict else ""
+        )
+        return (
+            query,
+            to_long(user_id),
+            k,
+            session_id or "",
+            filter_key,
+            _embedding_digest(query_embedding),
+        )
+
+    def get(self, key: Hashable) -> Optional[SearchResults]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry.expires_at <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.results.copy()
+
+    def put(self, key: Hashable, results: SearchResults):
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            entry = _Entry(
+                SearchResults(results).copy(), self._clock() + self.ttl, key[1]
+            )
+            self._entries[key] = entry
+            self._by_user.setdefault(entry.user_id, set()).add(key)
+            for node_id in entry.node_ids:
+                self._by_node.setdefault(node_id, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: Any):
+        with self._lock:
+            for key in list(self._by_user.get(to_long(user_id), ())):
+                self._remove(key)
+                self.invalidations += 1
+
+    def invalidate_node(self, node_id: Any, session_id: Optional[str] = None):
+        with self._lock:
+            keys = set(self._by_node.get(to_long(node_id), ()))
+            if session_id:
+                keys.update(k for k in self._entries if k[3] == session_id)
+            for key in keys:
+                self._remove(key)
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._by_user.clear()
+            self._by_node.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+    def _remove(self, key: Hashable):
+        entry = self._entries.pop(key)
+        _discard(self._by_user, entry.user_id, key)
+        for node_id in entry.node_ids:
+            _discard(self._by_node, node_id, key)
+
+
+def _discard(index: Dict[Any, Set[Hashable]], value: Any, key: Hashable):
+    keys = index.get(value)
+    if keys is not None:
+        keys.discard(key)
+        if not keys:
+            del index[value]
+
+
+def _embedding_digest(vector: Optional[Vector]) -> str:
+    if vector is None:
+        return ""
+    data = None
+    if not isinstance(vector, (list, tuple)):
+        data = _float32_bytes(vector)
+    if data is None:
+        data = array("f", vector).tobytes()
+    if not data:
+        return ""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
@@ -1,12 +1,27 @@
-from typing import Union, Optional, List, Dict, Any
-from .client_grpc import GrpcClient
-from .client_http import HttpClient
+from itertools import chain
+from typing import TYPE_CHECKING, Union, Optional, List, Dict, Any, Iterable
+from .results import SearchResults
+from ..channel import SharedChannel
+from ..codec import JsonCodec
+from ..deadline import Deadlines, budget
+from ..hedge import HedgePolicy
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..vectors import Vector
+from .cache import SearchCache
+from .batch import BatchNotSupportedError, fan_out_insert
+
+if TYPE_CHECKING:
+    from .client_grpc import GrpcClient
+    from .client_http import HttpClient
 
 
 class RiceDBClient:
     """
     Client for RiceDB (Persistent Semantic Database).
     Supports both gRPC and HTTP transports.
+    Pass a SearchCache as `search_cache` to serve repeated searches from memory.
+    Pass a HedgePolicy as `hedge_policy` to hedge slow gRPC searches.
     """
 
     def __init__(
@@ -16,34 +31,77 @@ class RiceDBClient:
         grpc_port: int = 50051,
         http_port: int = 3000,
         token: Optional[str] = None,
+        codec: Union[str, JsonCodec, None] = None,
+        search_cache: Optional[SearchCache] = None,
+        shared_channel: Optional[SharedChannel] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
     ):
         self.host = host
         self.transport = transport
         self.grpc_port = grpc_port
         self.http_port = http_port
         self.token = token
-        self.client: Union[GrpcClient, HttpClient, None] = None
+        self.codec = codec
+        self.search_cache = search_cache
+        self.shared_channel = shared_channel
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.hedge_policy = hedge_policy
+        self.metrics = metrics
+        self.client: Union["GrpcClient", "HttpClient", None] = None
         self.connected = False
+        # None until a batch call tells us; False routes batches to unary fan-out.
+        self.batch_supported: Optional[bool] = None
+
+    def _grpc_client(self) -> "GrpcClient":
+        from .client_grpc import GrpcClient
+
+        return GrpcClient(
+            self.host,
+            self.grpc_port,
+            self.token,
+            self.codec,
+            self.shared_channel,
+            self.retry_policy,
+            self.deadlines,
+            self.hedge_policy,
+            self.metrics,
+        )
+
+    def _http_client(self) -> "HttpClient":
+        from .client_http import HttpClient
+
+        return HttpClient(
+            self.host,
+            self.http_port,
+            self.token,
+            codec=self.codec,
+            retry_policy=self.retry_policy,
+            deadlines=self.deadlines,
+            metrics=self.metrics,
+        )
 
     def connect(self) -> bool:
+        # Transports are imported here, so only the one in use loads grpc or
+        # requests.
+        self.batch_supported = None
         if self.transport == "grpc":
-            self.client = GrpcClient(self.host, self.grpc_port, self.token)
-            self.connected = self.client.connect()
-            return self.connected
+            self.client = self._grpc_client()
         elif self.transport == "http":
-            self.client = HttpClient(self.host, self.http_port, self.token)
-            self.connected = self.client.connect()
-            return self.connected
+            self.client = self._http_client()
         else:  # auto
             try:
-                self.client = GrpcClient(self.host, self.grpc_port, self.token)
+                self.client = self._grpc_client()
                 self.connected = self.client.connect()
                 return self.connected
             except Exception as e:
                 # Fallback to HTTP
-                self.client = HttpClient(self.host, self.http_port, self.token)
-                self.connected = self.client.connect()
-                return self.connected
+                self.client = self._http_client()
+        self.connected = self.client.connect()
+        return self.connected
 
     def disconnect(self):
         if self.client:
@@ -51,13 +109,18 @@ class RiceDBClient:
             self.client = None
         self.connected = False
 
+    def wait_ready(self, timeout: Optional[float] = None):
+        """Blocks until the transport is ready; raises TimeoutError after `timeout` seconds."""
+        self._check_connected()
+        self.client.wait_ready(timeout)
+
     def _check_connected(self):
         if not self.client or not self.connected:
             raise RuntimeError("Not connected")
 
-    def health(self) -> Dict[str, str]:
+    def health(self, timeout: Optional[float] = None) -> Dict[str, str]:
         self._check_connected()
-        return self.client.health()
+        return self.client.health(timeout=timeout)
 
     def insert(
         self,
@@ -66,38 +129,59 @@ class RiceDBClient:
         metadata: Optional[Dict[str, Any]] = None,
         user_id: Union[int, str] = 1,
         session_id: Optional[str] = None,
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         self._check_connected()
-        return self.client.insert(
-            node_id, text, metadata or {}, user_id, session_id, embedding
-        )
+        try:
+            return self.client.insert(
+                node_id,
+                text,
+                metadata or {},
+                user_id,
+                session_id,
+                embedding,
+                timeout=timeout,
+            )
+        finally:
+            if self.search_cache:
+                self.search_cache.invalidate_user(user_id)
 
     def batch_insert(
-        self, items: List[Dict[str, Any]], user_id: Union[int, str] = 1
+        self,
+        items: Iterable[Dict[str, Any]],
+        user_id: Union[int, str] = 1,
+        chunk_size: int = 1000,
+        max_in_flight: int = 8,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """
         Batch insert items.
         Items should be a list of dicts with: nodeId, text, metadata, embedding (optional).
+        Items are sent in chunks of `chunk_size`: over gRPC each chunk is one
+        BatchInsert stream, over HTTP one streamed NDJSON request. If the server
+        has no batch endpoint, items fall back to unary inserts with up to
+        `max_in_flight` running concurrently. `timeout` bounds the whole call.
         """
         self._check_connected()
-        success_count = 0
-        errors = []
-        for item in items:
-            try:
-                self.client.insert(
-                    item["nodeId"],
-                    item["text"],
-                    item.get("metadata", {}),
-                    user_id,
-                    item.get("sessionId"),
-                    item.get("embedding"),
-                )
-                success_count += 1
-            except Exception as e:
-                errors.append(str(e))
+        try:
+            with budget(timeout):
+                return self._batch_insert(items, user_id, chunk_size, max_in_flight)
+        finally:
+            if self.search_cache:
+                self.search_cache.invalidate_user(user_id)
 
-        return {"totalInserted": success_count, "failed": len(errors), "errors": errors}
+    def _batch_insert(self, items, user_id, chunk_size, max_in_flight):
+        items = iter(items)
+        if self.batch_supported is not False:
+            try:
+                return self.client.batch_insert(items, user_id, chunk_size)
+            except BatchNotSupportedError as e:
+                self.batch_supported = False
+                items = chain(e.chunk, items)
+        return fan_out_insert(
+            self.client.insert, items, user_id, max_in_flight, self.retry_policy
+        )
 
     def search(
         self,
@@ -106,21 +190,46 @@ class RiceDBClient:
         k: int = 10,
         session_id: Optional[str] = None,
         filter_dict: Optional[Dict[str, Any]] = None,
-        query_embedding: Optional[List[float]] = None,
-    ) -> List[Dict[str, Any]]:
+        query_embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
         self._check_connected()
-        return self.client.search(
+        if not self.search_cache:
+            return self.client.search(
+                query, user_id, k, session_id, filter_dict, query_embedding, timeout
+            )
+
+        key = self.search_cache.make_key(
             query, user_id, k, session_id, filter_dict, query_embedding
         )
+        results = self.search_cache.get(key)
+        if results is None:
+            results = self.client.search(
+                query, user_id, k, session_id, filter_dict, query_embedding, timeout
+            )
+            self.search_cache.put(key, results)
+        return results
 
     def delete(
-        self, node_id: Union[int, str], session_id: Optional[str] = None
+        self,
+        node_id: Union[int, str],
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
         self._check_connected()
-        return self.client.delete(node_id, session_id)
+        try:
+            return self.client.delete(node_id, session_id, timeout=timeout)
+        finally:
+            if self.search_cache:
+                self.search_cache.invalidate_node(node_id, session_id)
 
-    def login(self, username: str, password: str) -> str:
+    def login(
+        self, username: str, password: str, timeout: Optional[float] = None
+    ) -> str:
         self._check_connected()
-        token = self.client.login(username, password)
+        token = self.client.login(username, password, timeout=timeout)
         self.token = token
+        if self.search_cache:
+            # Results may depend on who is asking.
+            self.search_cache.clear()
         return token
@@ -0,0 +1,189 @@
+from itertools import chain
+from typing import Optional, List, Dict, Any, Union, Iterable
+from .results import SearchResults
+from ..codec import JsonCodec
+from ..deadline import Deadlines, budget
+from ..hedge import HedgePolicy
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..vectors import Vector
+from .cache import SearchCache
+from .batch import BatchNotSupportedError, fan_out_insert_async
+from .client_grpc_async import AsyncGrpcClient
+
+
+class AsyncRiceDBClient:
+    """
+    asyncio client for RiceDB (Persistent Semantic Database).
+    Mirrors RiceDBClient; only the gRPC transport is available.
+    Pass a SearchCache as `search_cache` to serve repeated searches from memory.
+    Pass a HedgePolicy as `hedge_policy` to hedge slow gRPC searches.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        grpc_port: int = 50051,
+        token: Optional[str] = None,
+        codec: Union[str, JsonCodec, None] = None,
+        search_cache: Optional[SearchCache] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        self.host = host
+        self.transport = "grpc"
+        self.grpc_port = grpc_port
+        self.token = token
+        self.codec = codec
+        self.search_cache = search_cache
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.hedge_policy = hedge_policy
+        self.metrics = metrics
+        self.client: Optional[AsyncGrpcClient] = None
+        self.connected = False
+        # None until a batch call tells us; False routes batches to unary fan-out.
+        self.batch_supported: Optional[bool] = None
+
+    async def connect(self) -> bool:
+        self.batch_supported = None
+        self.client = AsyncGrpcClient(
+            self.host,
+            self.grpc_port,
+            self.token,
+            self.codec,
+            self.retry_policy,
+            self.deadlines,
+            self.hedge_policy,
+            self.metrics,
+        )
+        self.connected = await self.client.connect()
+        return self.connected
+
+    async def disconnect(self):
+        if self.client:
+            await self.client.disconnect()
+            self.client = None
+        self.connected = False
+
+    def _check_connected(self):
+        if not self.client or not self.connected:
+            raise RuntimeError("Not connected")
+
+    async def health(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        self._check_connected()
+        return await self.client.health(timeout=timeout)
+
+    async def insert(
+        self,
+        node_id: Union[int, str],
+        text: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        user_id: Union[int, str] = 1,
+        session_id: Optional[str] = None,
+        embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        self._check_connected()
+        try:
+            return await self.client.insert(
+                node_id,
+                text,
+                metadata or {},
+                user_id,
+                session_id,
+                embedding,
+                timeout=timeout,
+            )
+        finally:
+            if self.search_cache:
+                self.search_cache.invalidate_user(user_id)
+
+    async def batch_insert(
+        self,
+        items: Iterable[Dict[str, Any]],
+        user_id: Union[int, str] = 1,
+        chunk_size: int = 1000,
+        max_in_flight: int = 8,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Batch insert items.
+        Items should be dicts with: nodeId, text, metadata, embedding (optional).
+        If the server does not implement BatchInsert, items fall back to unary
+        inserts with up to `max_in_flight` running concurrently.
+        """
+        self._check_connected()
+        try:
+            with budget(timeout):
+                return await self._batch_insert(
+                    items, user_id, chunk_size, max_in_flight
+                )
+        finally:
+            if self.search_cache:
+                self.search_cache.invalidate_user(user_id)
+
+    async def _batch_insert(self, items, user_id, chunk_size, max_in_flight):
+        items = iter(items)
+        if self.batch_supported is not False:
+            try:
+                return await self.client.batch_insert(items, user_id, chunk_size)
+            except BatchNotSupportedError as e:
+                self.batch_supported = False
+                items = chain(e.chunk, items)
+        return await fan_out_insert_async(
+            self.client.insert, items, user_id, max_in_flight, self.retry_policy
+        )
+
+    async def search(
+        self,
+        query: str,
+        user_id: Union[int, str] = 1,
+        k: int = 10,
+        session_id: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
+        self._check_connected()
+        if not self.search_cache:
+            return await self.client.search(
+                query, user_id, k, session_id, filter_dict, query_embedding, timeout
+            )
+
+        key = self.search_cache.make_key(
+            query, user_id, k, session_id, filter_dict, query_embedding
+        )
+        results = self.search_cache.get(key)
+        if results is None:
+            results = await self.client.search(
+                query, user_id, k, session_id, filter_dict, query_embedding, timeout
+            )
+            self.search_cache.put(key, results)
+        return results
+
+    async def delete(
+        self,
+        node_id: Union[int, str],
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        self._check_connected()
+        try:
+            return await self.client.delete(node_id, session_id, timeout=timeout)
+        finally:
+            if self.search_cache:
+                self.search_cache.invalidate_node(node_id, session_id)
+
+    async def login(
+        self, username: str, password: str, timeout: Optional[float] = None
+    ) -> str:
+        self._check_connected()
+        token = await self.client.login(username, password, timeout=timeout)
+        self.token = token
+        if self.search_cache:
+            # Results may depend on who is asking.
+            self.search_cache.clear()
+        return token
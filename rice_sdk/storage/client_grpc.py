@@ -1,59 +1,164 @@
 import grpc
-import json
-from typing import Optional, List, Dict, Any, Union
+from typing import Optional, List, Dict, Any, Union, Iterable, Iterator
+from ..channel import SharedChannel
+from ..codec import JsonCodec, get_codec
+from ..deadline import Deadlines, budget, call_timeout
+from ..futures import CallFuture, Submitter, start_call, submitting
+from ..hedge import HEDGE_CHANNEL_OPTION, HedgePolicy
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..tracing import intercept_channel
+from ..vectors import Vector, set_vector
 from .proto import ricedb_pb2, ricedb_pb2_grpc
-from .utils import to_long
+from .results import SearchResults, SearchResult
+from .utils import to_long, chunked, BatchSummary
+from .batch import BatchNotSupportedError, batch_unsupported
+
+CHANNEL_OPTIONS = [
+    ("grpc.max_send_message_length", 50 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 50 * 1024 * 1024),
+]
+
+
+# Methods offered by `GrpcClient.submit`.
+SUBMITTABLE = frozenset({"health", "insert", "search", "delete", "login"})
 
 
 class GrpcClient:
+    """
+    RiceDB client over gRPC. `submit.<method>(...)` starts a unary call and
+    returns a CallFuture instead of waiting, so one thread can overlap several
+    calls; `batch_insert` streams and is not offered there.
+    """
+
     def __init__(
-        self, host: str = "localhost", port: int = 50051, token: Optional[str] = None
+        self,
+        host: str = "localhost",
+        port: int = 50051,
+        token: Optional[str] = None,
+        codec: Union[str, JsonCodec, None] = None,
+        shared_channel: Optional[SharedChannel] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
     ):
         self.host = host
         self.port = port
         self.token = token
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        if metrics:
+            self.codec = metrics.wrap_codec(self.codec)
+        self.shared_channel = shared_channel
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.hedge_policy = hedge_policy
         self.client = None
         self.channel = None
+        self.hedge_client = None
+        self.hedge_channel = None
         self.connected = False
+        self.submit = Submitter(self, SUBMITTABLE)
 
     def connect(self) -> bool:
-        address = f"{self.host}:{self.port}"
-        self.channel = grpc.insecure_channel(
-            address,
-            options=[
-                ("grpc.max_send_message_length", 50 * 1024 * 1024),
-                ("grpc.max_receive_message_length", 50 * 1024 * 1024),
-            ],
-        )
-        self.client = ricedb_pb2_grpc.RiceDBStub(self.channel)
+        if self.shared_channel:
+            self.channel = self.shared_channel.acquire()
+        else:
+            address = f"{self.host}:{self.port}"
+            self.channel = grpc.insecure_channel(address, options=CHANNEL_OPTIONS)
+        self.client = ricedb_pb2_grpc.RiceDBStub(intercept_channel(self.channel))
+        if self.hedge_policy:
+            self.hedge_channel = grpc.insecure_channel(
+                f"{self.host}:{self.port}",
+                options=CHANNEL_OPTIONS + [HEDGE_CHANNEL_OPTION],
+            )
+            self.hedge_client = ricedb_pb2_grpc.RiceDBStub(
+                intercept_channel(self.hedge_channel)
+            )
 
         try:
             self.health()
             self.connected = True
             return True
         except Exception as e:
-            self.connected = False
+            self.disconnect()
             raise e
 
     def disconnect(self):
         if self.channel:
-            self.channel.close()
+            if self.shared_channel:
+                self.shared_channel.release()
+            else:
+                self.channel.close()
+            self.channel = None
+        if self.hedge_channel:
+            self.hedge_channel.close()
+            self.hedge_channel = None
         self.client = None
+        self.hedge_client = None
         self.connected = False
 
+    def wait_ready(self, timeout: Optional[float] = None):
+        """Blocks until the channel is ready; raises TimeoutError after `timeout` seconds."""
+        if not self.channel:
+            raise RuntimeError("Not connected")
+        try:
+            grpc.channel_ready_future(self.channel).result(timeout=timeout)
+        except grpc.FutureTimeoutError:
+            raise TimeoutError(
+                f"RiceDB channel {self.host}:{self.port} not ready after {timeout}s"
+            )
+
     def _get_metadata(self):
-        metadata = []
-        if self.token:
-            metadata.append(("authorization", f"Bearer {self.token}"))
-        return metadata
+        return _auth_metadata(self.token)
 
-    def health(self) -> Dict[str, str]:
+    def _call(self, method: str, request: Any, timeout: Optional[float], mapper=None):
+        # `timeout` (or the method's default deadline) caps every attempt,
+        # retries included, and is itself capped by any enclosing `budget`.
+        # From `submit`, the call is started and a CallFuture returned.
+        with budget(self.deadlines.resolve(method, timeout)):
+            if submitting():
+                future = start_call(
+                    lambda: self._start(self.client, method, request),
+                    method,
+                    request,
+                    self.metrics,
+                )
+                return CallFuture(future, mapper or _identity)
+            if self.metrics is None:
+                response = self.retry_policy.call(method, self._send, method, request)
+            else:
+                response = self.metrics.observe(
+                    method,
+                    self.retry_policy.call,
+                    request,
+                    method,
+                    self._send,
+                    method,
+                    request,
+                )
+        return mapper(response) if mapper else response
+
+    def _send(self, method: str, request: Any):
+        if self.hedge_client and method in self.hedge_policy.methods:
+            return self.hedge_policy.call(
+                lambda: self._start(self.client, method, request),
+                lambda: self._start(self.hedge_client, method, request),
+            )
+        return getattr(self.client, method)(
+            request, metadata=self._get_metadata(), timeout=call_timeout()
+        )
+
+    def _start(self, stub: ricedb_pb2_grpc.RiceDBStub, method: str, request: Any):
+        return getattr(stub, method).future(
+            request, metadata=self._get_metadata(), timeout=call_timeout()
+        )
+
+    def health(self, timeout: Optional[float] = None) -> Dict[str, str]:
         if not self.client:
             raise RuntimeError("Not connected")
-        res = self.client.Health(
-            ricedb_pb2.HealthRequest(), metadata=self._get_metadata()
-        )
-        return {"status": res.status, "version": res.version}
+        return self._call("Health", ricedb_pb2.HealthRequest(), timeout, _health_result)
 
     def insert(
         self,
@@ -62,27 +167,55 @@ class GrpcClient:
         metadata: Dict[str, Any],
         user_id: Union[int, str] = 1,
         session_id: Optional[str] = None,
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         if not self.client:
             raise RuntimeError("Not connected")
 
-        # Automatically store text in metadata so it can be retrieved
-        meta = metadata.copy()
-        if text and "stored_text" not in meta:
-            meta["stored_text"] = text
-
-        req = ricedb_pb2.InsertRequest(
-            id=to_long(node_id),
-            text=text,
-            metadata=json.dumps(meta).encode("utf-8"),
-            userId=to_long(user_id),
-            sessionId=session_id,
-            embedding=embedding or [],
+        req = _insert_request(
+            node_id, text, metadata, user_id, session_id, embedding, self.codec
         )
+        return self._call("Insert", req, timeout, _insert_result)
+
+    def batch_insert(
+        self,
+        items: Iterable[Dict[str, Any]],
+        user_id: Union[int, str] = 1,
+        chunk_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Inserts items over the client-streaming BatchInsert RPC.
+        Items are sent in chunks of `chunk_size`, one stream per chunk. Requests
+        are built lazily as gRPC pulls them, so flow control on the stream
+        throttles how fast `items` is consumed. A failed chunk is reported in
+        `errors` and the remaining chunks are still sent. If the server does not
+        implement BatchInsert, BatchNotSupportedError carries the first chunk back.
+        """
+        if not self.client:
+            raise RuntimeError("Not connected")
 
-        res = self.client.Insert(req, metadata=self._get_metadata())
-        return {"success": res.success, "nodeId": res.nodeId, "message": res.message}
+        summary = BatchSummary()
+        # `timeout` bounds the whole batch; each stream also gets the default
+        # BatchInsert deadline.
+        with budget(timeout):
+            for index, chunk in enumerate(chunked(items, chunk_size)):
+                item_errors: List[str] = []
+                try:
+                    res = self._call(
+                        "BatchInsert",
+                        _insert_requests(chunk, user_id, item_errors, self.codec),
+                        None,
+                    )
+                    summary.add_chunk(res.count, res.nodeIds, item_errors)
+                except Exception as e:
+                    if index == 0 and batch_unsupported(e):
+                        raise BatchNotSupportedError(
+                            "BatchInsert is not implemented by the server", chunk
+                        )
+                    summary.add_chunk_error(index, chunk, e)
+        return summary.result()
 
     def search(
         self,
@@ -91,54 +224,159 @@ class GrpcClient:
         k: int = 10,
         session_id: Optional[str] = None,
         filter_dict: Optional[Dict[str, Any]] = None,
-        query_embedding: Optional[List[float]] = None,
-    ) -> List[Dict[str, Any]]:
+        query_embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
         if not self.client:
             raise RuntimeError("Not connected")
 
-        req = ricedb_pb2.SearchRequest(
-            queryText=query,
-            userId=to_long(user_id),
-            k=k,
-            sessionId=session_id,
-            filter=json.dumps(filter_dict) if filter_dict else "",
-            queryEmbedding=query_embedding or [],
+        req = _search_request(
+            query, user_id, k, session_id, filter_dict, query_embedding, self.codec
+        )
+        return self._call(
+            "Search", req, timeout, lambda res: _search_results(res, self.codec)
         )
-
-        res = self.client.Search(req, metadata=self._get_metadata())
-        results = []
-        for r in res.results:
-            try:
-                meta = json.loads(r.metadata)
-            except:
-                meta = {}
-            results.append(
-                {
-                    "id": r.id,
-                    "similarity": r.similarity,
-                    "metadata": meta,
-                    "data": meta.get("stored_text"),
-                }
-            )
-        return results
 
     def delete(
-        self, node_id: Union[int, str], session_id: Optional[str] = None
+        self,
+        node_id: Union[int, str],
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
         if not self.client:
             raise RuntimeError("Not connected")
-        res = self.client.DeleteNode(
+        return self._call(
+            "DeleteNode",
             ricedb_pb2.DeleteNodeRequest(nodeId=to_long(node_id), sessionId=session_id),
-            metadata=self._get_metadata(),
+            timeout,
+            _delete_result,
         )
-        return res.success
 
-    def login(self, username: str, password: str) -> str:
+    def login(
+        self, username: str, password: str, timeout: Optional[float] = None
+    ) -> str:
         if not self.client:
             raise RuntimeError("Not connected")
-        res = self.client.Login(
+
+        token = self._call(
+            "Login",
             ricedb_pb2.LoginRequest(username=username, password=password),
-            metadata=self._get_metadata(),
+            timeout,
+            _login_token,
         )
-        self.token = res.token
-        return res.token
+        if isinstance(token, CallFuture):
+            # Submitted: store the token once the call completes, even if its
+            # result is never read.
+            token.add_done_callback(self._store_token)
+        else:
+            self.token = token
+        return token
+
+    def _store_token(self, call: CallFuture):
+        if call.exception() is None:
+            self.token = call.result()
+
+
+def _insert_request(
+    node_id: Union[int, str],
+    text: str,
+    metadata: Dict[str, Any],
+    user_id: Union[int, str] = 1,
+    session_id: Optional[str] = None,
+    embedding: Optional[Vector] = None,
+    codec: Optional[JsonCodec] = None,
+) -> ricedb_pb2.InsertRequest:
+    # Automatically store text in metadata so it can be retrieved
+    meta = metadata.copy()
+    if text and "stored_text" not in meta:
+        meta["stored_text"] = text
+
+    req = ricedb_pb2.InsertRequest(
+        id=to_long(node_id),
+        text=text,
+        metadata=get_codec(codec).dumpb(meta),
+        userId=to_long(user_id),
+        sessionId=session_id,
+    )
+    set_vector(req, "embedding", embedding)
+    return req
+
+
+def _insert_requests(
+    chunk: List[Dict[str, Any]],
+    user_id: Union[int, str],
+    errors: List[str],
+    codec: Optional[JsonCodec] = None,
+) -> Iterator[ricedb_pb2.InsertRequest]:
+    """Yields one InsertRequest per item, recording items that fail to encode."""
+    for item in chunk:
+        try:
+            req = _insert_request(
+                item["nodeId"],
+                item["text"],
+                item.get("metadata", {}),
+                user_id,
+                item.get("sessionId"),
+                item.get("embedding"),
+                codec,
+            )
+        except Exception as e:
+            errors.append(f"node {item.get('nodeId')}: {e}")
+            continue
+        yield req
+
+
+def _auth_metadata(token: Optional[str]) -> List[tuple]:
+    metadata = []
+    if token:
+        metadata.append(("authorization", f"Bearer {token}"))
+    return metadata
+
+
+def _health_result(res: ricedb_pb2.HealthResponse) -> Dict[str, str]:
+    return {"status": res.status, "version": res.version}
+
+
+def _identity(res: Any) -> Any:
+    return res
+
+
+def _delete_result(res: ricedb_pb2.DeleteNodeResponse) -> bool:
+    return res.success
+
+
+def _login_token(res: ricedb_pb2.LoginResponse) -> str:
+    return res.token
+
+
+def _insert_result(res: ricedb_pb2.InsertResponse) -> Dict[str, Any]:
+    return {"success": res.success, "nodeId": res.nodeId, "message": res.message}
+
+
+def _search_request(
+    query: str,
+    user_id: Union[int, str] = 1,
+    k: int = 10,
+    session_id: Optional[str] = None,
+    filter_dict: Optional[Dict[str, Any]] = None,
+    query_embedding: Optional[Vector] = None,
+    codec: Optional[JsonCodec] = None,
+) -> ricedb_pb2.SearchRequest:
+    req = ricedb_pb2.SearchRequest(
+        queryText=query,
+        userId=to_long(user_id),
+        k=k,
+        sessionId=session_id,
+        filter=get_codec(codec).dumps(filter_dict) if filter_dict else "",
+    )
+    set_vector(req, "queryEmbedding", query_embedding)
+    return req
+
+
+def _search_results(
+    res: ricedb_pb2.SearchResponse, codec: Optional[JsonCodec] = None
+) -> SearchResults:
+    codec = get_codec(codec)
+    return SearchResults(
+        SearchResult(r.id, r.similarity, r.metadata, codec=codec) for r in res.results
+    )
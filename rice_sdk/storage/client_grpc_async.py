@@ -0,0 +1,227 @@
+import grpc
+from typing import Optional, List, Dict, Any, Union, Iterable
+from .results import SearchResults
+from ..codec import JsonCodec, get_codec
+from ..deadline import Deadlines, budget, call_timeout
+from ..hedge import HEDGE_CHANNEL_OPTION, HedgePolicy
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..tracing import aio_interceptors
+from ..vectors import Vector
+from .proto import ricedb_pb2, ricedb_pb2_grpc
+from .utils import to_long, chunked, BatchSummary
+from .batch import BatchNotSupportedError, batch_unsupported
+from .client_grpc import (
+    CHANNEL_OPTIONS,
+    _auth_metadata,
+    _health_result,
+    _insert_request,
+    _insert_requests,
+    _insert_result,
+    _search_request,
+    _search_results,
+)
+
+
+class AsyncGrpcClient:
+    """
+    asyncio counterpart of GrpcClient built on a grpc.aio channel.
+    All calls from one event loop are multiplexed over a single HTTP/2 connection.
+    """
+
+    def __init__(
+        self,
+        host: str = "localhost",
+        port: int = 50051,
+        token: Optional[str] = None,
+        codec: Union[str, JsonCodec, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.token = token
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        if metrics:
+            self.codec = metrics.wrap_codec(self.codec)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.hedge_policy = hedge_policy
+        self.client = None
+        self.channel = None
+        self.hedge_client = None
+        self.hedge_channel = None
+        self.connected = False
+
+    async def connect(self) -> bool:
+        address = f"{self.host}:{self.port}"
+        self.channel = grpc.aio.insecure_channel(
+            address, options=CHANNEL_OPTIONS, interceptors=aio_interceptors()
+        )
+        self.client = ricedb_pb2_grpc.RiceDBStub(self.channel)
+        if self.hedge_policy:
+            self.hedge_channel = grpc.aio.insecure_channel(
+                address,
+                options=CHANNEL_OPTIONS + [HEDGE_CHANNEL_OPTION],
+                interceptors=aio_interceptors(),
+            )
+            self.hedge_client = ricedb_pb2_grpc.RiceDBStub(self.hedge_channel)
+
+        try:
+            await self.health()
+            self.connected = True
+            return True
+        except Exception as e:
+            await self.disconnect()
+            raise e
+
+    async def disconnect(self):
+        if self.channel:
+            await self.channel.close()
+            self.channel = None
+        if self.hedge_channel:
+            await self.hedge_channel.close()
+            self.hedge_channel = None
+        self.client = None
+        self.hedge_client = None
+        self.connected = False
+
+    def _get_metadata(self):
+        return _auth_metadata(self.token)
+
+    async def _call(self, method: str, request: Any, timeout: Optional[float]):
+        with budget(self.deadlines.resolve(method, timeout)):
+            if self.metrics is None:
+                return await self.retry_policy.call_async(
+                    method, self._send, method, request
+                )
+            return await self.metrics.observe_async(
+                method,
+                self.retry_policy.call_async,
+                request,
+                method,
+                self._send,
+                method,
+                request,
+            )
+
+    def _send(self, method: str, request: Any):
+        if self.hedge_client and method in self.hedge_policy.methods:
+            return self.hedge_policy.call_async(
+                lambda: self._send_on(self.client, method, request),
+                lambda: self._send_on(self.hedge_client, method, request),
+            )
+        return self._send_on(self.client, method, request)
+
+    def _send_on(self, stub: ricedb_pb2_grpc.RiceDBStub, method: str, request: Any):
+        return getattr(stub, method)(
+            request, metadata=self._get_metadata(), timeout=call_timeout()
+        )
+
+    async def health(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        if not self.client:
+            raise RuntimeError("Not connected")
+        res = await self._call("Health", ricedb_pb2.HealthRequest(), timeout)
+        return _health_result(res)
+
+    async def insert(
+        self,
+        node_id: Union[int, str],
+        text: str,
+        metadata: Dict[str, Any],
+        user_id: Union[int, str] = 1,
+        session_id: Optional[str] = None,
+        embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        if not self.client:
+            raise RuntimeError("Not connected")
+
+        req = _insert_request(
+            node_id, text, metadata, user_id, session_id, embedding, self.codec
+        )
+        res = await self._call("Insert", req, timeout)
+        return _insert_result(res)
+
+    async def batch_insert(
+        self,
+        items: Iterable[Dict[str, Any]],
+        user_id: Union[int, str] = 1,
+        chunk_size: int = 1000,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Inserts items over the client-streaming BatchInsert RPC, one stream per chunk.
+        Raises BatchNotSupportedError if the server does not implement BatchInsert.
+        """
+        if not self.client:
+            raise RuntimeError("Not connected")
+
+        summary = BatchSummary()
+        with budget(timeout):
+            for index, chunk in enumerate(chunked(items, chunk_size)):
+                item_errors: List[str] = []
+                try:
+                    res = await self._call(
+                        "BatchInsert",
+                        _insert_requests(chunk, user_id, item_errors, self.codec),
+                        None,
+                    )
+                    summary.add_chunk(res.count, res.nodeIds, item_errors)
+                except Exception as e:
+                    if index == 0 and batch_unsupported(e):
+                        raise BatchNotSupportedError(
+                            "BatchInsert is not implemented by the server", chunk
+                        )
+                    summary.add_chunk_error(index, chunk, e)
+        return summary.result()
+
+    async def search(
+        self,
+        query: str,
+        user_id: Union[int, str] = 1,
+        k: int = 10,
+        session_id: Optional[str] = None,
+        filter_dict: Optional[Dict[str, Any]] = None,
+        query_embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
+        if not self.client:
+            raise RuntimeError("Not connected")
+
+        req = _search_request(
+            query, user_id, k, session_id, filter_dict, query_embedding, self.codec
+        )
+        res = await self._call("Search", req, timeout)
+        return _search_results(res, self.codec)
+
+    async def delete(
+        self,
+        node_id: Union[int, str],
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bool:
+        if not self.client:
+            raise RuntimeError("Not connected")
+        res = await self._call(
+            "DeleteNode",
+            ricedb_pb2.DeleteNodeRequest(nodeId=to_long(node_id), sessionId=session_id),
+            timeout,
+        )
+        return res.success
+
+    async def login(
+        self, username: str, password: str, timeout: Optional[float] = None
+    ) -> str:
+        if not self.client:
+            raise RuntimeError("Not connected")
+        res = await self._call(
+            "Login",
+            ricedb_pb2.LoginRequest(username=username, password=password),
+            timeout,
+        )
+        self.token = res.token
+        return res.token
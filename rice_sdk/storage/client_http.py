@@ -1,18 +1,72 @@
+import time
 import requests
-import json
-from typing import Optional, List, Dict, Any, Union
-from .utils import to_long
+from typing import Optional, List, Dict, Any, Union, Iterable, Iterator
+from requests.adapters import HTTPAdapter
+from ..codec import JsonCodec, get_codec
+from ..deadline import Deadlines, budget, call_timeout
+from ..metrics import Metrics
+from ..retry import RetryPolicy
+from ..tracing import http_span
+from ..vectors import Vector, as_list
+from .results import SearchResults, SearchResult
+from .utils import to_long, chunked, BatchSummary
+from .batch import BatchNotSupportedError, batch_unsupported
+
+BULK_CONTENT_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+# Seconds between /health polls in `wait_ready`.
+READY_POLL_INTERVAL = 0.1
 
 
 class HttpClient:
+    """
+    HTTP transport for RiceDB.
+    Requests go through one pooled keep-alive session: `pool_connections` is the
+    number of per-host pools kept, `pool_maxsize` caps the connections to each host,
+    and `pool_block` makes callers wait for a free connection instead of opening
+    an extra one when that cap is reached.
+    """
+
     def __init__(
-        self, host: str = "localhost", port: int = 3000, token: Optional[str] = None
+        self,
+        host: str = "localhost",
+        port: int = 3000,
+        token: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        codec: Union[str, JsonCodec, None] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        deadlines: Optional[Deadlines] = None,
+        metrics: Optional[Metrics] = None,
     ):
         self.host = host
         self.port = port
-        self.token = token
         self.base_url = f"http://{host}:{port}"
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.codec = get_codec(codec)
+        self.metrics = metrics
+        if metrics:
+            self.codec = metrics.wrap_codec(self.codec)
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.deadlines = deadlines or Deadlines()
+        self.token = token
         self.connected = False
+        self._session: Optional[requests.Session] = None
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]):
+        self._token = value
+        self._headers = None
 
     def connect(self) -> bool:
         try:
@@ -24,17 +78,101 @@ class HttpClient:
             raise
 
     def disconnect(self):
+        if self._session:
+            self._session.close()
+            self._session = None
         self.connected = False
 
+    def wait_ready(self, timeout: Optional[float] = None):
+        """
+        Polls /health until it answers; raises TimeoutError once `timeout`
+        seconds have passed without a healthy response.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise TimeoutError(
+                    f"RiceDB at {self.base_url} not ready after {timeout}s"
+                )
+            try:
+                response = self._request("GET", "/health", timeout=remaining)
+                if response.ok:
+                    return
+            except (requests.ConnectionError, requests.Timeout):
+                pass
+            delay = READY_POLL_INTERVAL
+            if deadline is not None:
+                delay = min(delay, max(0.0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def _get_session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                pool_block=self.pool_block,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._session = session
+        return self._session
+
     def _get_headers(self):
-        headers = {"Content-Type": "application/json"}
-        if self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
-
-    def health(self) -> Dict[str, str]:
-        resp = requests.get(f"{self.base_url}/health", headers=self._get_headers())
-        resp.raise_for_status()
+        # Built once per token; assigning `token` (e.g. from login) clears it.
+        if self._headers is None:
+            headers = {"Content-Type": "application/json"}
+            if self.token:
+                headers["Authorization"] = f"Bearer {self.token}"
+            self._headers = headers
+        return self._headers
+
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("headers", self._get_headers())
+        return self._get_session().request(method, f"{self.base_url}{path}", **kwargs)
+
+    def _call(
+        self, rpc: str, method: str, path: str, timeout: Optional[float], **kwargs
+    ) -> requests.Response:
+        # `rpc` names the equivalent gRPC method for deadlines and retries.
+        # Raises on HTTP errors so `retry_policy` sees 5xx responses as failures.
+        def send() -> requests.Response:
+            headers = kwargs.get("headers", self._get_headers())
+            payload = kwargs.get("json", kwargs.get("params"))
+            url = f"{self.base_url}{path}"
+            with http_span(rpc, method, url, payload, headers) as span:
+                resp = self._request(
+                    method,
+                    path,
+                    timeout=call_timeout(),
+                    **{**kwargs, "headers": span.headers},
+                )
+                span.finish(resp)
+                resp.raise_for_status()
+                return resp
+
+        with budget(self.deadlines.resolve(rpc, timeout)):
+            if self.metrics is None:
+                return self.retry_policy.call(rpc, send)
+            started = time.perf_counter()
+            try:
+                resp = self.retry_policy.call(rpc, send)
+            except Exception as e:
+                self.metrics.record_call(rpc, time.perf_counter() - started, e)
+                raise
+            body = resp.request.body if resp.request is not None else None
+            self.metrics.record_call(
+                rpc,
+                time.perf_counter() - started,
+                None,
+                len(body) if isinstance(body, (bytes, str)) else 0,
+                len(resp.content),
+            )
+            return resp
+
+    def health(self, timeout: Optional[float] = None) -> Dict[str, str]:
+        resp = self._call("Health", "GET", "/health", timeout)
         try:
             return resp.json()
         except ValueError:
@@ -48,30 +186,16 @@ class HttpClient:
         metadata: Dict[str, Any],
         user_id: Union[int, str] = 1,
         session_id: Optional[str] = None,
-        embedding: Optional[List[float]] = None,
+        embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         if not self.connected:
             raise RuntimeError("Not connected")
 
-        # Automatically store text in metadata
-        meta = metadata.copy()
-        if text and "stored_text" not in meta:
-            meta["stored_text"] = text
-
-        payload = {
-            "id": to_long(node_id),
-            "text": text,
-            "metadata": meta,
-            "user_id": to_long(user_id),
-            "embedding": embedding or [],
-        }
-        if session_id:
-            payload["session_id"] = session_id
-
-        resp = requests.post(
-            f"{self.base_url}/v1/nodes", json=payload, headers=self._get_headers()
+        payload = _insert_payload(
+            node_id, text, metadata, user_id, session_id, embedding
         )
-        resp.raise_for_status()
+        resp = self._call("Insert", "POST", "/v1/nodes", timeout, json=payload)
 
         data = resp.json()
         # Normalize response to match GRPC output structure if possible, or keep as raw
@@ -82,6 +206,60 @@ class HttpClient:
             "message": data.get("message", ""),
         }
 
+    def batch_insert(
+        self,
+        items: Iterable[Dict[str, Any]],
+        user_id: Union[int, str] = 1,
+        chunk_size: int = 1000,
+        bulk_format: str = "ndjson",
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """
+        Inserts items through the bulk endpoint `POST /v1/nodes/batch`.
+        Each chunk of `chunk_size` items is one request whose body is streamed
+        from a generator with chunked transfer encoding, either as NDJSON
+        (`bulk_format="ndjson"`, one node per line) or as a JSON array
+        (`bulk_format="json"`). The server answers each chunk with
+        `{"count", "node_ids"}`. If the endpoint does not exist (404, 405, 501),
+        BatchNotSupportedError carries the first chunk back.
+        """
+        if not self.connected:
+            raise RuntimeError("Not connected")
+        if bulk_format not in BULK_CONTENT_TYPES:
+            raise ValueError(f"Unsupported bulk_format: {bulk_format}")
+
+        headers = dict(self._get_headers())
+        headers["Content-Type"] = BULK_CONTENT_TYPES[bulk_format]
+
+        summary = BatchSummary()
+        with budget(timeout):
+            for index, chunk in enumerate(chunked(items, chunk_size)):
+                item_errors: List[str] = []
+                lines = _bulk_lines(chunk, user_id, item_errors, self.codec)
+                body = lines if bulk_format == "ndjson" else _json_array(lines)
+                try:
+                    resp = self._call(
+                        "BatchInsert",
+                        "POST",
+                        "/v1/nodes/batch",
+                        None,
+                        data=body,
+                        headers=headers,
+                    )
+                    data = resp.json()
+                    node_ids = data.get("node_ids", [])
+                    summary.add_chunk(
+                        data.get("count", len(node_ids)), node_ids, item_errors
+                    )
+                except Exception as e:
+                    if index == 0 and batch_unsupported(e):
+                        raise BatchNotSupportedError(
+                            "Bulk insert endpoint is not available on the server",
+                            chunk,
+                        )
+                    summary.add_chunk_error(index, chunk, e)
+        return summary.result()
+
     def search(
         self,
         query: str,
@@ -89,8 +267,9 @@ class HttpClient:
         k: int = 10,
         session_id: Optional[str] = None,
         filter_dict: Optional[Dict[str, Any]] = None,
-        query_embedding: Optional[List[float]] = None,
-    ) -> List[Dict[str, Any]]:
+        query_embedding: Optional[Vector] = None,
+        timeout: Optional[float] = None,
+    ) -> SearchResults:
         if not self.connected:
             raise RuntimeError("Not connected")
 
@@ -98,52 +277,111 @@ class HttpClient:
             "query": query,
             "user_id": to_long(user_id),
             "k": k,
-            "query_embedding": query_embedding or [],
+            "query_embedding": as_list(query_embedding),
         }
         if session_id:
             payload["session_id"] = session_id
         if filter_dict:
             payload["filter"] = filter_dict
 
-        resp = requests.post(
-            f"{self.base_url}/v1/search", json=payload, headers=self._get_headers()
-        )
-        resp.raise_for_status()
+        resp = self._call("Search", "POST", "/v1/search", timeout, json=payload)
 
         data = resp.json()
-        results = []
-        for r in data.get("results", []):
-            results.append(
-                {
-                    "id": r.get("id"),
-                    "similarity": r.get("similarity"),
-                    "metadata": r.get("metadata", {}),
-                    "data": r.get("metadata", {}).get("stored_text"),
-                }
+        return SearchResults(
+            SearchResult(
+                r.get("id"), r.get("similarity"), metadata=r.get("metadata", {})
             )
-        return results
+            for r in data.get("results", [])
+        )
 
     def delete(
-        self, node_id: Union[int, str], session_id: Optional[str] = None
+        self,
+        node_id: Union[int, str],
+        session_id: Optional[str] = None,
+        timeout: Optional[float] = None,
     ) -> bool:
         if not self.connected:
             raise RuntimeError("Not connected")
 
-        url = f"{self.base_url}/v1/nodes/{to_long(node_id)}"
+        path = f"/v1/nodes/{to_long(node_id)}"
         params = {}
         if session_id:
             params["session_id"] = session_id
 
-        resp = requests.delete(url, params=params, headers=self._get_headers())
-        resp.raise_for_status()
+        resp = self._call("DeleteNode", "DELETE", path, timeout, params=params)
         return resp.json().get("success", True)
 
-    def login(self, username: str, password: str) -> str:
-        resp = requests.post(
-            f"{self.base_url}/auth/login",
+    def login(
+        self, username: str, password: str, timeout: Optional[float] = None
+    ) -> str:
+        resp = self._call(
+            "Login",
+            "POST",
+            "/auth/login",
+            timeout,
             json={"username": username, "password": password},
+            headers=None,
         )
-        resp.raise_for_status()
         data = resp.json()
         self.token = data.get("token")
         return self.token
+
+
+def _insert_payload(
+    node_id: Union[int, str],
+    text: str,
+    metadata: Dict[str, Any],
+    user_id: Union[int, str] = 1,
+    session_id: Optional[str] = None,
+    embedding: Optional[Vector] = None,
+) -> Dict[str, Any]:
+    # Automatically store text in metadata
+    meta = metadata.copy()
+    if text and "stored_text" not in meta:
+        meta["stored_text"] = text
+
+    payload = {
+        "id": to_long(node_id),
+        "text": text,
+        "metadata": meta,
+        "user_id": to_long(user_id),
+        "embedding": as_list(embedding),
+    }
+    if session_id:
+        payload["session_id"] = session_id
+    return payload
+
+
+def _bulk_lines(
+    chunk: List[Dict[str, Any]],
+    user_id: Union[int, str],
+    errors: List[str],
+    codec: JsonCodec,
+) -> Iterator[bytes]:
+    """Yields one newline-terminated JSON document per item, skipping bad items."""
+    for item in chunk:
+        try:
+            payload = _insert_payload(
+                item["nodeId"],
+                item["text"],
+                item.get("metadata", {}),
+                user_id,
+                item.get("sessionId"),
+                item.get("embedding"),
+            )
+            line = codec.dumpb(payload) + b"\n"
+        except Exception as e:
+            errors.append(f"node {item.get('nodeId')}: {e}")
+            continue
+        yield line
+
+
+def _json_array(lines: Iterator[bytes]) -> Iterator[bytes]:
+    yield b"["
+    first = True
+    for line in lines:
+        if not first:
+            yield b","
+        yield line.rstrip(b"\n")
+        first = False
+    yield b"]"
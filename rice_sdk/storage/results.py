@@ -0,0 +1,93 @@
+import copy
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+from ..codec import JsonCodec, get_codec
+
+_KEYS = ("id", "similarity", "metadata", "data")
+
+
+class SearchResult(Mapping):
+    """
+    One search hit. `id` and `similarity` are plain attributes; the metadata
+    bytes are kept as received and only JSON-decoded on first access to
+    `metadata` or `data`. Also readable like the dicts search used to return
+    (`r["data"]`, `r.get("metadata")`, `dict(r)`), and printed like one. It is
+    not a dict itself, so serialize it with `to_dict()`.
+    """
+
+    __slots__ = ("id", "similarity", "_raw", "_metadata", "_codec")
+
+    def __init__(
+        self,
+        id: Any,
+        similarity: float,
+        raw_metadata: bytes = b"",
+        metadata: Optional[Dict[str, Any]] = None,
+        codec: Optional[JsonCodec] = None,
+    ):
+        self.id = id
+        self.similarity = similarity
+        self._raw = raw_metadata
+        self._metadata = metadata
+        self._codec = codec
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        metadata = self._metadata
+        if metadata is None:
+            # Decoded into a local and published with one assignment; `_raw` is
+            # kept so a thread racing this one can still decode it.
+            try:
+                metadata = get_codec(self._codec).loads(self._raw)
+            except ValueError:
+                metadata = {}
+            self._metadata = metadata
+        return metadata
+
+    @property
+    def data(self) -> Any:
+        return self.metadata.get("stored_text")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in _KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_KEYS)
+
+    def __len__(self) -> int:
+        return len(_KEYS)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in _KEYS}
+
+    def copy(self) -> "SearchResult":
+        """
+        A copy that shares no mutable state with this result. Raw metadata
+        bytes are shared and decoded again on access; metadata that only
+        exists decoded is deep-copied.
+        """
+        metadata = None
+        if not self._raw and self._metadata is not None:
+            metadata = copy.deepcopy(self._metadata)
+        return SearchResult(self.id, self.similarity, self._raw, metadata, self._codec)
+
+    def __repr__(self) -> str:
+        return repr(self.to_dict())
+
+
+class SearchResults(List[SearchResult]):
+    """
+    List of SearchResult with helpers for callers that skip the metadata.
+    `to_dicts()` gives plain dicts, e.g. for `json.dumps`.
+    """
+
+    def copy(self) -> "SearchResults":
+        return SearchResults(r.copy() for r in self)
+
+    def ids(self) -> List[Any]:
+        return [r.id for r in self]
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        return [r.to_dict() for r in self]
@@ -1,4 +1,5 @@
-from typing import Union
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Union
 
 
 def to_long(val: Union[int, str]) -> int:
@@ -11,3 +12,54 @@ def to_long(val: Union[int, str]) -> int:
         return int(val)
     except (ValueError, TypeError):
         raise ValueError(f"Invalid value for Long: {val}")
+
+
+def chunked(
+    items: Iterable[Dict[str, Any]], chunk_size: int
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yields lists of at most `chunk_size` items, consuming `items` lazily.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    it = iter(items)
+    while True:
+        chunk = list(islice(it, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+class BatchSummary:
+    """
+    Accumulates per-chunk batch insert outcomes into the
+    {"totalInserted", "failed", "errors", "nodeIds"} summary.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.failed = 0
+        self.errors: List[str] = []
+        self.node_ids: List[int] = []
+
+    def add_chunk(self, count: int, node_ids: Iterable[int], item_errors: List[str]):
+        self.total += count
+        self.node_ids.extend(node_ids)
+        self.failed += len(item_errors)
+        self.errors.extend(item_errors)
+
+    def add_item_error(self, node_id: Any, error):
+        self.failed += 1
+        self.errors.append(f"node {node_id}: {error}")
+
+    def add_chunk_error(self, index: int, chunk: List[Dict[str, Any]], error):
+        self.failed += len(chunk)
+        self.errors.append(f"chunk {index} ({len(chunk)} items): {error}")
+
+    def result(self) -> Dict[str, Any]:
+        return {
+            "totalInserted": self.total,
+            "failed": self.failed,
+            "errors": self.errors,
+            "nodeIds": self.node_ids,
+        }
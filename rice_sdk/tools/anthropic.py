@@ -72,6 +72,39 @@ state = [
             "required": ["name"],
         },
     },
+    {
+        "name": "setVariables",
+        "description": "Sets several structured variables in working memory in one call.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "variables": {
+                    "type": "object",
+                    "description": "Map of variable names to values (any JSON-serializable type).",
+                },
+                "source": {
+                    "type": "string",
+                    "description": "Source of the variables: 'system', 'reasoning', 'retrieval', 'perception', or 'explicit'.",
+                },
+            },
+            "required": ["variables"],
+        },
+    },
+    {
+        "name": "getVariables",
+        "description": "Gets several structured variables from working memory in one call.",
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "names": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "The names of the variables to retrieve.",
+                },
+            },
+            "required": ["names"],
+        },
+    },
     {
         "name": "listVariables",
         "description": "Lists all variables in working memory.",
@@ -1,13 +1,31 @@
-from typing import Any, Dict
+import inspect
+import json
+from typing import Any, Dict, Union
 from ..state.client import StateClient
+from ..state.client_async import AsyncStateClient
 
 
-async def execute(name: str, args: Dict[str, Any], state_client: StateClient) -> Any:
+async def execute(
+    name: str,
+    args: Dict[str, Any],
+    state_client: Union[StateClient, AsyncStateClient],
+) -> Any:
     """
     Executes a tool call against the StateClient.
-    Supports both sync and async execution (though python gRPC is mostly sync unless using AsyncChannel).
-    Here we wrap the sync calls.
+    With an AsyncStateClient the call is awaited, so the event loop is never blocked;
+    a sync StateClient is called inline.
     """
+    result = _dispatch(name, args, state_client)
+    if inspect.isawaitable(result):
+        return await result
+    return result
+
+
+def _dispatch(
+    name: str,
+    args: Dict[str, Any],
+    state_client: Union[StateClient, AsyncStateClient],
+) -> Any:
     if name == "focus":
         return state_client.focus(args["content"])
     elif name == "recall":
@@ -28,6 +46,14 @@ async def execute(name: str, args: Dict[str, Any], state_client: StateClient) ->
         )
     elif name == "getVariable":
         return state_client.get_variable(args["name"])
+    elif name == "setVariables":
+        variables = args["variables"]
+        if isinstance(variables, str):
+            # Google tool schemas pass the map JSON-encoded.
+            variables = json.loads(variables)
+        return state_client.set_variables(variables, args.get("source", "explicit"))
+    elif name == "getVariables":
+        return state_client.get_variables(args["names"])
     elif name == "listVariables":
         return state_client.list_variables()
     elif name == "deleteVariable":
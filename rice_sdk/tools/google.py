@@ -73,6 +73,39 @@ state = [
             "required": ["name"],
         },
     },
+    {
+        "name": "setVariables",
+        "description": "Sets several structured variables in working memory in one call.",
+        "parameters": {
+            "type": "OBJECT",
+            "properties": {
+                "variables": {
+                    "type": "STRING",
+                    "description": "JSON object mapping variable names to values.",
+                },
+                "source": {
+                    "type": "STRING",
+                    "description": "Source of the variables: 'system', 'reasoning', 'retrieval', 'perception', or 'explicit'.",
+                },
+            },
+            "required": ["variables"],
+        },
+    },
+    {
+        "name": "getVariables",
+        "description": "Gets several structured variables from working memory in one call.",
+        "parameters": {
+            "type": "OBJECT",
+            "properties": {
+                "names": {
+                    "type": "ARRAY",
+                    "items": {"type": "STRING"},
+                    "description": "The names of the variables to retrieve.",
+                },
+            },
+            "required": ["names"],
+        },
+    },
     {
         "name": "listVariables",
         "description": "Lists all variables in working memory.",
@@ -93,6 +93,45 @@ state = [
             },
         },
     },
+    {
+        "type": "function",
+        "function": {
+            "name": "setVariables",
+            "description": "Sets several structured variables in working memory in one call.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "variables": {
+                        "type": "object",
+                        "description": "Map of variable names to values (any JSON-serializable type).",
+                    },
+                    "source": {
+                        "type": "string",
+                        "description": "Source of the variables: 'system', 'reasoning', 'retrieval', 'perception', or 'explicit'.",
+                    },
+                },
+                "required": ["variables"],
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "getVariables",
+            "description": "Gets several structured variables from working memory in one call.",
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "The names of the variables to retrieve.",
+                    },
+                },
+                "required": ["names"],
+            },
+        },
+    },
     {
         "type": "function",
         "function": {
@@ -0,0 +1,140 @@
+import importlib.util
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import grpc
+
+# Request fields copied onto spans: storage uses `sessionId`/`k`, state uses
+# `run_id`/`limit`, and the HTTP payloads use `session_id`.
+REQUEST_ATTRIBUTES = (
+    ("run_id", "rice.run_id"),
+    ("sessionId", "rice.session_id"),
+    ("session_id", "rice.session_id"),
+    ("k", "rice.k"),
+    ("limit", "rice.k"),
+)
+
+_available: Optional[bool] = None
+
+
+def tracing_available() -> bool:
+    """True when opentelemetry-api is installed; checked without importing it."""
+    global _available
+    if _available is None:
+        try:
+            _available = importlib.util.find_spec("opentelemetry.trace") is not None
+        except ImportError:
+            _available = False
+    return _available
+
+
+def intercept_channel(channel: "grpc.Channel") -> "grpc.Channel":
+    """`channel` with the tracing interceptor installed, or as is without OpenTelemetry."""
+    if not tracing_available():
+        return channel
+    import grpc
+    from .interceptors import TracingInterceptor
+
+    return grpc.intercept_channel(channel, TracingInterceptor())
+
+
+def aio_interceptors() -> List[Any]:
+    """Interceptors to pass to a grpc.aio channel; empty without OpenTelemetry."""
+    if not tracing_available():
+        return []
+    from .interceptors import AioStreamTracingInterceptor, AioUnaryTracingInterceptor
+
+    return [AioUnaryTracingInterceptor(), AioStreamTracingInterceptor()]
+
+
+def request_attributes(request: Any) -> Dict[str, Any]:
+    """Span attributes taken from a protobuf request or an HTTP payload dict."""
+    if isinstance(request, dict):
+        get = request.get
+    else:
+        fields = getattr(getattr(request, "DESCRIPTOR", None), "fields_by_name", {})
+
+        def get(name):
+            return getattr(request, name) if name in fields else None
+
+    attributes = {}
+    for field, attribute in REQUEST_ATTRIBUTES:
+        value = get(field)
+        if value not in (None, "", 0):
+            attributes[attribute] = value
+    return attributes
+
+
+def _tracer():
+    from opentelemetry import trace
+
+    return trace.get_tracer("rice_sdk")
+
+
+def _start_span(method: str, request: Any, streaming: bool = False):
+    from opentelemetry import trace
+
+    if isinstance(method, bytes):
+        method = method.decode()
+    service, _, name = method.lstrip("/").rpartition("/")
+    attributes = {"rpc.system": "grpc", "rpc.service": service, "rpc.method": name}
+    if not streaming:
+        attributes.update(request_attributes(request))
+        attributes["rice.request_bytes"] = request.ByteSize()
+    return _tracer().start_span(
+        method.lstrip("/"), kind=trace.SpanKind.CLIENT, attributes=attributes
+    )
+
+
+def _inject(span) -> Dict[str, str]:
+    from opentelemetry import propagate, trace
+
+    carrier: Dict[str, str] = {}
+    propagate.inject(carrier, context=trace.set_span_in_context(span))
+    return carrier
+
+
+class _HttpSpan:
+    def __init__(self, span, headers: Optional[Dict[str, str]]):
+        self.span = span
+        self.headers = headers
+
+    def finish(self, response):
+        if self.span is None or not self.span.is_recording():
+            return
+        from opentelemetry.trace import Status, StatusCode
+
+        self.span.set_attribute("http.status_code", response.status_code)
+        body = response.request.body if response.request is not None else None
+        if isinstance(body, (bytes, str)):
+            self.span.set_attribute("rice.request_bytes", len(body))
+        if response.status_code >= 400:
+            self.span.set_status(Status(StatusCode.ERROR, str(response.status_code)))
+
+
+@contextmanager
+def http_span(
+    rpc: str,
+    method: str,
+    url: str,
+    payload: Any,
+    headers: Optional[Dict[str, str]],
+) -> Iterator[_HttpSpan]:
+    """
+    Wraps one HTTP request in a client span. The yielded object carries the
+    headers to send (with the trace context added) and `finish(response)`
+    records the status; without OpenTelemetry both are pass-throughs.
+    """
+    if not tracing_available():
+        yield _HttpSpan(None, headers)
+        return
+    from opentelemetry import trace
+
+    attributes = {"http.method": method, "http.url": url, "rpc.method": rpc}
+    attributes.update(request_attributes(payload or {}))
+    with _tracer().start_as_current_span(
+        f"{method} {rpc}", kind=trace.SpanKind.CLIENT, attributes=attributes
+    ) as span:
+        carrier = _inject(span)
+        yield _HttpSpan(span, {**(headers or {}), **carrier} if carrier else headers)
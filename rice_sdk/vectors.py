@@ -0,0 +1,97 @@
+import sys
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence, Union
+from .lazy import loaded
+
+if TYPE_CHECKING:
+    import numpy as np
+
+Vector = Union[Sequence[float], "np.ndarray", memoryview]
+
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def set_vector(message: Any, field_name: str, vector: Optional[Vector]) -> None:
+    """
+    Fills the repeated float field `field_name` of a protobuf message.
+    NumPy arrays and float32 buffers (array.array("f"), memoryview) are written
+    as one packed field through MergeFromString, so no per-element Python floats
+    or intermediate lists are created. Anything else is treated as a sequence.
+    """
+    if vector is None:
+        return
+    if not isinstance(vector, (list, tuple)):
+        data = _float32_bytes(vector)
+        if data is not None:
+            number = message.DESCRIPTOR.fields_by_name[field_name].number
+            message.MergeFromString(_packed_field(number, data))
+            return
+    getattr(message, field_name).extend(vector)
+
+
+def as_list(vector: Optional[Vector]) -> List[float]:
+    """Returns `vector` as a JSON-serializable list of floats."""
+    if vector is None:
+        return []
+    if isinstance(vector, list):
+        return vector
+    # numpy is an optional extra and only checked for once the caller has
+    # imported it: an ndarray cannot exist before that.
+    np = loaded("numpy")
+    if np is not None and isinstance(vector, np.ndarray):
+        return vector.tolist()
+    return list(vector)
+
+
+def to_numpy(values: Sequence[float]) -> "np.ndarray":
+    """
+    Converts a repeated float field (e.g. `trace.embedding` from reminisce)
+    to a float32 NumPy array. Requires numpy.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("numpy is required: pip install rice-sdk[numpy]") from None
+    return np.array(values, dtype=np.float32)
+
+
+def _float32_bytes(vector: Any) -> Optional[bytes]:
+    """Little-endian float32 bytes for arrays and float buffers, else None."""
+    np = loaded("numpy")
+    if np is not None and isinstance(vector, np.ndarray):
+        if vector.ndim != 1:
+            raise ValueError(
+                f"Embedding must be 1-dimensional, got shape {vector.shape}"
+            )
+        return np.ascontiguousarray(vector, dtype="<f4").tobytes()
+    try:
+        view = memoryview(vector)
+    except TypeError:
+        return None
+    if view.format == "f" and view.ndim == 1 and _LITTLE_ENDIAN:
+        return view.tobytes()
+    if view.format in ("f", "d"):
+        try:
+            import numpy as np
+        except ImportError:
+            return None
+        return np.asarray(view, dtype="<f4").tobytes()
+    return None
+
+
+def _packed_field(number: int, data: bytes) -> bytes:
+    # Wire type 2 (length-delimited) is how proto3 packs repeated floats.
+    header = bytearray(_varint((number << 3) | 2))
+    header += _varint(len(data))
+    return bytes(header) + data
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while True:
+        bits = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(bits | 0x80)
+        else:
+            out.append(bits)
+            return bytes(out)
@@ -0,0 +1,37 @@
+from unittest.mock import patch
+from rice_sdk.channel import SharedChannel, same_target
+
+
+def test_shared_channel_is_closed_by_last_release():
+    with patch("grpc.insecure_channel") as mock_channel:
+        shared = SharedChannel("localhost:50051", [("opt", 1)])
+        first = shared.acquire()
+        second = shared.acquire()
+
+        assert first is second
+        mock_channel.assert_called_once_with("localhost:50051", options=[("opt", 1)])
+
+        shared.release()
+        first.close.assert_not_called()
+        shared.release()
+        first.close.assert_called_once()
+        assert shared.refs == 0
+
+        shared.release()
+        first.close.assert_called_once()
+
+
+def test_shared_channel_reopens_after_close():
+    with patch("grpc.insecure_channel") as mock_channel:
+        shared = SharedChannel("localhost:50051")
+        shared.acquire()
+        shared.release()
+        shared.acquire()
+        assert mock_channel.call_count == 2
+
+
+def test_same_target():
+    assert same_target("localhost:50051", "LOCALHOST:50051")
+    assert same_target("127.0.0.1:50051", "localhost:50051")
+    assert not same_target("localhost:50051", "localhost:50052")
+    assert not same_target("db:50051", "state:50051")
@@ -1,3 +1,6 @@
+import threading
+import time
+
 import pytest
 from unittest.mock import patch
 from rice_sdk.client import Client
@@ -53,3 +56,178 @@ def test_client_init_disabled_storage(
         _ = client.storage
 
     assert client.state is not None
+
+
+def test_client_shares_channel_for_identical_targets(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    with patch.dict(
+        "os.environ",
+        {
+            "STORAGE_INSTANCE_URL": "localhost:50051",
+            "STATE_INSTANCE_URL": "127.0.0.1:50051",
+        },
+    ):
+        client = Client()
+        client.connect()
+
+    storage_channel = mock_storage_client.call_args[1]["shared_channel"]
+    state_channel = mock_state_client.call_args[1]["shared_channel"]
+    assert storage_channel is not None
+    assert storage_channel is state_channel
+
+    client.close()
+    mock_storage_client.return_value.disconnect.assert_called_once()
+    mock_state_client.return_value.close.assert_called_once()
+
+
+def test_client_separate_channels_for_different_targets(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    with patch.dict(
+        "os.environ",
+        {
+            "STORAGE_INSTANCE_URL": "storage:50051",
+            "STATE_INSTANCE_URL": "state:50051",
+        },
+    ):
+        client = Client()
+        client.connect()
+
+    assert mock_storage_client.call_args[1]["shared_channel"] is None
+    assert mock_state_client.call_args[1]["shared_channel"] is None
+
+
+def test_client_lazy_connect_defers_until_first_use(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    client = Client()
+    client.connect(lazy=True)
+
+    mock_storage_client.assert_not_called()
+    mock_state_client.assert_not_called()
+
+    assert client.state is mock_state_client.return_value
+    mock_storage_client.assert_not_called()
+    mock_state_client.return_value.start_connecting.assert_not_called()
+
+    assert client.storage is mock_storage_client.return_value
+    assert client.storage is mock_storage_client.return_value
+    mock_storage_client.assert_called_once()
+    mock_storage_client.return_value.connect.assert_called_once()
+
+
+def test_client_connects_storage_and_state_concurrently(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    state_started = threading.Event()
+    mock_state_client.return_value.start_connecting.side_effect = state_started.set
+    # Storage only finishes connecting once state has started, so a sequential
+    # connect would time out here.
+    mock_storage_client.return_value.connect.side_effect = lambda: state_started.wait(
+        1.0
+    )
+
+    client = Client()
+    client.connect()
+
+    assert state_started.is_set()
+    assert client.storage is mock_storage_client.return_value
+
+
+def test_client_connect_raises_storage_errors(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    mock_storage_client.return_value.connect.side_effect = ConnectionError("down")
+
+    client = Client()
+    with pytest.raises(ConnectionError, match="down"):
+        client.connect()
+
+    mock_state_client.return_value.close.assert_called_once()
+
+
+def test_client_failed_connect_closes_the_shared_channel(
+    mock_load_config, mock_storage_client
+):
+    mock_storage_client.return_value.connect.side_effect = ConnectionError("down")
+    with patch("grpc.insecure_channel") as channel, patch(
+        "rice_sdk.state.client.state_pb2_grpc.CortexStub"
+    ):
+        client = Client()
+        with pytest.raises(ConnectionError):
+            client.connect()
+
+    channel.return_value.close.assert_called_once()
+    assert client._state is None
+
+
+def test_client_reconnect_closes_previous_clients(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    client = Client()
+    client.connect()
+    first_channel = client._channel
+    client.connect()
+
+    mock_storage_client.return_value.disconnect.assert_called_once()
+    mock_state_client.return_value.close.assert_called_once()
+    assert client._channel is not first_channel
+
+
+def test_client_wait_ready_shares_one_deadline(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    with patch.dict(
+        "os.environ",
+        {"STORAGE_INSTANCE_URL": "storage:50051", "STATE_INSTANCE_URL": "state:50051"},
+    ):
+        client = Client()
+        client.connect()
+    mock_storage_client.return_value.shared_channel = None
+    client.wait_ready(timeout=5.0)
+
+    (storage_timeout,) = mock_storage_client.return_value.wait_ready.call_args[0]
+    (state_timeout,) = mock_state_client.return_value.wait_ready.call_args[0]
+    assert 0 < storage_timeout <= state_timeout <= 5.0
+
+
+def test_client_wait_ready_connects_lazy_services_within_timeout(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    from rice_sdk.deadline import remaining_budget
+
+    budgets = []
+    mock_storage_client.return_value.connect.side_effect = lambda: budgets.append(
+        remaining_budget()
+    )
+    client = Client()
+    client.connect(lazy=True)
+    with patch("grpc.channel_ready_future") as ready:
+        client.wait_ready(timeout=5.0)
+
+    # Storage and state share localhost:50051: one probe, and no second wait
+    # on the channel once the services are connected.
+    ready.assert_called_once()
+    assert 0 < budgets[0] <= 5.0
+    mock_storage_client.return_value.wait_ready.assert_not_called()
+    mock_state_client.return_value.wait_ready.assert_not_called()
+
+
+def test_client_wait_ready_times_out_without_server(
+    mock_load_config, mock_storage_client, mock_state_client
+):
+    with patch.dict(
+        "os.environ",
+        {"STORAGE_INSTANCE_URL": "127.0.0.1:1", "STATE_INSTANCE_URL": "127.0.0.1:1"},
+    ):
+        client = Client()
+        client.connect(lazy=True)
+
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        client.wait_ready(timeout=0.3)
+    assert time.monotonic() - started < 1.0
+    mock_storage_client.assert_not_called()
+    mock_state_client.assert_not_called()
+    client.close()
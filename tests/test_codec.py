@@ -0,0 +1,52 @@
+import pytest
+from unittest.mock import patch
+from rice_sdk.codec import JsonCodec, get_codec
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.proto import state_pb2
+
+
+def test_get_codec_resolution():
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+    assert get_codec("json").name == "json"
+    assert get_codec() is get_codec("auto")
+    with pytest.raises(ValueError, match="Unknown codec"):
+        get_codec("yaml")
+
+
+def test_auto_prefers_orjson_when_installed():
+    pytest.importorskip("orjson")
+    assert get_codec().name == "orjson"
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codecs_round_trip(name):
+    try:
+        codec = get_codec(name)
+    except ImportError:
+        pytest.skip(f"{name} not installed")
+
+    value = {"text": "héllo", "n": [1, 2.5, None, True], "nested": {"a": "b"}}
+    assert codec.loads(codec.dumps(value)) == value
+    assert codec.loads(codec.dumpb(value)) == value
+    assert isinstance(codec.dumpb(value), bytes)
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_state_client_uses_configured_codec():
+    codec = JsonCodec()
+    with patch("grpc.insecure_channel"), patch(
+        "rice_sdk.state.client.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        stub = mock_stub.return_value
+        stub.SetVariable.return_value = state_pb2.Ack(success=True)
+        stub.GetVariable.return_value = state_pb2.VariableResponse(
+            name="plan", value_json='{"step": 1}'
+        )
+        client = StateClient(codec=codec)
+        with patch.object(codec, "dumps", return_value='"x"') as dumps:
+            client.set_variable("plan", {"step": 1})
+            dumps.assert_called_once_with({"step": 1})
+        assert stub.SetVariable.call_args[0][0].value_json == '"x"'
+        assert client.get_variable("plan")["value"] == {"step": 1}
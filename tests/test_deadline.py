@@ -0,0 +1,121 @@
+import time
+import grpc
+import pytest
+from unittest.mock import AsyncMock, patch
+from rice_sdk.deadline import Deadlines, budget, call_timeout, remaining_budget
+from rice_sdk.retry import RetryPolicy
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.client_async import AsyncStateClient
+from rice_sdk.state.proto import state_pb2
+from rice_sdk.storage.client_http import HttpClient
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("grpc.insecure_channel"), patch(
+        "rice_sdk.state.client.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        yield mock_stub.return_value
+
+
+def test_deadlines_by_method_class():
+    deadlines = Deadlines(read=1, write=2, admin=3, overrides={"Search": 0.5})
+
+    assert deadlines.for_method("Drift") == 1
+    assert deadlines.for_method("Focus") == 2
+    assert deadlines.for_method("Login") == 3
+    assert deadlines.for_method("BatchInsert") == 2
+    assert deadlines.for_method("Search") == 0.5
+    assert deadlines.resolve("Focus", 7) == 7
+
+
+def test_budget_nests_without_extending():
+    assert remaining_budget() is None
+    with budget(1.0):
+        outer = remaining_budget()
+        with budget(10.0):
+            assert remaining_budget() <= outer
+        with budget(0.1):
+            assert remaining_budget() <= 0.1
+        with budget(None):
+            assert 0 < remaining_budget() <= outer
+    assert remaining_budget() is None
+
+
+def test_call_timeout_raises_when_budget_spent():
+    with budget(0.0):
+        with pytest.raises(TimeoutError):
+            call_timeout()
+
+
+def test_state_calls_get_default_and_override_timeouts(mock_cortex_stub):
+    mock_cortex_stub.Drift.return_value = state_pb2.DriftResponse()
+    mock_cortex_stub.Focus.return_value = state_pb2.FocusResponse(id="f")
+
+    client = StateClient(deadlines=Deadlines(read=1.5, write=4.0))
+    client.drift()
+    client.focus("x", timeout=0.25)
+
+    assert 1.4 < mock_cortex_stub.Drift.call_args[1]["timeout"] <= 1.5
+    assert 0.2 < mock_cortex_stub.Focus.call_args[1]["timeout"] <= 0.25
+
+
+def test_budget_caps_a_sequence_of_calls(mock_cortex_stub):
+    def slow_focus(request, metadata=None, timeout=None):
+        time.sleep(0.05)
+        return state_pb2.FocusResponse(id="f")
+
+    mock_cortex_stub.Focus.side_effect = slow_focus
+    client = StateClient()
+
+    with budget(0.08):
+        client.focus("first")
+        second = mock_cortex_stub.Focus.call_args[1]["timeout"]
+        client.focus("second")
+        assert mock_cortex_stub.Focus.call_args[1]["timeout"] < 0.04 < second
+        with pytest.raises(TimeoutError):
+            client.focus("third")
+    assert mock_cortex_stub.Focus.call_count == 2
+
+
+def test_retry_stops_at_budget(mock_cortex_stub):
+    class Unavailable(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.UNAVAILABLE
+
+    mock_cortex_stub.Drift.side_effect = Unavailable()
+    policy = RetryPolicy(max_attempts=5, initial_backoff=0.2, jitter=0)
+    client = StateClient(retry_policy=policy)
+
+    with pytest.raises(grpc.RpcError):
+        client.drift(timeout=0.1)
+    assert mock_cortex_stub.Drift.call_count == 1
+    assert policy.stats.snapshot()["exhausted"] == {"Drift": 1}
+
+
+@pytest.mark.asyncio
+async def test_async_state_passes_timeout():
+    with patch("grpc.aio.insecure_channel"), patch(
+        "rice_sdk.state.client_async.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        stub = mock_stub.return_value
+        stub.Drift = AsyncMock(return_value=state_pb2.DriftResponse())
+
+        client = AsyncStateClient(deadlines=Deadlines(read=2.0))
+        with budget(0.5):
+            await client.drift()
+
+    assert 0 < stub.Drift.call_args[1]["timeout"] <= 0.5
+
+
+def test_http_passes_timeout_to_requests():
+    with patch("requests.Session.request") as request:
+        request.return_value.json.return_value = {"results": []}
+        client = HttpClient(deadlines=Deadlines(read=3.0))
+        client.connected = True
+        client.search("query")
+        client.search("query", timeout=0.5)
+
+    first, second = request.call_args_list
+    assert 2.9 < first[1]["timeout"] <= 3.0
+    assert 0.4 < second[1]["timeout"] <= 0.5
@@ -0,0 +1,83 @@
+import threading
+import pytest
+from unittest.mock import patch
+from rice_sdk.state import DriftTracker
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.proto import state_pb2
+
+
+@pytest.fixture
+def mock_grpc_channel():
+    with patch("grpc.insecure_channel") as mock_channel:
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("rice_sdk.state.client.state_pb2_grpc.CortexStub") as mock_stub:
+        yield mock_stub.return_value
+
+
+def _item(item_id, relevance=0.5, content="c"):
+    return state_pb2.FluxItem(id=item_id, content=content, relevance=relevance)
+
+
+class _RecordingStop(threading.Event):
+    """Records each wait and sets itself after `polls` waits."""
+
+    def __init__(self, polls):
+        super().__init__()
+        self.polls = polls
+        self.waits = []
+
+    def wait(self, timeout=None):
+        self.waits.append(timeout)
+        if len(self.waits) >= self.polls:
+            self.set()
+        return self.is_set()
+
+
+def test_tracker_reports_changes_by_id():
+    tracker = DriftTracker(relevance_tolerance=0.05)
+
+    first = tracker.update([_item("a"), _item("b")])
+    assert [i.id for i in first.added] == ["a", "b"]
+
+    assert not tracker.update([_item("a", 0.52), _item("b")])
+    delta = tracker.update([_item("a", 0.56), _item("c")])
+    assert [i.id for i in delta.changed] == ["a"]
+    assert [i.id for i in delta.added] == ["c"]
+    assert [i.id for i in delta.removed] == ["b"]
+
+    edited = tracker.update([_item("a", 0.56, "new"), _item("c")])
+    assert [i.content for i in edited.changed] == ["new"]
+
+
+def test_watch_drift_yields_deltas_and_backs_off(mock_grpc_channel, mock_cortex_stub):
+    snapshots = [
+        [_item("a")],
+        [_item("a")],
+        [_item("a")],
+        [_item("a"), _item("b")],
+        [_item("b")],
+    ]
+    mock_cortex_stub.Drift.side_effect = [
+        state_pb2.DriftResponse(items=items) for items in snapshots
+    ]
+    stop = _RecordingStop(polls=len(snapshots))
+    client = StateClient(run_id="run-1")
+
+    deltas = list(
+        client.watch_drift(min_interval=0.1, max_interval=0.3, backoff=2, stop=stop)
+    )
+
+    assert [[i.id for i in d.added] for d in deltas] == [["a"], ["b"], []]
+    assert [i.id for i in deltas[2].removed] == ["a"]
+    assert stop.waits == [0.1, 0.2, 0.3, 0.1, 0.1]
+    assert mock_cortex_stub.Drift.call_args[0][0].run_id == "run-1"
+
+
+def test_watch_drift_rejects_bad_intervals(mock_grpc_channel, mock_cortex_stub):
+    client = StateClient()
+    with pytest.raises(ValueError):
+        client.watch_drift(min_interval=1.0, max_interval=0.5)
@@ -0,0 +1,134 @@
+import pytest
+from concurrent.futures import Future
+from unittest.mock import patch
+from rice_sdk import CallFuture, gather
+from rice_sdk.metrics import Metrics
+from rice_sdk.state import VariableCache
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.proto import state_pb2
+from rice_sdk.storage.client_grpc import GrpcClient
+from rice_sdk.storage.proto import ricedb_pb2
+
+
+@pytest.fixture
+def mock_grpc_channel():
+    with patch("grpc.insecure_channel") as mock_channel:
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("rice_sdk.state.client.state_pb2_grpc.CortexStub") as mock_stub:
+        yield mock_stub.return_value
+
+
+@pytest.fixture
+def mock_ricedb_stub():
+    with patch("rice_sdk.storage.client_grpc.ricedb_pb2_grpc.RiceDBStub") as mock_stub:
+        yield mock_stub.return_value
+
+
+def _done(response):
+    future = Future()
+    future.set_result(response)
+    return future
+
+
+def test_submit_overlaps_calls_across_clients(
+    mock_grpc_channel, mock_cortex_stub, mock_ricedb_stub
+):
+    recall = Future()
+    mock_cortex_stub.Reminisce.future.return_value = recall
+    mock_cortex_stub.ListGoals.future.return_value = _done(
+        state_pb2.ListGoalsResponse(goals=[state_pb2.GoalResponse(id="g1")])
+    )
+    mock_ricedb_stub.Health.return_value = ricedb_pb2.HealthResponse(status="ok")
+    mock_ricedb_stub.Search.future.return_value = _done(ricedb_pb2.SearchResponse())
+    state = StateClient(run_id="run-1")
+    storage = GrpcClient()
+    storage.connect()
+
+    memories = state.submit.reminisce("weather")
+    hits = storage.submit.search("weather", k=3)
+    goals = state.submit.list_goals()
+
+    assert isinstance(memories, CallFuture)
+    assert not memories.done()
+    mock_cortex_stub.Reminisce.assert_not_called()
+    assert mock_cortex_stub.Reminisce.future.call_args[0][0].run_id == "run-1"
+    assert mock_ricedb_stub.Search.future.call_args[0][0].k == 3
+    with pytest.raises(TimeoutError):
+        gather(memories, hits, goals, timeout=0.01)
+
+    recall.set_result(state_pb2.RecallResponse(traces=[state_pb2.Trace(input="q")]))
+    traces, results, goal_list = gather(memories, hits, goals, timeout=1)
+    assert traces[0].input == "q"
+    assert len(results) == 0
+    assert goal_list[0]["id"] == "g1"
+
+
+def test_errors_are_raised_from_result(mock_grpc_channel, mock_cortex_stub):
+    failed = Future()
+    failed.set_exception(RuntimeError("boom"))
+    mock_cortex_stub.Focus.future.return_value = failed
+    mock_cortex_stub.Drift.future.return_value = _done(state_pb2.DriftResponse())
+    client = StateClient()
+
+    focus = client.submit.focus("context")
+    drift = client.submit.drift()
+
+    with pytest.raises(RuntimeError, match="boom"):
+        focus.result()
+    assert isinstance(focus.exception(), RuntimeError)
+    error, items = gather(focus, drift, return_exceptions=True)
+    assert isinstance(error, RuntimeError)
+    assert items == []
+
+
+def test_submit_local_results_and_batches(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.SetVariable.future.return_value = _done(
+        state_pb2.Ack(success=True)
+    )
+    client = StateClient(variable_cache=VariableCache())
+
+    batch = client.submit.set_variables({"a": 1, "b": 2})
+    assert batch.result(timeout=1) == {"set": ["a", "b"], "errors": {}}
+
+    cached = client.submit.get_variable("a")
+    assert cached.done()
+    assert cached.result()["value"] == 1
+    mock_cortex_stub.GetVariable.future.assert_not_called()
+
+
+def test_submit_records_metrics(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.Focus.future.return_value = _done(state_pb2.FocusResponse(id="f1"))
+    metrics = Metrics()
+    client = StateClient(metrics=metrics)
+
+    assert client.submit.focus("context").result() == "f1"
+    assert metrics.snapshot()["methods"]["Focus"]["calls"] == 1
+
+
+def test_submit_only_offers_service_calls(mock_grpc_channel, mock_cortex_stub):
+    client = StateClient()
+    assert "reminisce" in dir(client.submit)
+    with pytest.raises(AttributeError):
+        client.submit.set_run_id("other")
+    with pytest.raises(AttributeError):
+        GrpcClient().submit.batch_insert
+
+
+def test_submitted_login_stores_token_without_result(
+    mock_grpc_channel, mock_ricedb_stub
+):
+    login = Future()
+    mock_ricedb_stub.Health.return_value = ricedb_pb2.HealthResponse(status="ok")
+    mock_ricedb_stub.Login.future.return_value = login
+    client = GrpcClient()
+    client.connect()
+
+    client.submit.login("admin", "secret")
+    assert client.token is None
+
+    login.set_result(ricedb_pb2.LoginResponse(token="t1"))
+    assert client.token == "t1"
@@ -0,0 +1,144 @@
+import asyncio
+import threading
+import time
+from concurrent import futures
+import grpc
+import pytest
+from rice_sdk.hedge import HedgePolicy
+from rice_sdk.storage.client_grpc import GrpcClient
+from rice_sdk.storage.proto import ricedb_pb2, ricedb_pb2_grpc
+
+
+def _completed(value=None, error=None, after=0.0):
+    future = futures.Future()
+
+    def finish():
+        time.sleep(after)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(value)
+
+    threading.Thread(target=finish, daemon=True).start()
+    return future
+
+
+def test_fast_call_is_not_hedged():
+    policy = HedgePolicy(delay=0.2)
+    backups = []
+
+    result = policy.call(lambda: _completed("primary"), lambda: backups.append(1))
+
+    assert result == "primary"
+    assert backups == []
+    assert policy.stats()["hedged"] == 0
+
+
+def test_slow_call_is_hedged_and_loser_cancelled():
+    policy = HedgePolicy(delay=0.01)
+    primary = futures.Future()  # never completes
+
+    result = policy.call(lambda: primary, lambda: _completed("backup"))
+
+    assert result == "backup"
+    assert primary.cancelled()
+    stats = policy.stats()
+    assert stats["hedged"] == 1 and stats["backup_wins"] == 1
+
+
+def test_backup_failure_falls_back_to_primary():
+    policy = HedgePolicy(delay=0.01)
+
+    result = policy.call(
+        lambda: _completed("primary", after=0.05),
+        lambda: _completed(error=RuntimeError("backup down")),
+    )
+
+    assert result == "primary"
+    assert policy.stats()["backup_wins"] == 0
+
+
+def test_primary_error_before_delay_is_raised():
+    policy = HedgePolicy(delay=0.5)
+    backups = []
+
+    with pytest.raises(RuntimeError, match="boom"):
+        policy.call(
+            lambda: _completed(error=RuntimeError("boom")), lambda: backups.append(1)
+        )
+    assert backups == []
+
+
+def test_delay_tracks_observed_quantile():
+    policy = HedgePolicy(quantile=0.9, initial_delay=0.5, min_samples=10)
+    assert policy.hedge_delay() == 0.5
+
+    for ms in range(1, 101):
+        policy.histogram.observe(ms / 1000)
+    assert policy.hedge_delay() == pytest.approx(0.09, rel=0.2)
+
+    policy.max_delay = 0.01
+    assert policy.hedge_delay() == 0.01
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_cancels_loser():
+    policy = HedgePolicy(delay=0.01)
+    primary_cancelled = asyncio.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            primary_cancelled.set()
+            raise
+
+    async def fast():
+        return "backup"
+
+    assert await policy.call_async(slow, fast) == "backup"
+    await asyncio.wait_for(primary_cancelled.wait(), 1)
+    assert policy.stats()["backup_wins"] == 1
+
+
+class _SlowFirstSearch(ricedb_pb2_grpc.RiceDBServicer):
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def Health(self, request, context):
+        return ricedb_pb2.HealthResponse(status="ok", version="test")
+
+    def Search(self, request, context):
+        with self.lock:
+            self.calls += 1
+            first = self.calls == 1
+        if first:
+            time.sleep(1.0)
+        return ricedb_pb2.SearchResponse(
+            results=[ricedb_pb2.SearchResult(id=2 if first else 1, similarity=0.5)]
+        )
+
+
+def test_grpc_search_is_hedged_on_a_second_channel():
+    servicer = _SlowFirstSearch()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    ricedb_pb2_grpc.add_RiceDBServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        policy = HedgePolicy(delay=0.05)
+        client = GrpcClient("127.0.0.1", port, hedge_policy=policy)
+        client.connect()
+
+        started = time.monotonic()
+        results = client.search("query")
+        elapsed = time.monotonic() - started
+
+        assert results.ids() == [1]
+        assert elapsed < 0.8
+        assert servicer.calls == 2
+        assert policy.stats()["backup_wins"] == 1
+        client.disconnect()
+    finally:
+        server.stop(None)
@@ -0,0 +1,30 @@
+import pytest
+from rice_sdk.histogram import LatencyHistogram
+
+
+def test_quantiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 101):
+        histogram.observe(ms / 1000)
+
+    assert histogram.count == 100
+    assert histogram.quantile(0.5) == pytest.approx(0.050, rel=0.2)
+    assert histogram.quantile(0.95) == pytest.approx(0.095, rel=0.2)
+    assert histogram.quantile(1.0) == pytest.approx(0.100, rel=0.2)
+
+
+def test_empty_and_overflow():
+    histogram = LatencyHistogram(bounds=[0.1, 1.0])
+    assert histogram.quantile(0.5) == 0.0
+
+    histogram.observe(0.05)
+    histogram.observe(5.0)
+    assert histogram.quantile(1.0) == 1.0
+    assert histogram.snapshot() == {
+        "count": 2,
+        "sum": 5.05,
+        "buckets": {0.1: 1, "+Inf": 1},
+    }
+
+    histogram.reset()
+    assert histogram.count == 0
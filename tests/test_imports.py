@@ -0,0 +1,44 @@
+import json
+import subprocess
+import sys
+import pytest
+import rice_sdk
+
+HEAVY = ("grpc", "requests", "numpy", "dotenv", "asyncio", "google.protobuf")
+
+
+def _loaded_after(code: str):
+    # A fresh interpreter, since this one has imported everything already.
+    script = f"import sys\n{code}\nimport json\nprint(json.dumps(sorted(sys.modules)))"
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    ).stdout
+    modules = set(json.loads(out.splitlines()[-1]))
+    return sorted(m for m in HEAVY if m in modules)
+
+
+def test_import_loads_no_heavy_dependencies():
+    assert _loaded_after("import rice_sdk") == []
+
+
+def test_client_construction_loads_no_heavy_dependencies():
+    assert _loaded_after("from rice_sdk import Client\nClient()") == []
+
+
+def test_http_transport_does_not_load_grpc():
+    code = (
+        "from rice_sdk import RiceDBClient\n"
+        "client = RiceDBClient(transport='http')\n"
+        "client._http_client()"
+    )
+    assert _loaded_after(code) == ["requests"]
+
+
+def test_lazy_exports():
+    assert "StateClient" in dir(rice_sdk)
+    from rice_sdk.state.client import StateClient
+
+    assert rice_sdk.StateClient is StateClient
+    assert "StateClient" in vars(rice_sdk)
+    with pytest.raises(AttributeError):
+        rice_sdk.NotAThing
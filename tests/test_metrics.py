@@ -0,0 +1,157 @@
+import grpc
+import pytest
+from unittest.mock import AsyncMock, patch
+from rice_sdk.codec import JsonCodec
+from rice_sdk.metrics import Metrics, TimedCodec
+from rice_sdk.retry import NO_RETRY
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.client_async import AsyncStateClient
+from rice_sdk.state.proto import state_pb2
+from rice_sdk.storage.client_http import HttpClient
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("grpc.insecure_channel"), patch(
+        "rice_sdk.state.client.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        yield mock_stub.return_value
+
+
+def test_state_calls_are_recorded(mock_cortex_stub):
+    response = state_pb2.VariableResponse(name="x", value_json='{"a": 1}')
+    mock_cortex_stub.GetVariable.return_value = response
+    mock_cortex_stub.Focus.side_effect = _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+    metrics = Metrics()
+    client = StateClient(metrics=metrics, retry_policy=NO_RETRY)
+    assert client.get_variable("x")["value"] == {"a": 1}
+    with pytest.raises(grpc.RpcError):
+        client.focus("task")
+
+    methods = metrics.snapshot()["methods"]
+    get = methods["GetVariable"]
+    assert get["calls"] == 1 and get["errors"] == 0
+    assert get["request_bytes"] > 0
+    assert get["response_bytes"] == response.ByteSize()
+    assert get["latency"]["count"] == 1
+    assert methods["Focus"]["errors"] == 1
+    assert methods["Focus"]["error_codes"] == {"UNAVAILABLE": 1}
+
+
+def test_codec_time_is_recorded(mock_cortex_stub):
+    mock_cortex_stub.SetVariable.return_value = state_pb2.Ack(success=True)
+    metrics = Metrics()
+    client = StateClient(metrics=metrics)
+    assert isinstance(client.codec, TimedCodec)
+
+    client.set_variable("x", {"a": 1})
+
+    codec = metrics.snapshot()["codec"]
+    assert codec["encode"]["count"] == 1
+    assert codec["decode"]["count"] == 0
+
+
+def test_wrap_codec_is_idempotent():
+    metrics = Metrics()
+    wrapped = metrics.wrap_codec(JsonCodec())
+    assert metrics.wrap_codec(wrapped) is wrapped
+    assert wrapped.loads(wrapped.dumpb([1])) == [1]
+
+
+def test_disabled_metrics_leave_codec_untouched(mock_cortex_stub):
+    client = StateClient()
+    assert client.metrics is None
+    assert not isinstance(client.codec, TimedCodec)
+
+
+@pytest.mark.asyncio
+async def test_async_state_calls_are_recorded():
+    with patch("grpc.aio.insecure_channel"), patch(
+        "rice_sdk.state.client_async.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        mock_stub.return_value.Drift = AsyncMock(return_value=state_pb2.DriftResponse())
+        metrics = Metrics()
+        client = AsyncStateClient(metrics=metrics)
+        await client.drift()
+
+    assert metrics.snapshot()["methods"]["Drift"]["calls"] == 1
+
+
+def test_http_calls_record_payload_sizes():
+    with patch("requests.Session.request") as request:
+        resp = request.return_value
+        resp.content = b'{"results": []}'
+        resp.json.return_value = {"results": []}
+        resp.request.body = b'{"query": "q"}'
+
+        metrics = Metrics()
+        client = HttpClient(metrics=metrics)
+        client.connected = True
+        client.search("q")
+
+    search = metrics.snapshot()["methods"]["Search"]
+    assert search["calls"] == 1
+    assert search["request_bytes"] == len(b'{"query": "q"}')
+    assert search["response_bytes"] == len(b'{"results": []}')
+
+
+def test_reset_clears_everything():
+    metrics = Metrics()
+    metrics.record_call("Search", 0.01)
+    metrics.record_codec("decode", 0.001)
+    metrics.reset()
+    snapshot = metrics.snapshot()
+    assert snapshot["methods"] == {}
+    assert snapshot["codec"]["decode"]["count"] == 0
+
+
+def test_prometheus_export():
+    prometheus_client = pytest.importorskip("prometheus_client")
+    registry = prometheus_client.CollectorRegistry()
+    metrics = Metrics()
+    metrics.register_prometheus(registry)
+
+    metrics.record_call("Search", 0.02, sent=10, received=20)
+    metrics.record_call("Search", 0.5, _RpcError(grpc.StatusCode.UNAVAILABLE))
+
+    value = registry.get_sample_value
+    assert value("rice_sdk_calls_total", {"method": "Search"}) == 2
+    assert (
+        value("rice_sdk_errors_total", {"method": "Search", "code": "UNAVAILABLE"}) == 1
+    )
+    assert value("rice_sdk_latency_seconds_count", {"method": "Search"}) == 2
+    assert (
+        value("rice_sdk_payload_bytes_total", {"method": "Search", "direction": "sent"})
+        == 10
+    )
+
+
+def test_opentelemetry_export():
+    pytest.importorskip("opentelemetry.sdk")
+    from opentelemetry.sdk.metrics import MeterProvider
+    from opentelemetry.sdk.metrics.export import InMemoryMetricReader
+
+    reader = InMemoryMetricReader()
+    metrics = Metrics()
+    metrics.register_opentelemetry(MeterProvider(metric_readers=[reader]))
+    metrics.record_call("Reminisce", 0.01)
+
+    data = reader.get_metrics_data()
+    names = {
+        m.name: m
+        for rm in data.resource_metrics
+        for sm in rm.scope_metrics
+        for m in sm.metrics
+    }
+    (point,) = names["rice_sdk.calls"].data.data_points
+    assert point.value == 1
+    assert point.attributes == {"method": "Reminisce"}
@@ -0,0 +1,127 @@
+import grpc
+import pytest
+import requests
+from unittest.mock import AsyncMock, MagicMock, patch
+from rice_sdk.retry import RetryPolicy
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.proto import state_pb2
+from rice_sdk.storage.client_http import HttpClient
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def _policy(**kwargs):
+    return RetryPolicy(initial_backoff=0, **kwargs)
+
+
+def test_retries_idempotent_method_until_success():
+    policy = _policy(max_attempts=3)
+    fn = MagicMock(
+        side_effect=[_RpcError(grpc.StatusCode.UNAVAILABLE), "ok"],
+    )
+
+    assert policy.call("Search", fn, "req", metadata=[]) == "ok"
+    assert fn.call_count == 2
+    fn.assert_called_with("req", metadata=[])
+    assert policy.stats.snapshot() == {"retries": {"Search": 1}, "exhausted": {}}
+
+
+def test_non_idempotent_method_is_sent_once():
+    policy = _policy()
+    fn = MagicMock(side_effect=_RpcError(grpc.StatusCode.UNAVAILABLE))
+
+    with pytest.raises(grpc.RpcError):
+        policy.call("Insert", fn)
+    assert fn.call_count == 1
+    assert policy.stats.snapshot() == {"retries": {}, "exhausted": {}}
+
+
+def test_non_retryable_code_is_raised_immediately():
+    policy = _policy()
+    fn = MagicMock(side_effect=_RpcError(grpc.StatusCode.INVALID_ARGUMENT))
+
+    with pytest.raises(grpc.RpcError):
+        policy.call("Search", fn)
+    assert fn.call_count == 1
+
+
+def test_gives_up_after_max_attempts():
+    policy = _policy(max_attempts=3)
+    fn = MagicMock(side_effect=_RpcError(grpc.StatusCode.UNAVAILABLE))
+
+    with pytest.raises(grpc.RpcError):
+        policy.call("Drift", fn)
+    assert fn.call_count == 3
+    assert policy.stats.snapshot() == {
+        "retries": {"Drift": 2},
+        "exhausted": {"Drift": 1},
+    }
+
+
+def test_backoff_grows_and_is_capped():
+    policy = RetryPolicy(
+        initial_backoff=0.1, multiplier=2.0, max_backoff=0.3, jitter=0.0
+    )
+    assert [policy.backoff(n) for n in range(4)] == [0.1, 0.2, 0.3, 0.3]
+
+    jittered = RetryPolicy(initial_backoff=0.1, jitter=0.5)
+    for _ in range(50):
+        assert 0.05 <= jittered.backoff(0) <= 0.15
+
+
+def test_invalid_policy_arguments():
+    with pytest.raises(ValueError):
+        RetryPolicy(max_attempts=0)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=2)
+
+
+@pytest.mark.asyncio
+async def test_call_async_retries():
+    policy = _policy()
+    fn = AsyncMock(side_effect=[_RpcError(grpc.StatusCode.UNAVAILABLE), "ok"])
+
+    assert await policy.call_async("Reminisce", fn, "req") == "ok"
+    assert fn.await_count == 2
+
+
+def test_state_client_retries_reads_only():
+    with patch("grpc.insecure_channel"), patch(
+        "rice_sdk.state.client.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        stub = mock_stub.return_value
+        stub.Drift.side_effect = [
+            _RpcError(grpc.StatusCode.UNAVAILABLE),
+            state_pb2.DriftResponse(),
+        ]
+        stub.Focus.side_effect = _RpcError(grpc.StatusCode.UNAVAILABLE)
+
+        client = StateClient(retry_policy=_policy())
+        assert client.drift() == []
+        with pytest.raises(grpc.RpcError):
+            client.focus("x")
+
+    assert stub.Drift.call_count == 2
+    assert stub.Focus.call_count == 1
+
+
+def test_http_search_retries_on_503():
+    unavailable = requests.Response()
+    unavailable.status_code = 503
+    ok = requests.Response()
+    ok.status_code = 200
+    ok._content = b'{"results": []}'
+
+    with patch("requests.Session.request", side_effect=[unavailable, ok]) as request:
+        client = HttpClient(retry_policy=_policy())
+        client.connected = True
+        assert client.search("query") == []
+
+    assert request.call_count == 2
+    assert client.retry_policy.stats.snapshot()["retries"] == {"Search": 1}
@@ -1,6 +1,8 @@
 import pytest
+from concurrent.futures import Future
 from unittest.mock import MagicMock, patch
-from rice_sdk.state.client import StateClient
+from rice_sdk.retry import RetryPolicy
+from rice_sdk.state.client import LIST_THRESHOLD, StateClient
 from rice_sdk.state.proto import state_pb2, state_pb2_grpc
 
 
@@ -80,3 +82,120 @@ def test_reminisce(mock_grpc_channel, mock_cortex_stub):
     assert req.run_id == "test-run"
     assert len(memories) == 1
     assert memories[0].input == "old input"
+
+
+def test_state_client_uses_shared_channel(mock_grpc_channel, mock_cortex_stub):
+    shared = MagicMock()
+    client = StateClient(shared_channel=shared)
+
+    mock_grpc_channel.assert_not_called()
+    assert client.channel is shared.acquire.return_value
+
+    client.close()
+    shared.release.assert_called_once()
+    shared.acquire.return_value.close.assert_not_called()
+
+
+def test_wait_ready_times_out_without_server():
+    client = StateClient(address="127.0.0.1:1")
+    try:
+        with pytest.raises(TimeoutError):
+            client.wait_ready(timeout=0.05)
+    finally:
+        client.close()
+
+
+def _future(result=None, error=None):
+    future = Future()
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+    return future
+
+
+def test_set_variables_pipelines_calls(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.SetVariable.future.side_effect = lambda request, **kwargs: (
+        _future(state_pb2.Ack(success=request.name != "nack"))
+        if request.name != "boom"
+        else _future(error=RuntimeError("boom"))
+    )
+
+    client = StateClient(run_id="test-run")
+    result = client.set_variables({"a": 1, "nack": 2, "boom": 3}, source="system")
+
+    assert mock_cortex_stub.SetVariable.future.call_count == 3
+    mock_cortex_stub.SetVariable.assert_not_called()
+    request = mock_cortex_stub.SetVariable.future.call_args_list[0][0][0]
+    assert (request.run_id, request.value_json, request.source) == (
+        "test-run",
+        "1",
+        "system",
+    )
+    assert result == {
+        "set": ["a"],
+        "errors": {"nack": "not acknowledged", "boom": "boom"},
+    }
+
+
+def test_get_variables_pipelines_small_sets(mock_grpc_channel, mock_cortex_stub):
+    def get(request, **kwargs):
+        if request.name == "missing":
+            return _future(error=RuntimeError("not found"))
+        return _future(
+            state_pb2.VariableResponse(name=request.name, value_json='"v"', source="s")
+        )
+
+    mock_cortex_stub.GetVariable.future.side_effect = get
+
+    client = StateClient(run_id="test-run")
+    result = client.get_variables(["a", "missing", "b", "a"])
+
+    assert mock_cortex_stub.GetVariable.future.call_count == 3
+    assert list(result["variables"]) == ["a", "b"]
+    assert result["variables"]["b"] == {"name": "b", "value": "v", "source": "s"}
+    assert result["errors"] == {"missing": "not found"}
+
+
+def test_get_variables_retries_pipelined_calls(mock_grpc_channel, mock_cortex_stub):
+    import grpc
+
+    class Unavailable(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.UNAVAILABLE
+
+    mock_cortex_stub.GetVariable.future.side_effect = lambda request, **kwargs: (
+        _future(error=Unavailable())
+        if request.name == "flaky"
+        else _future(state_pb2.VariableResponse(name=request.name, value_json="1"))
+    )
+    mock_cortex_stub.GetVariable.return_value = state_pb2.VariableResponse(
+        name="flaky", value_json="2"
+    )
+    policy = RetryPolicy(initial_backoff=0)
+
+    client = StateClient(run_id="test-run", retry_policy=policy)
+    result = client.get_variables(["a", "flaky"])
+
+    assert result["errors"] == {}
+    assert result["variables"]["flaky"]["value"] == 2
+    mock_cortex_stub.GetVariable.assert_called_once()
+    assert policy.stats.snapshot()["retries"] == {"GetVariable": 1}
+
+
+def test_get_variables_lists_large_sets(mock_grpc_channel, mock_cortex_stub):
+    names = [f"v{i}" for i in range(LIST_THRESHOLD + 1)]
+    mock_cortex_stub.ListVariables.return_value = state_pb2.ListVariablesResponse(
+        variables=[
+            state_pb2.VariableResponse(name=name, value_json="1")
+            for name in names[1:] + ["other"]
+        ]
+    )
+
+    client = StateClient(run_id="test-run")
+    result = client.get_variables(names)
+
+    mock_cortex_stub.ListVariables.assert_called_once()
+    mock_cortex_stub.GetVariable.future.assert_not_called()
+    assert list(result["variables"]) == names[1:]
+    assert result["errors"] == {"v0": "not found"}
@@ -0,0 +1,84 @@
+import pytest
+from unittest.mock import AsyncMock, patch
+from rice_sdk.state.client_async import AsyncStateClient
+from rice_sdk.state.proto import state_pb2
+
+
+@pytest.fixture
+def mock_aio_channel():
+    with patch("grpc.aio.insecure_channel") as mock_channel:
+        mock_channel.return_value.close = AsyncMock()
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("rice_sdk.state.client_async.state_pb2_grpc.CortexStub") as mock_stub:
+        yield mock_stub.return_value
+
+
+@pytest.mark.asyncio
+async def test_async_focus(mock_aio_channel, mock_cortex_stub):
+    mock_cortex_stub.Focus = AsyncMock(
+        return_value=state_pb2.FocusResponse(id="focus-123")
+    )
+
+    client = AsyncStateClient(token="my-token", run_id="test-run")
+    response = await client.focus("Task Context")
+
+    request = mock_cortex_stub.Focus.call_args[0][0]
+    assert request.content == "Task Context"
+    assert request.run_id == "test-run"
+    assert mock_cortex_stub.Focus.call_args[1]["metadata"] == [
+        ("authorization", "my-token")
+    ]
+    assert response == "focus-123"
+
+
+@pytest.mark.asyncio
+async def test_async_get_variable(mock_aio_channel, mock_cortex_stub):
+    mock_cortex_stub.GetVariable = AsyncMock(
+        return_value=state_pb2.VariableResponse(
+            name="plan", value_json='{"step": 2}', source="system"
+        )
+    )
+
+    client = AsyncStateClient(run_id="test-run")
+    variable = await client.get_variable("plan")
+
+    assert variable == {"name": "plan", "value": {"step": 2}, "source": "system"}
+
+
+@pytest.mark.asyncio
+async def test_async_reminisce_and_close(mock_aio_channel, mock_cortex_stub):
+    mock_cortex_stub.Reminisce = AsyncMock(
+        return_value=state_pb2.RecallResponse(
+            traces=[state_pb2.Trace(input="old input", outcome="old output")]
+        )
+    )
+
+    client = AsyncStateClient(run_id="test-run")
+    memories = await client.reminisce("query", limit=5)
+
+    req = mock_cortex_stub.Reminisce.call_args[0][0]
+    assert req.limit == 5
+    assert memories[0].input == "old input"
+
+    await client.close()
+    mock_aio_channel.return_value.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_get_variables(mock_aio_channel, mock_cortex_stub):
+    async def get(request, **kwargs):
+        if request.name == "missing":
+            raise RuntimeError("not found")
+        return state_pb2.VariableResponse(name=request.name, value_json="1")
+
+    mock_cortex_stub.GetVariable = AsyncMock(side_effect=get)
+
+    client = AsyncStateClient(run_id="test-run")
+    result = await client.get_variables(["a", "missing"])
+
+    assert result["variables"]["a"]["value"] == 1
+    assert result["errors"] == {"missing": "not found"}
@@ -0,0 +1,161 @@
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from rice_sdk.state import VariableCache
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.client_async import AsyncStateClient
+from rice_sdk.state.proto import state_pb2
+
+
+@pytest.fixture
+def mock_grpc_channel():
+    with patch("grpc.insecure_channel") as mock_channel:
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("rice_sdk.state.client.state_pb2_grpc.CortexStub") as mock_stub:
+        yield mock_stub.return_value
+
+
+def _variable(name, value_json, last_updated="1", access_count=1):
+    return state_pb2.VariableResponse(
+        name=name,
+        value_json=value_json,
+        source="explicit",
+        last_updated=last_updated,
+        access_count=access_count,
+    )
+
+
+def _client(cache=None):
+    return StateClient(run_id="run-1", variable_cache=cache or VariableCache())
+
+
+def test_repeated_get_is_served_from_cache(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.GetVariable.return_value = _variable("plan", '{"step": 1}')
+    client = _client()
+
+    first = client.get_variable("plan")
+    second = client.get_variable("plan")
+
+    assert (
+        first == second == {"name": "plan", "value": {"step": 1}, "source": "explicit"}
+    )
+    mock_cortex_stub.GetVariable.assert_called_once()
+    assert client.variable_cache.stats()["hits"] == 1
+
+
+def test_set_populates_and_delete_invalidates(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.SetVariable.return_value = state_pb2.Ack(success=True)
+    mock_cortex_stub.DeleteVariable.return_value = state_pb2.Ack(success=True)
+    mock_cortex_stub.GetVariable.return_value = _variable("name", '"Bob"')
+    client = _client()
+
+    assert client.set_variable("name", "Alice") is True
+    assert client.get_variable("name")["value"] == "Alice"
+    mock_cortex_stub.GetVariable.assert_not_called()
+
+    client.delete_variable("name")
+    assert client.get_variable("name")["value"] == "Bob"
+    mock_cortex_stub.GetVariable.assert_called_once()
+
+
+def test_failed_set_is_not_cached(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.GetVariable.return_value = _variable("name", '"Alice"')
+    mock_cortex_stub.SetVariable.return_value = state_pb2.Ack(success=False)
+    client = _client()
+    client.get_variable("name")
+
+    assert client.set_variable("name", "Bob") is False
+    assert client.get_variable("name")["value"] == "Alice"
+    assert mock_cortex_stub.GetVariable.call_count == 2
+
+
+def test_list_fills_cache_and_serves_listings(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.ListVariables.return_value = state_pb2.ListVariablesResponse(
+        variables=[_variable("a", "1"), _variable("b", "[2]")]
+    )
+    client = _client()
+
+    listed = client.list_variables()
+    assert [v["value"] for v in listed] == [1, [2]]
+    assert client.list_variables() == listed
+    assert client.get_variable("b")["value"] == [2]
+    mock_cortex_stub.ListVariables.assert_called_once()
+    mock_cortex_stub.GetVariable.assert_not_called()
+
+
+def test_run_changes_invalidate(mock_grpc_channel, mock_cortex_stub):
+    mock_cortex_stub.GetVariable.return_value = _variable("plan", "1")
+    mock_cortex_stub.DeleteRun.return_value = state_pb2.Ack(success=True)
+    client = _client()
+
+    client.get_variable("plan")
+    client.set_run_id("run-2")
+    client.get_variable("plan")
+    assert mock_cortex_stub.GetVariable.call_args[0][0].run_id == "run-2"
+    client.delete_run()
+    client.get_variable("plan")
+
+    assert mock_cortex_stub.GetVariable.call_count == 3
+    assert client.variable_cache.stats()["size"] == 1
+
+
+def test_unchanged_value_is_not_decoded_again():
+    cache = VariableCache(ttl=10)
+    decode = MagicMock(side_effect=lambda r: {"name": r.name, "value": r.value_json})
+
+    cache.store("run", _variable("v", "1", last_updated="1", access_count=1), decode)
+    cache.store("run", _variable("v", "1", last_updated="1", access_count=2), decode)
+    assert decode.call_count == 1
+    cache.store("run", _variable("v", "2", last_updated="2", access_count=3), decode)
+    assert decode.call_count == 2
+    assert cache.stats()["decodes_saved"] == 1
+
+
+def test_stale_responses_do_not_replace_newer_entries():
+    cache = VariableCache(ttl=10)
+    decode = lambda r: {"name": r.name, "value": r.value_json}
+
+    cache.store("run", _variable("v", "new", last_updated="2", access_count=5), decode)
+    older = cache.store("run", _variable("v", "new", "2", access_count=4), decode)
+    assert older["value"] == "new"
+
+    # A read sent before a write through this client still carries the
+    # version the write replaced.
+    replaced = cache.invalidate("run", "v")
+    cache.written("run", "v", "mine", {"name": "v", "value": "mine"}, replaced)
+    assert cache.store("run", _variable("v", "new", "2", 6), decode)["value"] == "mine"
+    assert cache.store("run", _variable("v", "mine", "3", 7), decode)["value"] == "mine"
+    assert cache.get("run", "v")["value"] == "mine"
+
+
+def test_ttl_and_eviction():
+    now = [0.0]
+    cache = VariableCache(max_entries=2, ttl=5, clock=lambda: now[0])
+    decode = lambda r: {"name": r.name, "value": r.value_json}
+
+    cache.store_list("run", [_variable("a", "1"), _variable("b", "2")], decode)
+    cache.store("run", _variable("c", "3"), decode)
+    assert cache.list("run") is None
+    assert cache.get("run", "a") is None
+    assert cache.get("run", "c") is not None
+    now[0] = 6
+    assert cache.get("run", "c") is None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["expirations"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_cache():
+    with patch("grpc.aio.insecure_channel"), patch(
+        "rice_sdk.state.client_async.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+        stub = mock_stub.return_value
+        stub.GetVariable = AsyncMock(return_value=_variable("plan", "1"))
+        client = AsyncStateClient(run_id="run-1", variable_cache=VariableCache())
+
+        assert (await client.get_variable("plan"))["value"] == 1
+        assert (await client.get_variable("plan"))["value"] == 1
+        stub.GetVariable.assert_called_once()
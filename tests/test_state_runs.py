@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import pytest
+from concurrent.futures import Future, ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+from rice_sdk.state import StateRun
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.client_async import AsyncStateClient
+from rice_sdk.state.proto import state_pb2
+
+
+@pytest.fixture
+def mock_grpc_channel():
+    with patch("grpc.insecure_channel") as mock_channel:
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("rice_sdk.state.client.state_pb2_grpc.CortexStub") as mock_stub:
+        yield mock_stub
+
+
+def test_runs_share_the_client_channel(mock_grpc_channel, mock_cortex_stub):
+    stub = mock_cortex_stub.return_value
+    stub.Focus.side_effect = lambda request, **kwargs: state_pb2.FocusResponse(
+        id=request.run_id
+    )
+    client = StateClient(run_id="default")
+
+    def work(i):
+        return client.run(f"run-{i}").focus("context")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        ids = list(pool.map(work, range(100)))
+
+    assert ids == [f"run-{i}" for i in range(100)]
+    assert mock_grpc_channel.call_count == 1
+    assert mock_cortex_stub.call_count == 1
+    assert client.run_id == "default"
+
+
+def test_run_view_is_independent_of_the_client(mock_grpc_channel, mock_cortex_stub):
+    stub = mock_cortex_stub.return_value
+    stub.DeleteRun.return_value = state_pb2.Ack(success=True)
+    client = StateClient(run_id="default")
+    view = client.run("a")
+
+    assert isinstance(view, StateRun)
+    client.set_run_id("b")
+    view.delete_run()
+    assert stub.DeleteRun.call_args[0][0].run_id == "a"
+    assert view.run("c").run_id == "c"
+    assert client.run_id == "b"
+
+
+def test_run_view_submit_and_watch(mock_grpc_channel, mock_cortex_stub):
+    stub = mock_cortex_stub.return_value
+    done = Future()
+    done.set_result(state_pb2.RecallResponse())
+    stub.Reminisce.future.return_value = done
+    stub.Drift.return_value = state_pb2.DriftResponse(
+        items=[state_pb2.FluxItem(id="x")]
+    )
+    view = StateClient().run("a")
+
+    assert view.submit.reminisce("q").result() == []
+    assert stub.Reminisce.future.call_args[0][0].run_id == "a"
+
+    stop = threading.Event()
+    delta = next(view.watch_drift(stop=stop))
+    stop.set()
+    assert [i.id for i in delta.added] == ["x"]
+    assert stub.Drift.call_args[0][0].run_id == "a"
+
+
+@pytest.mark.asyncio
+async def test_async_runs_in_concurrent_tasks():
+    with patch("grpc.aio.insecure_channel"), patch(
+        "rice_sdk.state.client_async.state_pb2_grpc.CortexStub"
+    ) as mock_stub:
+
+        async def focus(request, **kwargs):
+            await asyncio.sleep(0)
+            return state_pb2.FocusResponse(id=request.run_id)
+
+        mock_stub.return_value.Focus = AsyncMock(side_effect=focus)
+        client = AsyncStateClient()
+
+        ids = await asyncio.gather(
+            *(client.run(f"run-{i}").focus("context") for i in range(20))
+        )
+
+        assert ids == [f"run-{i}" for i in range(20)]
+        assert mock_stub.call_count == 1
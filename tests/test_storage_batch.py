@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import time
+import grpc
+import pytest
+from unittest.mock import MagicMock, patch
+from rice_sdk.retry import IDEMPOTENT_METHODS, RetryPolicy
+from rice_sdk.storage.batch import (
+    BatchNotSupportedError,
+    fan_out_insert,
+    fan_out_insert_async,
+)
+from rice_sdk.storage.client import RiceDBClient
+from rice_sdk.storage.client_grpc import GrpcClient
+from rice_sdk.storage.proto import ricedb_pb2
+
+
+class _RpcError(grpc.RpcError):
+    def __init__(self, code):
+        self._code = code
+
+    def code(self):
+        return self._code
+
+
+def _items(n):
+    return [{"nodeId": i, "text": f"text {i}"} for i in range(n)]
+
+
+def test_fan_out_bounds_concurrency_and_keeps_order():
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+
+    def insert(node_id, text, metadata, user_id, session_id, embedding):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        # Later items finish first to check ordering of the summary.
+        time.sleep(0.002 * (10 - node_id))
+        with lock:
+            state["running"] -= 1
+        return {"success": True, "nodeId": node_id, "message": ""}
+
+    result = fan_out_insert(insert, _items(10), max_in_flight=3)
+
+    assert state["peak"] <= 3
+    assert result["nodeIds"] == list(range(10))
+    assert result["totalInserted"] == 10
+    assert result["failed"] == 0
+
+
+@pytest.mark.parametrize(
+    "idempotent, passed, attempts",
+    [
+        # Retried by the fan-out, under the default policy.
+        (IDEMPOTENT_METHODS, True, 2),
+        # Retried by the transport; the fan-out does not retry on top.
+        (IDEMPOTENT_METHODS | {"Insert"}, True, 2),
+        (IDEMPOTENT_METHODS, False, 1),
+    ],
+)
+def test_fan_out_retries_keyed_inserts(idempotent, passed, attempts):
+    policy = RetryPolicy(initial_backoff=0, idempotent_methods=idempotent)
+    calls = []
+
+    def send(request, **kwargs):
+        calls.append(request.id)
+        if request.id == 1 and calls.count(1) == 1:
+            raise _RpcError(grpc.StatusCode.UNAVAILABLE)
+        if request.id == 2:
+            raise _RpcError(grpc.StatusCode.INVALID_ARGUMENT)
+        return ricedb_pb2.InsertResponse(success=True, nodeId=request.id)
+
+    with patch("grpc.insecure_channel"), patch(
+        "rice_sdk.storage.client_grpc.ricedb_pb2_grpc.RiceDBStub"
+    ) as mock_stub:
+        mock_stub.return_value.Insert.side_effect = send
+        client = GrpcClient(retry_policy=policy)
+        client.client = mock_stub.return_value
+        result = fan_out_insert(
+            client.insert,
+            _items(3),
+            max_in_flight=2,
+            retry_policy=policy if passed else None,
+        )
+
+    assert calls.count(1) == attempts
+    assert calls.count(2) == 1
+    assert result["failed"] == 3 - attempts
+    assert result["errors"][-1].startswith("node 2:")
+    assert policy.stats.snapshot()["retries"] == (
+        {"Insert": 1} if attempts == 2 else {}
+    )
+    assert policy.idempotent_methods == frozenset(idempotent)
+
+
+@pytest.mark.asyncio
+async def test_fan_out_async_retries_keyed_inserts():
+    policy = RetryPolicy(initial_backoff=0)
+    attempts = []
+
+    async def insert(node_id, text, metadata, user_id, session_id, embedding):
+        attempts.append(node_id)
+        if len(attempts) == 1:
+            raise _RpcError(grpc.StatusCode.UNAVAILABLE)
+        return {"success": True, "nodeId": node_id, "message": ""}
+
+    result = await fan_out_insert_async(insert, _items(1), retry_policy=policy)
+
+    assert attempts == [0, 0]
+    assert result["nodeIds"] == [0]
+    assert policy.stats.snapshot()["retries"] == {"Insert": 1}
+
+
+@pytest.mark.asyncio
+async def test_fan_out_async_bounds_concurrency():
+    state = {"running": 0, "peak": 0}
+
+    async def insert(node_id, text, metadata, user_id, session_id, embedding):
+        state["running"] += 1
+        state["peak"] = max(state["peak"], state["running"])
+        await asyncio.sleep(0.001)
+        state["running"] -= 1
+        return {"success": True, "nodeId": node_id, "message": ""}
+
+    result = await fan_out_insert_async(insert, _items(20), max_in_flight=4)
+
+    assert state["peak"] == 4
+    assert result["nodeIds"] == list(range(20))
+
+
+def test_ricedb_client_falls_back_to_fan_out():
+    client = RiceDBClient(transport="grpc")
+    client.client = MagicMock()
+    client.connected = True
+
+    def batch_insert(items, user_id, chunk_size):
+        first = [next(items) for _ in range(chunk_size)]
+        raise BatchNotSupportedError("BatchInsert is not implemented", first)
+
+    client.client.batch_insert.side_effect = batch_insert
+    client.client.insert.side_effect = lambda node_id, *args: {
+        "success": True,
+        "nodeId": node_id,
+        "message": "",
+    }
+
+    result = client.batch_insert(_items(5), chunk_size=2)
+
+    assert result["totalInserted"] == 5
+    assert sorted(c[0][0] for c in client.client.insert.call_args_list) == [
+        0,
+        1,
+        2,
+        3,
+        4,
+    ]
+    assert client.batch_supported is False
+
+    client.batch_insert(_items(2))
+    assert client.client.batch_insert.call_count == 1
@@ -0,0 +1,116 @@
+import pytest
+from unittest.mock import MagicMock
+from rice_sdk.storage.cache import SearchCache
+from rice_sdk.storage.client import RiceDBClient
+from rice_sdk.storage.results import SearchResult, SearchResults
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _results(*ids):
+    return SearchResults(SearchResult(i, 0.5, metadata={}) for i in ids)
+
+
+def _client(cache):
+    client = RiceDBClient(transport="grpc", search_cache=cache)
+    client.client = MagicMock()
+    client.connected = True
+    client.client.search.side_effect = lambda *args: _results(1, 2)
+    return client
+
+
+def test_key_normalizes_inputs():
+    key = SearchCache.make_key("q", "7", 5, None, {"b": 1, "a": 2}, [0.5, 1.0])
+    same = SearchCache.make_key("q", 7, 5, "", {"a": 2, "b": 1}, (0.5, 1.0))
+    assert key == same
+    assert key != SearchCache.make_key("q", 7, 5, None, None, [0.5, 1.0])
+
+
+def test_key_matches_numpy_embedding():
+    np = pytest.importorskip("numpy")
+    assert SearchCache.make_key("q", 1, 5, query_embedding=[0.5, 1.0]) == (
+        SearchCache.make_key("q", 1, 5, query_embedding=np.array([0.5, 1.0]))
+    )
+
+
+def test_lru_eviction_and_ttl():
+    clock = FakeClock()
+    cache = SearchCache(max_entries=2, ttl=10, clock=clock)
+    keys = [SearchCache.make_key(f"q{i}", 1, 5) for i in range(3)]
+
+    cache.put(keys[0], _results(1))
+    cache.put(keys[1], _results(2))
+    assert cache.get(keys[0]).ids() == [1]
+    cache.put(keys[2], _results(3))
+
+    assert cache.get(keys[1]) is None
+    clock.now = 11
+    assert cache.get(keys[0]) is None
+    assert cache.stats() == {
+        "size": 1,
+        "hits": 1,
+        "misses": 2,
+        "evictions": 1,
+        "expirations": 1,
+        "invalidations": 0,
+    }
+
+
+def test_client_serves_repeated_search_from_cache():
+    cache = SearchCache()
+    client = _client(cache)
+
+    first = client.search("weather", user_id=1, k=5, filter_dict={"a": 1})
+    second = client.search("weather", user_id=1, k=5, filter_dict={"a": 1})
+
+    assert client.client.search.call_count == 1
+    assert second.ids() == first.ids()
+    assert second is not first
+    assert cache.stats()["hits"] == 1
+
+
+def test_writes_invalidate_affected_entries():
+    cache = SearchCache()
+    client = _client(cache)
+    client.client.insert.return_value = {"success": True}
+    client.client.batch_insert.return_value = {"totalInserted": 1}
+
+    client.search("q", user_id=1)
+    client.search("q", user_id=2)
+    client.insert(10, "text", user_id=1)
+    assert cache.stats()["size"] == 1
+
+    client.search("q", user_id=1)
+    client.batch_insert([{"nodeId": 11, "text": "t"}], user_id=1)
+    assert cache.stats()["size"] == 1
+
+    client.delete(2)
+    assert cache.stats()["size"] == 0
+    assert cache.stats()["invalidations"] == 3
+
+
+def test_cached_results_are_isolated_from_callers():
+    cache = SearchCache()
+    key = SearchCache.make_key("q", 1, 5)
+    stored = SearchResults(
+        [
+            SearchResult(1, 0.5, metadata={"tags": ["a"]}),
+            SearchResult(2, 0.4, b'{"tags": ["b"]}'),
+        ]
+    )
+    cache.put(key, stored)
+    stored[0].metadata["tags"].append("after put")
+
+    first = cache.get(key)
+    first[0].metadata["tags"].append("x")
+    first[1].metadata["tags"].append("y")
+    first.pop()
+
+    second = cache.get(key)
+    assert [r.metadata["tags"] for r in second] == [["a"], ["b"]]
@@ -1,6 +1,8 @@
 import pytest
+import grpc
 import json
 from unittest.mock import MagicMock, patch
+from rice_sdk.storage.batch import BatchNotSupportedError
 from rice_sdk.storage.client_grpc import GrpcClient
 from rice_sdk.storage.proto import ricedb_pb2, ricedb_pb2_grpc
 
@@ -75,3 +77,74 @@ def test_search(mock_grpc_channel, mock_ricedb_stub):
     assert len(results) == 1
     assert results[0]["id"] == 1
     assert results[0]["data"] == "text"
+
+
+def test_batch_insert_streams_chunks(mock_grpc_channel, mock_ricedb_stub):
+    streamed = []
+
+    def batch_insert(request_iterator, metadata=None, timeout=None):
+        reqs = list(request_iterator)
+        streamed.append(reqs)
+        return ricedb_pb2.BatchInsertResponse(
+            count=len(reqs), nodeIds=[r.id for r in reqs]
+        )
+
+    mock_ricedb_stub.BatchInsert.side_effect = batch_insert
+
+    client = GrpcClient()
+    client.connect()
+
+    items = [{"nodeId": i, "text": f"text {i}"} for i in range(5)]
+    result = client.batch_insert(items, user_id=7, chunk_size=2)
+
+    assert [len(chunk) for chunk in streamed] == [2, 2, 1]
+    assert streamed[0][0].userId == 7
+    assert json.loads(streamed[0][0].metadata)["stored_text"] == "text 0"
+    assert result["totalInserted"] == 5
+    assert result["nodeIds"] == [0, 1, 2, 3, 4]
+    assert result["failed"] == 0
+    assert result["errors"] == []
+
+
+def test_batch_insert_reports_failed_chunks(mock_grpc_channel, mock_ricedb_stub):
+    calls = []
+
+    def batch_insert(request_iterator, metadata=None, timeout=None):
+        reqs = list(request_iterator)
+        calls.append(reqs)
+        if len(calls) == 1:
+            raise RuntimeError("stream reset")
+        return ricedb_pb2.BatchInsertResponse(
+            count=len(reqs), nodeIds=[r.id for r in reqs]
+        )
+
+    mock_ricedb_stub.BatchInsert.side_effect = batch_insert
+
+    client = GrpcClient()
+    client.connect()
+
+    items = [{"nodeId": i, "text": "t"} for i in range(3)]
+    items.append({"nodeId": "not-a-number", "text": "t"})
+    result = client.batch_insert(items, chunk_size=2)
+
+    assert result["totalInserted"] == 1
+    assert result["nodeIds"] == [2]
+    assert result["failed"] == 3
+    assert "chunk 0 (2 items): stream reset" in result["errors"][0]
+    assert "not-a-number" in result["errors"][1]
+
+
+def test_batch_insert_unimplemented_raises(mock_grpc_channel, mock_ricedb_stub):
+    class Unimplemented(grpc.RpcError):
+        def code(self):
+            return grpc.StatusCode.UNIMPLEMENTED
+
+    mock_ricedb_stub.BatchInsert.side_effect = Unimplemented()
+
+    client = GrpcClient()
+    client.connect()
+
+    items = [{"nodeId": i, "text": "t"} for i in range(3)]
+    with pytest.raises(BatchNotSupportedError) as exc_info:
+        client.batch_insert(items, chunk_size=2)
+    assert [item["nodeId"] for item in exc_info.value.chunk] == [0, 1]
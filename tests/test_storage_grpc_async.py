@@ -0,0 +1,119 @@
+import pytest
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from rice_sdk.storage.client_async import AsyncRiceDBClient
+from rice_sdk.storage.client_grpc_async import AsyncGrpcClient
+from rice_sdk.storage.proto import ricedb_pb2
+
+
+@pytest.fixture
+def mock_aio_channel():
+    with patch("grpc.aio.insecure_channel") as mock_channel:
+        mock_channel.return_value.close = AsyncMock()
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_ricedb_stub():
+    with patch(
+        "rice_sdk.storage.client_grpc_async.ricedb_pb2_grpc.RiceDBStub"
+    ) as mock_stub:
+        stub = mock_stub.return_value
+        stub.Health = AsyncMock(
+            return_value=ricedb_pb2.HealthResponse(status="ok", version="1.0")
+        )
+        stub.Insert = AsyncMock()
+        stub.Search = AsyncMock()
+        stub.BatchInsert = AsyncMock()
+        yield stub
+
+
+@pytest.mark.asyncio
+async def test_async_grpc_client_connect(mock_aio_channel, mock_ricedb_stub):
+    client = AsyncGrpcClient(host="localhost", port=50051)
+    connected = await client.connect()
+
+    assert connected is True
+    args, kwargs = mock_aio_channel.call_args
+    assert args[0] == "localhost:50051"
+    assert "options" in kwargs
+    mock_ricedb_stub.Health.assert_awaited_once()
+
+    await client.disconnect()
+    mock_aio_channel.return_value.close.assert_awaited_once()
+    assert client.channel is None
+
+
+@pytest.mark.asyncio
+async def test_async_connect_closes_channels_on_failed_health(
+    mock_aio_channel, mock_ricedb_stub
+):
+    from rice_sdk.hedge import HedgePolicy
+
+    mock_ricedb_stub.Health.side_effect = ConnectionError("down")
+    client = AsyncGrpcClient(hedge_policy=HedgePolicy())
+
+    with pytest.raises(ConnectionError, match="down"):
+        await client.connect()
+
+    assert mock_aio_channel.return_value.close.await_count == 2
+    assert client.channel is None
+    assert client.hedge_channel is None
+    assert client.connected is False
+
+
+@pytest.mark.asyncio
+async def test_async_insert_and_search(mock_aio_channel, mock_ricedb_stub):
+    mock_ricedb_stub.Insert.return_value = ricedb_pb2.InsertResponse(
+        success=True, nodeId=123
+    )
+    meta = json.dumps({"stored_text": "text"}).encode("utf-8")
+    mock_ricedb_stub.Search.return_value = ricedb_pb2.SearchResponse(
+        results=[ricedb_pb2.SearchResult(id=1, similarity=0.9, metadata=meta)]
+    )
+
+    client = AsyncRiceDBClient(token="secret")
+    await client.connect()
+
+    result = await client.insert(123, "text", {"key": "value"})
+    req = mock_ricedb_stub.Insert.call_args[0][0]
+    assert req.id == 123
+    assert json.loads(req.metadata)["stored_text"] == "text"
+    assert mock_ricedb_stub.Insert.call_args[1]["metadata"] == [
+        ("authorization", "Bearer secret")
+    ]
+    assert result["success"] is True
+
+    results = await client.search("query", k=3)
+    req = mock_ricedb_stub.Search.call_args[0][0]
+    assert req.queryText == "query"
+    assert req.k == 3
+    assert results[0]["data"] == "text"
+
+
+@pytest.mark.asyncio
+async def test_async_batch_insert(mock_aio_channel, mock_ricedb_stub):
+    async def batch_insert(request_iterator, metadata=None, timeout=None):
+        reqs = list(request_iterator)
+        return ricedb_pb2.BatchInsertResponse(
+            count=len(reqs), nodeIds=[r.id for r in reqs]
+        )
+
+    mock_ricedb_stub.BatchInsert.side_effect = batch_insert
+
+    client = AsyncRiceDBClient()
+    await client.connect()
+
+    items = [{"nodeId": i, "text": "t"} for i in range(3)]
+    result = await client.batch_insert(items, chunk_size=2)
+
+    assert mock_ricedb_stub.BatchInsert.await_count == 2
+    assert result["totalInserted"] == 3
+    assert result["nodeIds"] == [0, 1, 2]
+
+
+@pytest.mark.asyncio
+async def test_async_client_requires_connect():
+    client = AsyncRiceDBClient()
+    with pytest.raises(RuntimeError, match="Not connected"):
+        await client.search("query")
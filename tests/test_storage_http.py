@@ -1,71 +1,225 @@
 import pytest
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import MagicMock, patch
 from rice_sdk.storage.client_http import HttpClient
 
 
-def test_http_client_connect():
-    with patch("requests.get") as mock_get:
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"status": "ok", "version": "1.0"}
+class _BulkHandler(BaseHTTPRequestHandler):
+    """Stand-in for the RiceDB bulk endpoint; decodes chunked request bodies."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding") != "chunked":
+            return self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        body = b""
+        while True:
+            size = int(self.rfile.readline().strip(), 16)
+            if size == 0:
+                self.rfile.readline()
+                return body
+            body += self.rfile.read(size)
+            self.rfile.readline()
+
+    def do_POST(self):
+        body = self._read_body()
+        content_type = self.headers.get("Content-Type")
+        if content_type == "application/x-ndjson":
+            nodes = [json.loads(line) for line in body.splitlines() if line]
+        else:
+            nodes = json.loads(body)
+        self.server.requests.append(
+            {
+                "path": self.path,
+                "content_type": content_type,
+                "chunked": self.headers.get("Transfer-Encoding") == "chunked",
+                "nodes": nodes,
+            }
+        )
+        if any(node["text"] == "reject" for node in nodes):
+            self.send_response(400)
+            reply = b"{}"
+        else:
+            self.send_response(200)
+            reply = json.dumps(
+                {"count": len(nodes), "node_ids": [n["id"] for n in nodes]}
+            ).encode("utf-8")
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
 
-        client = HttpClient(host="localhost", port=3000)
-        connected = client.connect()
 
-        assert connected is True
-        args, kwargs = mock_get.call_args
-        assert args[0] == "http://localhost:3000/health"
-        assert kwargs["headers"] == {"Content-Type": "application/json"}
+@pytest.fixture
+def bulk_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BulkHandler)
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
 
 
-def test_insert_http():
-    with patch("requests.post") as mock_post:
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            "success": True,
-            "node_id": 123,
-            "message": "ok",
-        }
+@pytest.fixture
+def mock_request():
+    with patch("requests.Session.request") as mock:
+        mock.return_value.status_code = 200
+        yield mock
 
-        client = HttpClient()
-        client.connected = True
 
-        metadata = {"key": "value"}
-        result = client.insert(123, "text", metadata)
+def test_http_client_connect(mock_request):
+    mock_request.return_value.json.return_value = {"status": "ok", "version": "1.0"}
 
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert args[0] == "http://localhost:3000/v1/nodes"
+    client = HttpClient(host="localhost", port=3000)
+    connected = client.connect()
 
-        data = kwargs["json"]
-        assert data["id"] == 123
-        assert data["text"] == "text"
-        assert data["metadata"]["key"] == "value"
+    assert connected is True
+    args, kwargs = mock_request.call_args
+    assert args == ("GET", "http://localhost:3000/health")
+    assert kwargs["headers"] == {"Content-Type": "application/json"}
 
-        assert result["success"] is True
 
+def test_http_wait_ready_polls_until_healthy(mock_request):
+    import requests
 
-def test_search_http():
-    with patch("requests.post") as mock_post:
-        mock_post.return_value.status_code = 200
-        mock_post.return_value.json.return_value = {
-            "results": [
-                {"id": 1, "similarity": 0.9, "metadata": {"stored_text": "text"}}
-            ]
-        }
+    healthy = MagicMock(ok=True)
+    mock_request.side_effect = [requests.ConnectionError("refused"), healthy]
 
-        client = HttpClient()
-        client.connected = True
+    with patch("rice_sdk.storage.client_http.time.sleep") as sleep:
+        HttpClient().wait_ready(timeout=5.0)
 
-        results = client.search("query", user_id=1)
+    assert mock_request.call_count == 2
+    sleep.assert_called_once()
 
-        mock_post.assert_called_once()
-        args, kwargs = mock_post.call_args
-        assert args[0] == "http://localhost:3000/v1/search"
 
-        data = kwargs["json"]
-        assert data["query"] == "query"
-        assert data["user_id"] == 1
+def test_http_wait_ready_times_out_without_server():
+    client = HttpClient(host="127.0.0.1", port=1)
+    with pytest.raises(TimeoutError):
+        client.wait_ready(timeout=0.3)
+
+
+def test_insert_http(mock_request):
+    mock_request.return_value.json.return_value = {
+        "success": True,
+        "node_id": 123,
+        "message": "ok",
+    }
+
+    client = HttpClient()
+    client.connected = True
+
+    metadata = {"key": "value"}
+    result = client.insert(123, "text", metadata)
+
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert args == ("POST", "http://localhost:3000/v1/nodes")
+
+    data = kwargs["json"]
+    assert data["id"] == 123
+    assert data["text"] == "text"
+    assert data["metadata"]["key"] == "value"
+
+    assert result["success"] is True
+
+
+def test_search_http(mock_request):
+    mock_request.return_value.json.return_value = {
+        "results": [{"id": 1, "similarity": 0.9, "metadata": {"stored_text": "text"}}]
+    }
+
+    client = HttpClient()
+    client.connected = True
 
-        assert len(results) == 1
-        assert results[0]["data"] == "text"
+    results = client.search("query", user_id=1)
+
+    mock_request.assert_called_once()
+    args, kwargs = mock_request.call_args
+    assert args == ("POST", "http://localhost:3000/v1/search")
+
+    data = kwargs["json"]
+    assert data["query"] == "query"
+    assert data["user_id"] == 1
+
+    assert len(results) == 1
+    assert results[0]["data"] == "text"
+
+
+def test_session_is_reused_with_pool_settings(mock_request):
+    mock_request.return_value.json.return_value = {"status": "ok"}
+
+    client = HttpClient(pool_connections=4, pool_maxsize=32, pool_block=True)
+    client.health()
+    session = client._session
+    client.health()
+
+    assert client._session is session
+    adapter = session.get_adapter("http://localhost:3000")
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert adapter._pool_block is True
+
+    client.disconnect()
+    assert client._session is None
+
+
+def test_headers_are_cached_until_login(mock_request):
+    client = HttpClient(token="old")
+    headers = client._get_headers()
+    assert client._get_headers() is headers
+    assert headers["Authorization"] == "Bearer old"
+
+    mock_request.return_value.json.return_value = {"token": "new"}
+    client.login("admin", "password")
+
+    login_kwargs = mock_request.call_args[1]
+    assert login_kwargs["headers"] is None
+    assert client._get_headers()["Authorization"] == "Bearer new"
+
+
+def test_batch_insert_ndjson(bulk_server):
+    client = HttpClient(host="127.0.0.1", port=bulk_server.server_port)
+    client.connected = True
+
+    items = ({"nodeId": i, "text": f"text {i}"} for i in range(5))
+    result = client.batch_insert(items, user_id=7, chunk_size=2)
+
+    assert result == {
+        "totalInserted": 5,
+        "failed": 0,
+        "errors": [],
+        "nodeIds": [0, 1, 2, 3, 4],
+    }
+    assert [len(r["nodes"]) for r in bulk_server.requests] == [2, 2, 1]
+    first = bulk_server.requests[0]
+    assert first["path"] == "/v1/nodes/batch"
+    assert first["content_type"] == "application/x-ndjson"
+    assert first["chunked"] is True
+    assert first["nodes"][0]["user_id"] == 7
+    assert first["nodes"][0]["metadata"]["stored_text"] == "text 0"
+
+
+def test_batch_insert_json_array_reports_failures(bulk_server):
+    client = HttpClient(host="127.0.0.1", port=bulk_server.server_port)
+    client.connected = True
+
+    items = [
+        {"nodeId": 1, "text": "ok"},
+        {"nodeId": "bad", "text": "ok"},
+        {"nodeId": 2, "text": "reject"},
+        {"nodeId": 3, "text": "ok"},
+    ]
+    result = client.batch_insert(items, chunk_size=2, bulk_format="json")
+
+    assert bulk_server.requests[0]["content_type"] == "application/json"
+    assert result["totalInserted"] == 1
+    assert result["nodeIds"] == [1]
+    assert result["failed"] == 3
+    assert "bad" in result["errors"][0]
+    assert result["errors"][1].startswith("chunk 1 (2 items)")
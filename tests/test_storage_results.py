@@ -0,0 +1,82 @@
+import json
+from unittest.mock import patch
+from rice_sdk.codec import JsonCodec
+from rice_sdk.storage.client_grpc import _search_results
+from rice_sdk.storage.proto import ricedb_pb2
+from rice_sdk.storage.results import SearchResult, SearchResults
+
+
+def _response():
+    return ricedb_pb2.SearchResponse(
+        results=[
+            ricedb_pb2.SearchResult(
+                id=i,
+                similarity=1.0 - i / 10,
+                metadata=json.dumps({"stored_text": f"text {i}", "n": i}).encode(),
+            )
+            for i in range(3)
+        ]
+    )
+
+
+def test_metadata_is_decoded_lazily_once():
+    codec = JsonCodec()
+    with patch.object(codec, "loads", wraps=codec.loads) as loads:
+        results = _search_results(_response(), codec)
+        assert isinstance(results, SearchResults)
+        assert results.ids() == [0, 1, 2]
+        assert results[0].similarity == 1.0
+        assert loads.call_count == 0
+
+        assert results[1].data == "text 1"
+        assert results[1]["metadata"]["n"] == 1
+        assert loads.call_count == 1
+
+
+def test_dict_style_access():
+    result = SearchResult(7, 0.5, json.dumps({"stored_text": "hello"}).encode())
+
+    assert result["id"] == 7
+    assert result["data"] == "hello"
+    assert result.get("missing") is None
+    assert "similarity" in result
+    assert dict(result) == {
+        "id": 7,
+        "similarity": 0.5,
+        "metadata": {"stored_text": "hello"},
+        "data": "hello",
+    }
+    assert result == result.to_dict()
+
+
+def test_invalid_metadata_decodes_to_empty_dict():
+    result = SearchResult(1, 0.1, b"not json")
+    assert result["metadata"] == {}
+    assert result["data"] is None
+
+
+def test_predecoded_metadata():
+    results = SearchResults([SearchResult(1, 0.9, metadata={"stored_text": "x"})])
+    assert results.to_dicts() == [
+        {"id": 1, "similarity": 0.9, "metadata": {"stored_text": "x"}, "data": "x"}
+    ]
+
+
+def test_concurrent_metadata_access():
+    from concurrent.futures import ThreadPoolExecutor
+
+    for _ in range(50):
+        result = SearchResult(1, 0.1, json.dumps({"stored_text": "x"}).encode())
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            data = list(pool.map(lambda _: result.data, range(16)))
+        assert data == ["x"] * 16
+
+
+def test_results_print_and_serialize_as_dicts():
+    results = SearchResults([SearchResult(1, 0.5, b'{"stored_text": "x"}')])
+    expected = [
+        {"id": 1, "similarity": 0.5, "metadata": {"stored_text": "x"}, "data": "x"}
+    ]
+
+    assert repr(results) == repr(expected)
+    assert json.loads(json.dumps(results.to_dicts())) == expected
@@ -1,7 +1,8 @@
 import pytest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from rice_sdk.tools.execute import execute
 from rice_sdk.state.client import StateClient
+from rice_sdk.state.client_async import AsyncStateClient
 
 
 @pytest.mark.asyncio
@@ -19,3 +20,28 @@ async def test_execute_tool():
     # Test setVariable
     await execute("setVariable", {"name": "var", "value": 1}, mock_state_client)
     mock_state_client.set_variable.assert_called_with("var", 1, "explicit")
+
+
+@pytest.mark.asyncio
+async def test_execute_tool_awaits_async_client():
+    mock_state_client = MagicMock(spec=AsyncStateClient)
+    mock_state_client.focus = AsyncMock(return_value="focus-1")
+
+    result = await execute("focus", {"content": "test"}, mock_state_client)
+
+    mock_state_client.focus.assert_awaited_once_with("test")
+    assert result == "focus-1"
+
+
+@pytest.mark.asyncio
+async def test_execute_batched_variable_tools():
+    mock_state_client = MagicMock(spec=StateClient)
+
+    await execute("setVariables", {"variables": {"a": 1, "b": 2}}, mock_state_client)
+    mock_state_client.set_variables.assert_called_with({"a": 1, "b": 2}, "explicit")
+
+    await execute("setVariables", {"variables": '{"a": 1}'}, mock_state_client)
+    mock_state_client.set_variables.assert_called_with({"a": 1}, "explicit")
+
+    await execute("getVariables", {"names": ["a", "b"]}, mock_state_client)
+    mock_state_client.get_variables.assert_called_with(["a", "b"])
@@ -0,0 +1,153 @@
+from concurrent import futures
+from unittest.mock import patch
+import grpc
+import pytest
+from rice_sdk import tracing
+from rice_sdk.retry import NO_RETRY
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.proto import state_pb2, state_pb2_grpc
+from rice_sdk.storage.client_grpc import GrpcClient
+from rice_sdk.storage.client_grpc_async import AsyncGrpcClient
+from rice_sdk.storage.client_http import HttpClient
+from rice_sdk.storage.proto import ricedb_pb2, ricedb_pb2_grpc
+
+pytest.importorskip("opentelemetry.sdk")
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+
+@pytest.fixture
+def spans():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    with patch("rice_sdk.tracing._tracer", lambda: provider.get_tracer("test")):
+        yield exporter
+
+
+class _RiceDB(ricedb_pb2_grpc.RiceDBServicer):
+    def __init__(self):
+        self.metadata = []
+
+    def Health(self, request, context):
+        return ricedb_pb2.HealthResponse(status="ok", version="test")
+
+    def Search(self, request, context):
+        self.metadata.append(dict(context.invocation_metadata()))
+        return ricedb_pb2.SearchResponse(
+            results=[ricedb_pb2.SearchResult(id=1, similarity=0.5)]
+        )
+
+    def Insert(self, request, context):
+        context.abort(grpc.StatusCode.UNAVAILABLE, "down")
+
+
+class _Cortex(state_pb2_grpc.CortexServicer):
+    def Reminisce(self, request, context):
+        return state_pb2.RecallResponse()
+
+
+@pytest.fixture
+def server():
+    servicer = _RiceDB()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    ricedb_pb2_grpc.add_RiceDBServicer_to_server(servicer, server)
+    state_pb2_grpc.add_CortexServicer_to_server(_Cortex(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield servicer, port
+    server.stop(None)
+
+
+def test_grpc_spans_carry_request_attributes(spans, server):
+    servicer, port = server
+    client = GrpcClient("127.0.0.1", port, retry_policy=NO_RETRY)
+    client.connect()
+    client.search("query", k=7, session_id="s1")
+    client.disconnect()
+
+    span = next(s for s in spans.get_finished_spans() if s.name.endswith("Search"))
+    assert span.name == "ricedb.RiceDB/Search"
+    assert span.attributes["rpc.method"] == "Search"
+    assert span.attributes["rice.k"] == 7
+    assert span.attributes["rice.session_id"] == "s1"
+    assert span.attributes["rice.request_bytes"] > 0
+    assert span.attributes["rpc.grpc.status_code"] == 0
+
+    traceparent = servicer.metadata[0]["traceparent"]
+    assert format(span.context.trace_id, "032x") in traceparent
+
+
+def test_grpc_error_status_is_recorded(spans, server):
+    _, port = server
+    client = GrpcClient("127.0.0.1", port, retry_policy=NO_RETRY)
+    client.connect()
+    with pytest.raises(grpc.RpcError):
+        client.insert(1, "text", {})
+    client.disconnect()
+
+    (span,) = [s for s in spans.get_finished_spans() if s.name.endswith("Insert")]
+    assert span.attributes["rpc.grpc.status_code"] == 14
+    assert span.status.status_code == StatusCode.ERROR
+
+
+def test_state_spans_carry_run_id(spans, server):
+    _, port = server
+    client = StateClient(f"127.0.0.1:{port}", run_id="run-1")
+    client.reminisce("query", limit=3)
+    client.close()
+
+    (span,) = spans.get_finished_spans()
+    assert span.name == "slate.Cortex/Reminisce"
+    assert span.attributes["rice.run_id"] == "run-1"
+    assert span.attributes["rice.k"] == 3
+
+
+@pytest.mark.asyncio
+async def test_aio_spans_propagate_context(spans, server):
+    servicer, port = server
+    client = AsyncGrpcClient("127.0.0.1", port)
+    await client.connect()
+    await client.search("query", k=3)
+    await client.disconnect()
+
+    span = next(s for s in spans.get_finished_spans() if s.name.endswith("Search"))
+    assert span.attributes["rice.k"] == 3
+    assert span.attributes["rpc.grpc.status_code"] == 0
+    assert format(span.context.trace_id, "032x") in servicer.metadata[0]["traceparent"]
+
+
+def test_http_spans_inject_headers(spans):
+    with patch("requests.Session.request") as request:
+        resp = request.return_value
+        resp.status_code = 200
+        resp.json.return_value = {"results": []}
+        resp.request.body = b'{"query": "q"}'
+
+        client = HttpClient(token="t")
+        client.connected = True
+        client.search("q", k=4, session_id="s2")
+
+    headers = request.call_args[1]["headers"]
+    assert headers["Authorization"] == "Bearer t"
+    (span,) = spans.get_finished_spans()
+    assert format(span.context.trace_id, "032x") in headers["traceparent"]
+    assert span.attributes["rpc.method"] == "Search"
+    assert span.attributes["rice.k"] == 4
+    assert span.attributes["rice.session_id"] == "s2"
+    assert span.attributes["http.status_code"] == 200
+    assert span.attributes["rice.request_bytes"] == len(b'{"query": "q"}')
+
+
+def test_no_op_without_opentelemetry(monkeypatch):
+    monkeypatch.setattr(tracing, "_available", False)
+    channel = object()
+    assert tracing.intercept_channel(channel) is channel
+    assert tracing.aio_interceptors() == []
+    with tracing.http_span("Search", "POST", "/v1/search", {}, None) as span:
+        assert span.headers is None
+        span.finish(None)
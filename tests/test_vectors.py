@@ -0,0 +1,49 @@
+import array
+import pytest
+from rice_sdk.vectors import set_vector, as_list, to_numpy
+from rice_sdk.storage.client_grpc import _insert_request, _search_request
+from rice_sdk.state.proto import state_pb2
+
+np = pytest.importorskip("numpy")
+
+
+def test_set_vector_from_ndarray():
+    vector = np.linspace(0, 1, 1536, dtype=np.float32)
+    req = _insert_request(1, "text", {}, embedding=vector)
+
+    assert len(req.embedding) == 1536
+    assert np.array_equal(np.array(req.embedding, dtype=np.float32), vector)
+    assert req.text == "text"
+
+
+def test_set_vector_converts_float64_and_buffers():
+    req = _search_request("query", query_embedding=np.array([0.5, 0.25]))
+    assert list(req.queryEmbedding) == [0.5, 0.25]
+
+    trace = state_pb2.Trace(input="in")
+    set_vector(trace, "embedding", array.array("f", [1.0, 2.0]))
+    assert list(trace.embedding) == [1.0, 2.0]
+    assert trace.input == "in"
+
+
+def test_set_vector_accepts_lists_and_none():
+    trace = state_pb2.Trace()
+    set_vector(trace, "embedding", None)
+    assert list(trace.embedding) == []
+    set_vector(trace, "embedding", [0.5, 1.5])
+    assert list(trace.embedding) == [0.5, 1.5]
+
+
+def test_set_vector_rejects_matrices():
+    with pytest.raises(ValueError, match="1-dimensional"):
+        set_vector(state_pb2.Trace(), "embedding", np.zeros((2, 2)))
+
+
+def test_as_list_and_to_numpy():
+    assert as_list(None) == []
+    assert as_list(np.array([1.0, 2.0], dtype=np.float32)) == [1.0, 2.0]
+
+    trace = state_pb2.Trace(embedding=[0.5, 0.25])
+    result = to_numpy(trace.embedding)
+    assert result.dtype == np.float32
+    assert result.tolist() == [0.5, 0.25]
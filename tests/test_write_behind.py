@@ -0,0 +1,218 @@
+import threading
+import time
+from concurrent.futures import Future
+import grpc
+import pytest
+from unittest.mock import patch
+from rice_sdk.metrics import Metrics
+from rice_sdk.state import CommitQueueFull, WriteBehind
+from rice_sdk.state.client import StateClient
+from rice_sdk.state.proto import state_pb2
+
+
+@pytest.fixture
+def mock_grpc_channel():
+    with patch("grpc.insecure_channel") as mock_channel:
+        yield mock_channel
+
+
+@pytest.fixture
+def mock_cortex_stub():
+    with patch("rice_sdk.state.client.state_pb2_grpc.CortexStub") as mock_stub:
+        yield mock_stub.return_value
+
+
+class _Error(grpc.RpcError):
+    def code(self):
+        return grpc.StatusCode.INTERNAL
+
+
+def _acking(stub, gate=None, sent=None):
+    def start(trace, metadata=None, timeout=None):
+        if gate is not None:
+            gate.wait(5)
+        if sent is not None:
+            sent.append(trace.input)
+        future = Future()
+        future.set_result(state_pb2.Ack(success=True))
+        return future
+
+    stub.Commit.future.side_effect = start
+
+
+def test_commit_returns_before_sending(mock_grpc_channel, mock_cortex_stub):
+    sent = []
+    _acking(mock_cortex_stub, sent=sent)
+    client = StateClient(
+        run_id="r", write_behind=WriteBehind(batch_size=100, flush_interval=60)
+    )
+
+    for i in range(5):
+        assert client.commit(f"in-{i}", "out") is True
+    assert sent == []
+    mock_cortex_stub.Commit.assert_not_called()
+
+    client.flush(timeout=5)
+    assert sent == [f"in-{i}" for i in range(5)]
+    assert client.write_behind.stats() == {
+        "pending": 0,
+        "sent": 5,
+        "failed": 0,
+        "dropped": 0,
+    }
+    client.close()
+
+
+def test_full_batch_is_sent_without_flush(mock_grpc_channel, mock_cortex_stub):
+    sent = []
+    _acking(mock_cortex_stub, sent=sent)
+    client = StateClient(write_behind=WriteBehind(batch_size=3, flush_interval=60))
+
+    for i in range(3):
+        client.commit(f"in-{i}", "out")
+    deadline = time.monotonic() + 5
+    while len(sent) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(sent) == 3
+    client.close()
+
+
+def test_interval_sends_partial_batch(mock_grpc_channel, mock_cortex_stub):
+    sent = []
+    _acking(mock_cortex_stub, sent=sent)
+    client = StateClient(write_behind=WriteBehind(batch_size=100, flush_interval=0.02))
+
+    client.commit("in", "out")
+    deadline = time.monotonic() + 5
+    while not sent and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert sent == ["in"]
+    client.close()
+
+
+def test_overflow_policies(mock_grpc_channel, mock_cortex_stub):
+    gate = threading.Event()
+    _acking(mock_cortex_stub, gate=gate)
+
+    def held(**kwargs):
+        # The first commit is taken by the worker, which then waits on `gate`,
+        # so the next two fill the buffer.
+        client = StateClient(
+            write_behind=WriteBehind(
+                max_pending=2, batch_size=1, flush_interval=0, **kwargs
+            )
+        )
+        client.commit("taken", "out")
+        deadline = time.monotonic() + 5
+        while client.write_behind.stats()["pending"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        client.commit("a", "out")
+        client.commit("b", "out")
+        return client
+
+    dropping = held(overflow="drop")
+    assert dropping.commit("c", "out") is False
+    assert dropping.write_behind.stats()["dropped"] == 1
+
+    raising = held(overflow="raise")
+    with pytest.raises(CommitQueueFull):
+        raising.commit("c", "out")
+
+    blocking = held(overflow="block", block_timeout=0.05)
+    with pytest.raises(CommitQueueFull):
+        blocking.commit("c", "out")
+
+    gate.set()
+    for client in (dropping, raising, blocking):
+        client.flush(timeout=5)
+        assert client.write_behind.stats()["sent"] == 3
+        client.close()
+
+
+def test_failures_go_to_on_error(mock_grpc_channel, mock_cortex_stub):
+    def start(trace, metadata=None, timeout=None):
+        future = Future()
+        if trace.input == "rpc":
+            future.set_exception(_Error())
+        else:
+            future.set_result(state_pb2.Ack(success=trace.input == "ok"))
+        return future
+
+    mock_cortex_stub.Commit.future.side_effect = start
+    errors = []
+    metrics = Metrics()
+    client = StateClient(
+        metrics=metrics,
+        write_behind=WriteBehind(on_error=lambda t, e: errors.append((t.input, e))),
+    )
+
+    for name in ("ok", "rpc", "nack"):
+        client.commit(name, "out")
+    client.flush(timeout=5)
+
+    assert [name for name, _ in errors] == ["rpc", "nack"]
+    assert isinstance(errors[0][1], grpc.RpcError)
+    assert str(errors[1][1]) == "Commit was not acknowledged"
+    assert client.write_behind.stats()["failed"] == 2
+    commits = metrics.snapshot()["methods"]["Commit"]
+    assert commits["calls"] == 3
+    assert commits["errors"] == 2
+    client.close()
+
+
+def test_close_drains_and_rejects_new_commits(mock_grpc_channel, mock_cortex_stub):
+    sent = []
+    _acking(mock_cortex_stub, sent=sent)
+    client = StateClient(write_behind=WriteBehind(batch_size=100, flush_interval=60))
+    write_behind = client.write_behind
+
+    client.commit("last", "out")
+    client.close()
+
+    assert sent == ["last"]
+    with pytest.raises(RuntimeError):
+        write_behind.put(state_pb2.Trace())
+
+
+def test_rejects_invalid_settings():
+    with pytest.raises(ValueError):
+        WriteBehind(overflow="spill")
+    with pytest.raises(ValueError):
+        WriteBehind(batch_size=0)
+
+
+def test_client_reconnects_with_the_same_buffer(mock_grpc_channel, mock_cortex_stub):
+    from rice_sdk.client import Client
+
+    sent = []
+    _acking(mock_cortex_stub, sent=sent)
+    write_behind = WriteBehind(batch_size=100, flush_interval=60)
+    with patch("rice_sdk.client.load_config") as load_config:
+        load_config.return_value.storage.enabled = False
+        load_config.return_value.state.enabled = True
+        client = Client(write_behind=write_behind)
+        client.connect()
+        client.state.commit("first", "out")
+        client.close()
+
+        client.connect()
+        client.state.commit("second", "out")
+        client.state.flush(timeout=5)
+        client.close()
+
+    assert sent == ["first", "second"]
+    assert write_behind.stats()["sent"] == 2
+
+
+def test_failed_attach_releases_the_shared_channel(mock_grpc_channel, mock_cortex_stub):
+    from rice_sdk.channel import SharedChannel
+
+    write_behind = WriteBehind()
+    first = StateClient(write_behind=write_behind)
+    shared = SharedChannel("localhost:50051")
+
+    with pytest.raises(RuntimeError, match="already attached"):
+        StateClient(shared_channel=shared, write_behind=write_behind)
+
+    assert shared.refs == 0
+    first.close()